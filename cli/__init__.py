@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+DTAF command line tools.
+
+* ``python -m cli.dtaf_log``: queries the structured logs (see
+  :mod:`DTAF.structured_log`).
+"""
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+DTAF structured log tool.
+
+Filters the records of a structured log (``.dlog``) through its index, and
+rebuilds the byte streams of the interfaces.
+
+Examples::
+
+    python -m cli.dtaf_log run.dlog --duid DUT-1 --since 2024-05-01T10:00 --until 2024-05-01T10:05
+    python -m cli.dtaf_log run.dlog --uid 3 --direction rx --stream rx.bin
+    python -m cli.dtaf_log run.dlog --interface SocketInterface --json
+    python -m cli.dtaf_log run.dlog --reindex
+"""
+import argparse
+import datetime
+import json
+import logging
+import sys
+import typing
+
+from DTAF.structured_log import LogEntry, StructuredLogReader, directions
+
+
+def parse_time(value: str) -> float:
+    """
+    Accepts timestamps or ISO dates.
+    """
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.datetime.fromisoformat(value).timestamp()
+
+
+def parse_arguments(argv: list[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="dtaf_log", description="Queries DTAF structured logs (.dlog).")
+    parser.add_argument("path", help="structured log file.")
+    parser.add_argument("--uid", help="interface (or socket thread) uid.")
+    parser.add_argument("--duid", help="device uid.")
+    parser.add_argument("--interface", help="interface class name.")
+    parser.add_argument("--since", type=parse_time, help="first timestamp or ISO date (inclusive).")
+    parser.add_argument("--until", type=parse_time, help="last timestamp or ISO date (inclusive).")
+    parser.add_argument("--direction", choices=[n for n in directions if n], help="payload direction.")
+    parser.add_argument("--level", default="NOTSET", help="minimum level name, e.g. INFO.")
+    parser.add_argument("--limit", type=int, default=0, help="maximum amount of records shown, 0 for all.")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--json", action="store_true", help="prints the records as JSON lines.")
+    output.add_argument("--stream", metavar="FILE", help="writes the payloads into FILE (`-` for stdout).")
+    output.add_argument("--count", action="store_true", help="prints the amount of matching records.")
+    output.add_argument("--reindex", action="store_true", help="rebuilds the index of the log.")
+    return parser.parse_args(argv)
+
+
+def format_entry(entry: LogEntry) -> str:
+    date: str = datetime.datetime.fromtimestamp(entry.timestamp).isoformat(sep=" ", timespec="microseconds")
+    return (f"{date} {logging.getLevelName(entry.level):<8} {entry.duid}:{entry.uid} {entry.interface_class} "
+            f"{entry.direction or '--'} | {entry.message}")
+
+
+def main(argv: list[str] = None, stdout: typing.TextIO = None) -> int:
+    arguments: argparse.Namespace = parse_arguments(argv)
+    stdout = stdout or sys.stdout
+    with StructuredLogReader(arguments.path) as reader:
+        if arguments.reindex is True:
+            reader.rebuild_index()
+            print(f"{len(reader)} records indexed.", file=stdout)
+            return 0
+        level: int = logging.getLevelName(arguments.level.upper())
+        entries: typing.Iterator[LogEntry] = reader.query(uid=arguments.uid,
+                                                          duid=arguments.duid,
+                                                          interface=arguments.interface,
+                                                          start=arguments.since,
+                                                          end=arguments.until,
+                                                          direction=arguments.direction,
+                                                          level=level if isinstance(level, int) else 0)
+        if arguments.stream:
+            data: bytes = b"".join(entry.payload for entry in entries)
+            if arguments.stream == "-":
+                stdout.flush()
+                getattr(stdout, "buffer", sys.stdout.buffer).write(data)
+            else:
+                with open(arguments.stream, "wb") as file:
+                    file.write(data)
+            return 0
+        count: int = 0
+        for entry in entries:
+            count += 1
+            if arguments.count is False:
+                print(json.dumps(entry.to_dict()) if arguments.json else format_entry(entry), file=stdout)
+            if count == arguments.limit:
+                break
+        if arguments.count is True:
+            print(count, file=stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
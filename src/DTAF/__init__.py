@@ -4,12 +4,67 @@ __version__: str = "2023.05.19"
 # SET GLOBAL VARIABLES FROM ENVIRONMENT AND ARGS.
 import os
 import platform
+import threading
+import time
+
+_import_start: float = time.perf_counter()
 
 SPHINX_DOC_MODE = os.environ.get("SPHINX_DOC_MODE", "0") in (1, "1")
 cache = platform.uname()
 PLATFORM = cache.system
 HOST_NODE = cache.node
 VERSION = cache.version
+
+# times the imports below if DTAF_PROFILE_STARTUP is set.
+from DTAF import startup
+
+startup.install()
+
 import DTAF.devices
 import DTAF.interfaces
 import DTAF.factory
+
+initialized: bool = False
+"""
+True once :func:`init` finished.
+"""
+
+_init_lock: threading.RLock = threading.RLock()
+_init_thread: int = None
+
+
+def init(force: bool = False) -> None:
+    """
+    Initializes the side effects deferred by the import:
+
+    * saves the configuration file if new sections or entries were added.
+    * creates the factory working folder.
+    * opens the startup log and the file handlers of the default loggers.
+    * starts the asynchronous log writer, if configured.
+
+    Importing DTAF doesn't touch the disk, so CLI tools and worker processes
+    start fast. The first record emitted by a default logger calls this
+    function, call it explicitly to initialize at a known point. It runs only
+    once (unless ``force`` is True) and it's thread safe.
+    """
+    global initialized, _init_thread
+    with _init_lock:
+        # called again while initializing, e.g. by a log record.
+        if _init_thread == threading.get_ident() or (initialized is True and force is False):
+            return
+        _init_thread = threading.get_ident()
+        try:
+            with startup.timer("DTAF.init"):
+                with startup.timer("config"):
+                    DTAF.config.save_globals()
+                with startup.timer("factory"):
+                    DTAF.factory.init()
+                with startup.timer("logger"):
+                    DTAF.logger.init_logging()
+            initialized = True
+        finally:
+            _init_thread = None
+    startup.finish()
+
+
+startup.record("DTAF", _import_start)
@@ -2,6 +2,7 @@
 from DTAF.config.manager import ConfigManager
 import platform
 import pathlib
+import copy
 
 Config: ConfigManager = None
 """
@@ -13,6 +14,11 @@ the file parsed down.
 
 HOMEDIR: pathlib.Path = None
 
+_saved_data: dict = None
+"""
+Contents of the configuration file, as loaded or last saved.
+"""
+
 
 def load_essential() -> None:
     """
@@ -49,15 +55,34 @@ def load_globals() -> None:
     """
     Static Method to load all globals in memory.
     """
-    global Config, HOMEDIR
+    global Config, HOMEDIR, _saved_data
     HOMEDIR = get_user_space()
     _config_path = HOMEDIR / "config.toml"
     Config = ConfigManager(filename=_config_path)
-    Config.dump(_config_path)
+    # the file is written by save_globals, see DTAF.init.
+    _saved_data = copy.deepcopy(Config.dumps())
     pass
 
 
+def save_globals(force: bool = False) -> bool:
+    """
+    Writes the configuration file if the contents in memory changed since it
+    was loaded (e.g. a new section or entry with its default value), or if
+    ``force`` is True.
+
+    Returns True if the file was written.
+    """
+    global _saved_data
+    data: dict = Config.dumps()
+    if force is False and data == _saved_data:
+        return False
+    Config.dump(Config.filename)
+    _saved_data = copy.deepcopy(data)
+    return True
+
+
 load_globals()
 
 # Cargamos Configuraciones del logger.
 import DTAF.config.logger_config
+import DTAF.config.builder_config
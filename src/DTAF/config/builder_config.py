@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# Configurations accepted by the builder module.
+
+# do not import the builder module here.
+
+from DTAF.config import Config
+
+G_Section_name: str = "Builder"
+initial_data: dict = {
+    "model_cache": True,  # keeps the parsed and validated models, reloaded while the file doesn't change.
+    "model_cache_dir": "",  # folder of the model cache, HOMEDIR/model_cache if empty.
+    "maintenance_interval": 0,  # seconds between the background registry checks, 0 doesn't start them.
+    "maintenance_batch_size": 100,  # registry entries cleaned and verified by each check.
+    "gc_interval": 0,  # seconds between the scheduled garbage collections, 0 disables them.
+    "gc_generation": 1,  # oldest generation collected by the scheduled garbage collections.
+    "gc_thresholds": [],  # gc.set_threshold values while the maintenance runs, empty keeps the current ones.
+}
+
+# makes sure the configuration has a Builder section.
+if G_Section_name not in Config.sections:
+    Config.add_section(G_Section_name, initial_data)
+
+# adds the entries missing from older configuration files.
+for entry in initial_data:
+    if entry not in Config.Builder.entries:
+        Config.Builder.add_entry(entry, initial_data[entry])
+
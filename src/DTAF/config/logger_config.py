@@ -114,9 +114,19 @@ initial_data: dict = {
     "default_log_level": "INFO",  # Deffault LogLevel
     "default_format": 3,
     "default_filename": "{name} - {std_date} - {id}.log",
-    "max_files": 100,
+    "max_files": 100,  # rotated segments kept per logger, 0 keeps all of them.
+    "retention_days": 0,  # days the rotated segments are kept, 0 keeps them forever.
+    "rotation_max_bytes": 0,  # size of each log segment, 0 disables the size rotation.
+    "rotation_interval": 0,  # seconds covered by each log segment, 0 disables the time rotation.
+    "rotation_compression": "gzip",  # compression of the rotated segments: gzip, bz2, lzma or "" for none.
     "log_dir": "~/TAF/logs/global/",
     "enable_log_files": True,
+    "payload_log_limit": 64,  # bytes of each payload shown in the hot path log records.
+    "hot_path_disabled": [],  # modules whose hot path logging is compiled out, "*" for all.
+    "structured_log": False,  # also writes a binary structured log (.dlog) per logger.
+    "async_handlers": False,  # writes the logs from a single background thread.
+    "async_queue_size": 10000,  # records held by the async queue, new records are dropped when full.
+    "async_batch_size": 256,  # records written between flushes by the async writer.
     # indica el indice de los maps de formato establecidos arriba
     "logger_config": {  # dict, store each logger level, if no present here, deffault level will be used.
         "DTAF_System": {
@@ -295,4 +305,3 @@ if (_validate_logger_path(Config.Logger.log_dir, is_dir=True, exists=False, make
 if Config.Logger.default_log_level not in _level_map:
     raise ValueError(g_error_msg[3].format(level=logging.INFO, levels=_level_map))
 
-Config.dump(Config.filename)
@@ -5,6 +5,9 @@ from weakref import proxy
 from copy import copy, deepcopy
 import toml
 import traceback
+import logging
+
+Logger = logging.getLogger("Config")
 
 G_error_messages: list[str] = [
     "<ERROR REPORT> --- --- ---\nERROR:\t{error}\nTYPE:\t{error_type}\nTRACEBACK:\n{tb}\n</END>"  # 0
@@ -391,8 +394,7 @@ class ConfigManager:
 
         # load each section in memory.
         for section in data:
-            # TODO: Add logger trace here
-            print(f"TRACE: Adding new section {section}")
+            Logger.debug("ConfigManager: loads :: Adding new section %s", section)
             check = self.add_section(section_name=section, initial_data=data[section])
             if check is False:
                 raise ValueError(G_error_messages[3].format(initial_data=f"section[{section}]:{data[section]}"))
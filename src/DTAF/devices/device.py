@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import weakref
 import copy
+import types
 import typing
 
 from DTAF.interfaces.interfaces import InterfaceBase
@@ -8,9 +9,11 @@ from DTAF.interfaces.interfaces import InterfaceBase
 #TODO: remove this section and replace with internal logger.
 import logging
 
-from DTAF.logger import DeviceLogger as Logger, SystemLogger
+from DTAF.logger import DeviceLogger as Logger, SystemLogger, hot_path_logger
 # Logger = logging.getLogger("DeviceLogger")
 
+_hot = hot_path_logger(__name__, Logger, SystemLogger)
+
 # </END>
 
 g_error_msg: tuple[str] = (
@@ -95,18 +98,50 @@ class DeviceBase():
         else:
             raise ValueError(g_error_msg[3].format(uid=self.__uid, new=uid))
 
-    __store: dict = {}
+    __store: dict = None
+    """
+    Memory Storage area of the instance (created by :meth:`__new__`).
+
+    Keeps the interfaces and the non standard attributes by name.
+    """
+
+    __fields: frozenset[str] = frozenset()
+    """
+    Names declared by the class (attributes, properties and methods), cached
+    per class, see :meth:`refresh_fields`.
+    """
 
     logger: logging.Logger = None
 
     @property
-    def store(self):
+    def store(self) -> types.MappingProxyType:
         """
         internal storage of the class.
 
-        This property will only return a shallow copy.
+        This property returns a read only view, the values are the live ones;
+        use ``copy.deepcopy(device.store)`` to keep a snapshot.
         """
-        return copy.deepcopy(self.__store)
+        return types.MappingProxyType(self.__store)
+
+    def __new__(cls, *args, **kwargs):
+        instance = super().__new__(cls)
+        instance.__store = {"interfaces": {}}
+        return instance
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.refresh_fields()
+
+    @classmethod
+    def refresh_fields(cls) -> frozenset[str]:
+        """
+        Caches the names declared by the class.
+
+        Called when the class is created, call it again after adding class
+        attributes at runtime (the subclasses keep their own cache).
+        """
+        cls.__fields = frozenset(dir(cls))
+        return cls.__fields
 
     def __init__(self, **kwargs) -> None:
         # stores values in
@@ -129,7 +164,7 @@ class DeviceBase():
         for key in kwargs:
             if key in ['interfaces', "duid", "uid"]:
                 continue
-            elif key in dir(self):
+            elif key in self.__fields:
                 setattr(self, key, kwargs[key])
             self.__store[key] = kwargs[key]
 
@@ -145,6 +180,7 @@ class DeviceBase():
         if name in self.__store["interfaces"]:
             raise NameError(g_error_msg[0].format(name=name))
         self.__store["interfaces"][name] = interface_reference
+        self._bind_interface(name, interface_reference)
         return True
 
     def remove_interface(self, name: str, interface_reference: weakref.ref = None) -> bool:
@@ -156,16 +192,28 @@ class DeviceBase():
         self.logger.debug(g_debug_msg[2].format(interface_name=name, reference=interface_reference))
         if name in self.__store["interfaces"]:
             del self.__store["interfaces"][name]
+            self._unbind_interface(name)
             return True
         return False
 
+    def _bind_interface(self, name: str, interface_reference: weakref.ref) -> None:
+        # the interface becomes an instance attribute, so `device.SERIAL_0` doesn't go through __getattr__.
+        # declared names keep their value, the interface is still found in the store.
+        if name not in self.__fields:
+            self.__dict__[name] = interface_reference
+
+    def _unbind_interface(self, name: str) -> None:
+        if name not in self.__fields:
+            self.__dict__.pop(name, None)
+
     def get_interfaces(self) -> list[str]:
         """
         Returns a list of interface names.
 
         returns: list[str]
         """
-        self.logger.debug(g_debug_msg[3])
+        if _hot.debug:
+            self.logger.debug(g_debug_msg[3])
         return list(self.__store["interfaces"].keys())
 
     @property
@@ -173,7 +221,8 @@ class DeviceBase():
         return self.get_interfaces()
 
     def __getattr__(self, name: str):
-        self.logger.debug(g_debug_msg[0].format(name=name))
+        if _hot.debug:
+            self.logger.debug(g_debug_msg[0].format(name=name))
         # Returns the interface from __store[interfaces].
         if name in self.__store["interfaces"]:
             return self.__store["interfaces"][name]
@@ -185,7 +234,7 @@ class DeviceBase():
 
     def __setattr__(self, attr: str, value: typing.Any):
         # if attribute is not in the list of registered attributes
-        if attr not in dir(self):
+        if attr not in self.__fields:
             # We store the new attribute inside
             if attr not in self.__store:
                 # print(f"missing attr:{attr}, value: 'value'")
@@ -195,4 +244,9 @@ class DeviceBase():
         super().__setattr__(attr, value)
 
     def clean_store(self, *dt):
+        for name in self.__store["interfaces"]:
+            self._unbind_interface(name)
         self.__store = copy.deepcopy(g_store_pattern)
+
+
+DeviceBase.refresh_fields()
@@ -18,12 +18,19 @@ Logger = logging.getLogger("Factory")
 
 # Default working dir: ~/TAF/DTAF/General
 G_user_dir: pathlib.Path = pathlib.Path("~/TAF/DTAF/99-General").expanduser()
-# Tries to access default working dir
-if G_user_dir.exists() is False:
-    try:
-        G_user_dir.mkdir(parents=True)
-    except Exception:
-        Logger.exception("Unable to create/access User resources path: {}".format(G_user_dir))
+
+
+def init() -> None:
+    """
+    Creates the default working dir, called by :func:`DTAF.init`.
+    """
+    if G_user_dir.exists() is False:
+        try:
+            G_user_dir.mkdir(parents=True)
+        except Exception:
+            Logger.exception("Unable to create/access User resources path: {}".format(G_user_dir))
+
+
 # Get config section for factory discovery.
 
 g_warning_msg: tuple[str] = (
@@ -45,6 +52,8 @@ g_error_msg: tuple[str] = (
     "Factory: Invalid Class Type, the class is not related to DTAF's Base Classes. Class-type: {type_}, Class:{cls}.",  # 7
     "Factory: Unregistered class. class provided couldn't be found in registry. cls: {cls}.",  # 8
     "Factory: Invalid Class Type, This class doesn't share root with DTAF's Base classes. name: {name}, Class:{cls}.",  # 9
+    "Factory: Unable to load `{name}` from `{path}`. ERROR: {type_}: {error}",  # 10
+    "Factory: Invalid class path `{path}`, use `package.module.ClassName` or `package.module:ClassName`.",  # 11
     "Factory: ",  # x
 )
 """
@@ -68,7 +77,28 @@ class _Factory:
     Here we store all the information in memory.
     """
 
-    def class_finder(self, class_str: str, class_name: str):
+    __paths: dict[str, str] = {}
+    """
+    Dotted paths of the registered classes that aren't imported yet.
+
+    They're imported (and moved to the storage area) the first time they're
+    requested, see :meth:`register`.
+    """
+
+    @staticmethod
+    def split_path(class_str: str) -> tuple[str, str]:
+        """
+        Splits a class path in its module and class name.
+
+        Both ``package.module.ClassName`` and ``package.module:ClassName`` are
+        accepted.
+        """
+        module_name, separator, class_name = class_str.rpartition(":" if ":" in class_str else ".")
+        if not module_name or not class_name:
+            raise ValueError(g_error_msg[11].format(path=class_str))
+        return module_name, class_name
+
+    def class_finder(self, class_str: str, class_name: str = None):
         """
         this method will allow you to load new classes by using their import
         method rather than to import the lib before calling the method.
@@ -77,40 +107,24 @@ class _Factory:
         in the global __import__ scope, so the factory can load them later on
         and avoid cycling importation.
 
-        This method is experimental.
-
         usage:
         factory_instance.register("name", "path.of.the.module.name")
 
-        This will then use class finder to find the name of the object inside
-        the module, first by trying to import the whole name using import lib
-        and then requesting the name as an attribute.
-
-        we will load the module name into the global __import__ scope and use
-        the whole name to refer to the object in memory.
+        The module is imported with importlib and the class is then requested
+        as an attribute. If `class_name` is not given, it's the last part of
+        `class_str` (see :meth:`split_path`).
 
-        which means, we would use "path.of.the.module.name" instead of just the
-        name of the object.
+        Raises ImportError if the module can't be imported (e.g. a missing
+        backend library) or the object is not a DTAF class.
         """
         _object: InterfaceBase | DeviceBase = None
-        lib = None
-        try:
-            lib = importlib.import_module(class_str)
-        except ModuleNotFoundError as error:
-            Logger.exception(f"Factory: couldn't find the module {class_str}", error)
-            try:
-                _class_str = ".".join(class_str.split(".")[:-1])
-                if _class_str:
-                    lib = self.class_finder(_class_str)
-                else:
-                    raise ModuleNotFoundError("Factory: No parent module found")
-            except ModuleNotFoundError as error:
-                Logger.exception(f"Factory: couldn't find parent from the module path given: {_class_str}", error)
-                raise
+        if class_name is None:
+            class_str, class_name = self.split_path(class_str)
+        lib = importlib.import_module(class_str)
         # here we could load the module in memory.
         if hasattr(lib, class_name):
             _object = getattr(lib, class_name)
-            if issubclass(_object, (DeviceBase, InterfaceBase)) is False:
+            if isinstance(_object, type) is False or issubclass(_object, (DeviceBase, InterfaceBase)) is False:
                 raise ImportError(f"Factory: Object {class_name}:{_object} from {class_str} "
                                   "is neither a [`DeviceBase` or `InterfaceBase`] subclass.")
         else:
@@ -118,20 +132,46 @@ class _Factory:
                               f"doens't have any attribute nor Object named `{class_name}`")
         return _object
 
+    def _resolve(self, name: str) -> object:
+        # imports a lazy registry, once.
+        with self.__store_lock:
+            if name in self.__store:
+                return self.__store[name]
+            path: str = self.__paths[name]
+            try:
+                cls: object = self.class_finder(path)
+            except Exception as error:
+                raise ImportError(g_error_msg[10].format(name=name, path=path, type_=type(error).__name__,
+                                                         error=error)) from error
+            self.__store[name] = cls
+            del self.__paths[name]
+            Logger.debug(f"Factory: loaded {name} from {path}")
+            return cls
+
     @property
     def classnames(self, ) -> list[str]:
         """
         List of all registered class names.
 
-        Returns a list of valid class names as strings.
+        Returns a list of valid class names as strings, including the lazy
+        registries that aren't imported yet.
         """
-        return list(self.__store.keys())
+        return list(self.__store.keys()) + list(self.__paths.keys())
 
-    __store_lock: threading.Lock = threading.Lock()
+    def is_loaded(self, name: str) -> bool:
+        """
+        Returns True if the class registered as `name` is already imported.
+        """
+        if name not in self.__store and name not in self.__paths:
+            raise NameError(g_error_msg[3].format(name=name))
+        return name in self.__store
+
+    __store_lock: threading.RLock = threading.RLock()
     """
     Storage Block.
 
-    This lock will allow us to make thread safe transactions.
+    This lock will allow us to make thread safe transactions. It's reentrant
+    since importing a lazy registry may register other classes.
     """
 
     _flag_instance: bool = False
@@ -142,23 +182,34 @@ class _Factory:
             raise RuntimeError(g_error_msg[4])
         _Factory._flag_instance = True
 
-    def register(self, name: str, cls: object) -> bool:
+    def register(self, name: str, cls: object | str) -> bool:
         """
         Registers a new namespace in memory from the classes given.
 
+        `cls` may also be the dotted path of the class (e.g.
+        ``"DTAF.interfaces.base.serial_interface.SerialInterface"``), then
+        nothing is imported until the class is requested for the first time
+        (:meth:`get_class_by_name`), so unused backends never load their
+        libraries.
+
         :param str name: Name of the object to register as key.
-        :param object cls: Class definition of the Object.
+        :param object cls: Class definition of the Object, or its dotted path.
         """
         with self.__store_lock:
             # checks the name is already in use.
-            if name in self.__store:
-                raise ValueError(g_error_msg[0].format(name=name, cls=cls, original=self.__store.get(name, None)))
-            # Verifies that it's a valid object
-            # TODO: Add verification process here.
+            if name in self.__store or name in self.__paths:
+                raise ValueError(
+                    g_error_msg[0].format(name=name,
+                                          cls=cls,
+                                          original=self.__store.get(name, self.__paths.get(name, None))))
             if isinstance(cls, str):
-                result = self.class_finder(name, cls)
-            else:
-                result = self.verify_class(cls)
+                # only the syntax is verified, the class is checked once imported.
+                self.split_path(cls)
+                self.__paths[name] = cls
+                Logger.info(f"Factory: bound {name} to {cls} (lazy)")
+                return True
+            # Verifies that it's a valid object
+            result = self.verify_class(cls)
             if result is False:
                 raise RuntimeError(g_error_msg[5])
             # registers the name in memory.
@@ -182,6 +233,9 @@ class _Factory:
             if name in self.__store:
                 del self.__store[name]
                 return True
+            if name in self.__paths:
+                del self.__paths[name]
+                return True
             raise NameError(g_error_msg[3].format(name=name))
         return False
 
@@ -200,10 +254,12 @@ class _Factory:
         """
         if issubclass(cls, (DeviceBase, InterfaceBase)):
             raise RuntimeError(g_error_msg[9].format(name=name, cls=cls))
-        if name not in self.__store:
+        if name not in self.__store and name not in self.__paths:
             raise RuntimeError(g_error_msg[1].format(name=name, cls=cls))
         Logger.warning(g_warning_msg[0].format(name=name, cls=cls))
-        self.__store[name] = cls
+        with self.__store_lock:
+            self.__paths.pop(name, None)
+            self.__store[name] = cls
 
     def verify_class(self, cls: object) -> bool:
         """
@@ -224,6 +280,8 @@ class _Factory:
     def __getattr__(self, name: str):
         if name in self.__store:
             return self.__store[name]
+        if name in self.__paths:
+            return self._resolve(name)
         raise AttributeError(g_error_msg[6].format(name=name))
 
     def get_class_by_name(self, name: str, *args) -> object:
@@ -232,9 +290,14 @@ class _Factory:
 
         Raises ValueError if name is not in registry.
         Unless a third argument has been provided, in which case, this will be returned as default value.
+
+        Lazy registries are imported here, raises ImportError if their
+        backend can't be loaded.
         """
         if name in self.__store:
             return self.__store[name]
+        if name in self.__paths:
+            return self._resolve(name)
         if len(args) > 0:
             return args[0]
         raise ValueError(g_error_msg[3].format(name=name))
@@ -251,9 +314,13 @@ class _Factory:
         for key in self.__store:
             if self.__store[key] == cls:
                 return key
+        # lazy registries are compared by path, they're not imported.
+        for key, path in self.__paths.items():
+            if self.split_path(path) == (getattr(cls, "__module__", None), getattr(cls, "__qualname__", None)):
+                return key
         if len(args) > 0:
             return args[0]
-        raise ValueError(g_error_msg.format(cls=cls))
+        raise ValueError(g_error_msg[8].format(cls=cls))
 
 
 # Creates the main instance of a Factory.
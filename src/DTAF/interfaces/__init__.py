@@ -21,28 +21,20 @@ try:
     Factory.register("Device", DeviceBase)
     Factory.register("Interface", InterfaceBase)
 
-    # Registers all interfaces.
-    from DTAF.interfaces.base import (
-        CANInterface,
-        EthernetInterface,
-        I2CInterface,
-        SerialInterface,
-        SPIInterface,
-        SSHInterface,
-        TelnetInterface,
-        BluetoothInterface,
-    )
-
-    #Logger.info("Factory: Adding Specific interface Classes to registry.")
-    Factory.register("CANInterface", CANInterface)
-    Factory.register("EthernetInterface", EthernetInterface)
-    Factory.register("I2CInterface", I2CInterface)
-    Factory.register("SerialInterface", SerialInterface)
-    Factory.register("SPIInterface", SPIInterface)
-    Factory.register("SSHInterface", SSHInterface)
-    Factory.register("TelnetInterface", TelnetInterface)
-    Factory.register("BluetoothInterface", BluetoothInterface)
+    # Registers all interfaces by the path of their defining module (so
+    # Factory.get_name_by_class matches them unloaded), their backends are
+    # imported by the Factory the first time each class is requested.
+    from DTAF.interfaces import base
+    for class_name in base.__all__:
+        Factory.register(class_name, f"{base._modules.get(class_name, base.__name__)}:{class_name}")
     Logger.info("Factory: Loaded all interfaces.")
 
 except ValueError as error:
     pass
+
+
+def __getattr__(name: str):
+    # the interface classes are imported on first use, see DTAF.interfaces.base.
+    if name in base.__all__:
+        return getattr(base, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,59 +14,48 @@ from DTAF import interfaces
 from DTAF.interfaces import interfaces
 from DTAF.interfaces.interfaces import InterfaceBase
 
-system_name = platform.uname().system
-__all = []
-
-# imports and includes the value to __all__
-from DTAF.interfaces.base.can_interface import CANInterface
-
-__all.append("CANInterface")
+import importlib
 
-# imports and includes the value to __all__
-from DTAF.interfaces.base.ethernet_interface import EthernetInterface
+system_name = platform.uname().system
 
-__all.append("EthernetInterface")
+# Each interface lives in its own module, imported the first time the class
+# is requested (e.g. ``from DTAF.interfaces.base import SerialInterface``), so
+# the backend libraries (can, serial, smbus, spidev, paramiko, telnetlib,
+# bluetooth) are only loaded by the tests that use them.
+_modules: dict[str, str] = {
+    "CANInterface": "DTAF.interfaces.base.can_interface",
+    "EthernetInterface": "DTAF.interfaces.base.ethernet_interface",
+    "I2CInterface": "DTAF.interfaces.base.i2c_interface",
+    "SerialInterface": "DTAF.interfaces.base.serial_interface",
+    "SPIInterface": "DTAF.interfaces.base.spi_interface",
+    "SSHInterface": "DTAF.interfaces.base.ssh_interface",
+    "TelnetInterface": "DTAF.interfaces.base.telnet_interface",
+    "BluetoothInterface": "DTAF.interfaces.base.bluetooth_interface",
+}
 
-# imports and includes the value to __all__
 # Only for linux.
-if system_name == "Linux":
-    from DTAF.interfaces.base.i2c_interface import I2CInterface
-    __all.append("I2CInterface")
-else:
+if system_name != "Linux":
+    del _modules["I2CInterface"]
+    del _modules["SPIInterface"]
 
     class I2CInterface(InterfaceBase):
         pass
 
-
-# imports and includes the value to __all__
-from DTAF.interfaces.base.serial_interface import SerialInterface
-
-__all.append("SerialInterface")
-
-# imports and includes the value to __all__
-if system_name == "Linux":
-    from DTAF.interfaces.base.spi_interface import SPIInterface
-else:
-
     class SPIInterface(InterfaceBase):
         pass
 
 
-__all.append("SPIInterface")
-
-# imports and includes the value to __all__
-from DTAF.interfaces.base.ssh_interface import SSHInterface
-
-__all.append("SSHInterface")
-
-# imports and includes the value to __all__
-from DTAF.interfaces.base.telnet_interface import TelnetInterface
+def __getattr__(name: str):
+    if name in _modules:
+        cls = getattr(importlib.import_module(_modules[name]), name)
+        globals()[name] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all.append("TelnetInterface")
 
-# imports and includes the value to __all__
-from DTAF.interfaces.base.bluetooth_interface import BluetoothInterface
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-__all.append("BluetoothInterface")
 
-__all__ = tuple(__all)
+__all__ = ("CANInterface", "EthernetInterface", "I2CInterface", "SerialInterface", "SPIInterface", "SSHInterface",
+           "TelnetInterface", "BluetoothInterface")
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import typing
 import serial
 from DTAF.interfaces.interfaces import InterfaceBase
 
@@ -11,6 +12,21 @@ class SerialException(Exception):
 class SerialInterface(InterfaceBase):
     """Class to establish a serial connection
         with a device via COM interface.
+
+    Devices that stream data continuously can be read by a background thread
+    (see :meth:`start_reader`), then :meth:`read`, :meth:`read_line` and
+    :meth:`read_until` take the data already received instead of the port.
+    """
+
+    streaming: bool = False
+    """
+    Model flag, set True to start the background reader on connect.
+    """
+
+    reader = None
+    """
+    Background reader (:class:`DTAF.interfaces.base.serial_reader.SerialReader`)
+    while streaming, None otherwise.
     """
 
     def __init__(
@@ -50,6 +66,16 @@ class SerialInterface(InterfaceBase):
         self.baudrate = kwargs["baudrate"]
         self.timeout = kwargs["timeout"]
         self.serial = None
+        self.reader = None
+
+    def reconfigure(self, **changes) -> bool:
+        """
+        Applies model changes, the timeout is also set on the open port.
+        """
+        applied: bool = super().reconfigure(**changes)
+        if applied is True and "timeout" in changes and self.is_connected():
+            self.serial.timeout = self.timeout
+        return applied
 
     def connect_impl(self) -> None:
         """
@@ -68,6 +94,80 @@ class SerialInterface(InterfaceBase):
         except serial.SerialException as e:
             self.serial = None
             raise SerialException(f"Could not connect to {self.port}: {str(e)}")
+        if self.streaming is True:
+            self.start_reader()
+
+    def start_reader(self,
+                     framing: str = "delimiter",
+                     callback: typing.Callable = None,
+                     buffer_size: int = 1 << 20,
+                     queue_size: int = 10000,
+                     **framing_options):
+        """
+        Starts reading the port in a background thread.
+
+        Args:
+            framing: ``"delimiter"`` (lines by default) or ``"length"``, see
+                :mod:`DTAF.server.framing`; ``framing_options`` are given to
+                the framing buffer (e.g. ``delimiter=b"\\r\\n"``).
+            callback: Called with each new frame (:class:`SerialFrame`), from
+                the reader thread.
+            buffer_size: Capacity in bytes of the raw stream ring buffer.
+            queue_size: Maximum amount of unread frames, the oldest are
+                dropped.
+
+        Raises:
+            SerialException: If the port is not connected.
+
+        Returns:
+            The running reader.
+        """
+        if not self.is_connected():
+            raise SerialException(f"Cannot read from {self.port}, not connected.")
+        if self.reader is not None and self.reader.running:
+            if callback is not None:
+                self.reader.add_callback(callback)
+            return self.reader
+        # the reader and the framing buffers are only loaded when streaming.
+        from DTAF.interfaces.base.serial_reader import SerialReader
+        self.reader = SerialReader(self.serial,
+                                   framing=framing,
+                                   buffer_size=buffer_size,
+                                   queue_size=queue_size,
+                                   name=f"DTAF-SerialReader-{self.port}",
+                                   logger=self.logger,
+                                   **framing_options)
+        if callback is not None:
+            self.reader.add_callback(callback)
+        self.reader.start()
+        return self.reader
+
+    def stop_reader(self, timeout: float | int | None = None):
+        """
+        Stops the background reader, the reads go to the port again.
+
+        Returns:
+            The stopped reader (its unread data can still be taken) or None.
+        """
+        reader = self.reader
+        self.reader = None
+        if reader is not None:
+            reader.stop(timeout if timeout is not None else self.timeout + 1)
+        return reader
+
+    def frames(self, timeout: float | int | None = None) -> typing.Iterator:
+        """
+        Yields the frames received by the background reader, with their
+        timestamps (see :meth:`SerialReader.frames`).
+
+        Raises:
+            SerialException: If the reader is not running.
+        """
+        if self.reader is None:
+            raise SerialException(f"Cannot stream from {self.port}, the reader is not running.")
+        reader = self.reader
+        yield from reader.frames(timeout)
+        self._check_reader(reader, None)
 
     def disconnect_impl(self) -> None:
         """
@@ -78,6 +178,7 @@ class SerialInterface(InterfaceBase):
         """
         try:
             if self.is_connected():
+                self.stop_reader()
                 self.serial.close()
                 self.serial = None
             else:
@@ -121,6 +222,8 @@ class SerialInterface(InterfaceBase):
         """
         if not self.is_connected():
             raise SerialException(f"Cannot read from {self.port}, not connected.")
+        if self.reader is not None:
+            return self._check_reader(self.reader, self.reader.buffer.read(num_bytes, timeout=self.timeout))
         try:
             return self.serial.read(size=num_bytes)
         except serial.SerialException as e:
@@ -139,6 +242,9 @@ class SerialInterface(InterfaceBase):
         """
         if not self.is_connected():
             raise SerialException(f"Cannot read from {self.port}, not connected.")
+        if self.reader is not None:
+            frame = self._check_reader(self.reader, self.reader.read_frame(timeout=self.timeout))
+            return frame.data.strip() if frame is not None else b""
         try:
             return self.serial.readline().strip()
         except serial.SerialException as e:
@@ -155,11 +261,20 @@ class SerialInterface(InterfaceBase):
         Returns:
             Data read from the Serial server.
         """
+        if self.reader is not None:
+            return self._check_reader(
+                self.reader, self.reader.buffer.read_until(expected=match, size=num_bytes, timeout=self.timeout))
         try:
             return self.serial.read_until(expected=match, size=num_bytes)
         except EOFError as error:
             raise
 
+    def _check_reader(self, reader, data):
+        # the data received before the error is still returned, the error is raised once the source is empty.
+        if not data and reader.error is not None:
+            raise SerialException(f"Error reading data from {self.port}: {reader.error}") from reader.error
+        return data
+
     def is_connected(self) -> bool:
         """
         Returns whether or not the serial connection is currently open.
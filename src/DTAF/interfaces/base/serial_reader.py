@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+"""
+Serial Reader Module
+====================
+
+Background reader for devices that stream data continuously (sensors, debug
+consoles), used by :meth:`SerialInterface.start_reader
+<DTAF.interfaces.base.serial_interface.SerialInterface.start_reader>`.
+
+A thread pulls every waiting byte of the port in a single ``read`` call, so
+nothing is lost while the test is busy and the throughput isn't limited by
+the per call overhead. The incoming bytes are kept in a :class:`RingBuffer`,
+read by :meth:`SerialInterface.read` and :meth:`SerialInterface.read_until`
+while streaming. When it's full the oldest bytes are overwritten (see
+:attr:`RingBuffer.overwritten`).
+
+The stream is also split incrementally into lines or frames by a
+:mod:`DTAF.server.framing` buffer, each one stored as a :class:`SerialFrame`
+with the time it was received and its position in the stream. The ring buffer
+is the only source of truth: taking a frame (:meth:`SerialReader.frames`,
+:meth:`SerialInterface.read_line`) consumes its bytes from the buffer, and the
+frames whose bytes were already read from the buffer are skipped, so mixing
+both kinds of reads never returns the same data twice. The callbacks are
+notified of every frame, they don't consume anything::
+
+    reader = interface.start_reader(callback=lambda frame: print(frame.timestamp, frame.data))
+    for frame in reader.frames(timeout=5):
+        if frame.data.startswith(b"TEMP"):
+            break
+    interface.stop_reader()
+"""
+import dataclasses
+import logging
+import queue
+import threading
+import time
+import typing
+
+from DTAF.logger import InterfaceLogger as Logger
+from DTAF.server.framing import FrameBuffer, FramingError, new_frame_buffer
+from DTAF.server.queues import BoundedQueue
+
+g_error_msg: tuple[str] = (
+    "RingBuffer: Invalid capacity `{capacity}`, it must be a positive integer.",  # 0
+    "SerialReader: ",  # x
+)
+"""
+List of error messages of this module.
+"""
+
+g_warning_msg: tuple[str] = (
+    "SerialReader: run :: Reader stopped by a port error: {error}",  # 0
+    "SerialReader: feed :: Unable to split the stream, the pending bytes were discarded: {error}",  # 1
+    "SerialReader: feed :: Callback {callback} failed on frame {frame}",  # 2
+    "SerialReader: ",  # x
+)
+"""
+List of warning messages of this module.
+"""
+
+# marks the end of the frame queue.
+_stopped: object = object()
+
+
+@dataclasses.dataclass
+class SerialFrame:
+    """
+    Line or frame received by the reader.
+    """
+
+    timestamp: float
+    """
+    Time (``time.time``) when the last byte of the frame was read.
+    """
+
+    data: bytes
+    """
+    Content of the frame.
+    """
+
+    start: int = 0
+    """
+    Position in the stream of the first byte of the frame.
+    """
+
+    end: int = 0
+    """
+    Position in the stream after the last byte of the frame (delimiter or
+    length header included).
+    """
+
+
+class RingBuffer:
+    """
+    Thread safe byte ring buffer with a fixed capacity.
+
+    Writes never block: once full, the oldest bytes are overwritten. Reads
+    wait for data up to a timeout (``None`` waits forever, 0 doesn't wait).
+    """
+
+    overwritten: int = 0
+    """
+    Amount of bytes lost because the buffer was full.
+    """
+
+    total: int = 0
+    """
+    Amount of bytes written.
+    """
+
+    position: int = 0
+    """
+    Position in the stream up to which the bytes were read (or discarded by
+    :meth:`take`), the overwritten bytes don't count.
+    """
+
+    closed: bool = False
+    """
+    True once :meth:`close` was called, the reads don't wait anymore.
+    """
+
+    def __init__(self, capacity: int = 1 << 20) -> None:
+        if isinstance(capacity, int) is False or capacity <= 0:
+            raise ValueError(g_error_msg[0].format(capacity=capacity))
+        self.buffer: bytearray = bytearray(capacity)
+        self.capacity: int = capacity
+        self.overwritten = 0
+        self.total = 0
+        self.position = 0
+        self.closed = False
+        # the valid data starts at _start and has _size bytes, wrapping around.
+        self._start: int = 0
+        self._size: int = 0
+        self._condition: threading.Condition = threading.Condition()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        """
+        Appends the data, overwriting the oldest bytes if needed.
+
+        Returns the amount of bytes overwritten.
+        """
+        data = memoryview(data).cast("B")
+        size: int = len(data)
+        lost: int = 0
+        with self._condition:
+            self.total += size
+            if size >= self.capacity:
+                lost = self._size + size - self.capacity
+                data = data[size - self.capacity:]
+                size = self.capacity
+                self._start = self._size = 0
+            elif self._size + size > self.capacity:
+                lost = self._size + size - self.capacity
+                self._start = (self._start + lost) % self.capacity
+                self._size -= lost
+            end: int = (self._start + self._size) % self.capacity
+            first: int = min(size, self.capacity - end)
+            self.buffer[end:end + first] = data[:first]
+            self.buffer[:size - first] = data[first:]
+            self._size += size
+            self.overwritten += lost
+            self._condition.notify_all()
+        return lost
+
+    def _peek(self, size: int) -> bytes:
+        first: int = min(size, self.capacity - self._start)
+        return bytes(self.buffer[self._start:self._start + first]) + bytes(self.buffer[:size - first])
+
+    def _consume(self, size: int) -> bytes:
+        data: bytes = self._peek(size)
+        self._start = (self._start + size) % self.capacity
+        self._size -= size
+        self.position = self.total - self._size
+        return data
+
+    def read(self, size: int = -1, timeout: float | int | None = 0) -> bytes:
+        """
+        Returns up to ``size`` bytes (all of them if negative).
+
+        Waits until ``size`` bytes are buffered (any byte if negative), the
+        timeout expires or the buffer is closed, then returns what's there.
+        """
+        with self._condition:
+            if timeout != 0:
+                self._condition.wait_for(lambda: self.closed or (self._size >= size if size >= 0 else self._size > 0),
+                                         timeout)
+            return self._consume(self._size if size < 0 else min(size, self._size))
+
+    def read_until(self, expected: bytes = b"\n", size: int = None, timeout: float | int | None = 0) -> bytes:
+        """
+        Returns the bytes up to and including ``expected``, or up to ``size``
+        bytes.
+
+        Like :meth:`read`, waits for them up to the timeout and returns what's
+        buffered if it expires.
+        """
+        state: dict = {"end": -1}
+
+        def ready() -> bool:
+            if size is not None and self._size >= size:
+                state["end"] = size
+                return True
+            index: int = self._peek(self._size).find(expected)
+            if index >= 0:
+                state["end"] = index + len(expected)
+                return True
+            return self.closed
+
+        with self._condition:
+            if ready() is False and timeout != 0:
+                self._condition.wait_for(ready, timeout)
+            end: int = state["end"] if state["end"] >= 0 else self._size
+            return self._consume(min(end, self._size))
+
+    def take(self, start: int, end: int) -> bool:
+        """
+        Consumes the stream bytes from ``start`` to ``end``, e.g. the bytes of
+        a frame returned by other means.
+
+        Returns False (and consumes nothing) if some of them were already
+        read. The bytes before ``start`` still buffered are discarded too.
+        """
+        with self._condition:
+            if start < self.position:
+                return False
+            # position in the stream of the oldest buffered byte.
+            head: int = self.total - self._size
+            self._consume(min(max(end - head, 0), self._size))
+            self.position = max(self.position, end)
+            return True
+
+    def clear(self) -> None:
+        """
+        Discards the buffered bytes.
+        """
+        with self._condition:
+            self._start = self._size = 0
+            self.position = self.total
+
+    def close(self) -> None:
+        """
+        Wakes up the readers, the buffered bytes can still be read.
+        """
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+
+class SerialReader(threading.Thread):
+    """
+    Thread reading a serial port in bulk.
+
+    ``port`` is any object with the pyserial API used here: ``in_waiting``,
+    ``read(size)`` and optionally ``cancel_read()`` (to stop without waiting
+    for the read timeout). ``framing`` and ``framing_options`` select the
+    :mod:`DTAF.server.framing` buffer, e.g. ``delimiter=b"\\r\\n"`` or
+    ``framing="length"``.
+
+    The callbacks run in the reader thread, keep them short.
+    """
+
+    bytes_read: int = 0
+    """
+    Amount of bytes read from the port.
+    """
+
+    error: Exception = None
+    """
+    Error that stopped the reader, if any.
+    """
+
+    def __init__(self,
+                 port: typing.Any,
+                 framing: str = "delimiter",
+                 buffer_size: int = 1 << 20,
+                 queue_size: int = 10000,
+                 name: str = "DTAF-SerialReader",
+                 logger: logging.Logger | logging.LoggerAdapter = None,
+                 **framing_options) -> None:
+        super().__init__(name=name, daemon=True)
+        self.port: typing.Any = port
+        self.buffer: RingBuffer = RingBuffer(buffer_size)
+        self.framer: FrameBuffer = new_frame_buffer(framing, **framing_options)
+        self.queue: BoundedQueue = BoundedQueue(queue_size, policy="drop-oldest")
+        self.callbacks: list[typing.Callable[[SerialFrame], typing.Any]] = []
+        self.logger: logging.Logger | logging.LoggerAdapter = logger or logging.LoggerAdapter(Logger, {
+            "uid": name,
+            "duid": "SERIAL_READER",
+            "interface_class": self.__class__,
+        })
+        self.bytes_read = 0
+        self.error = None
+        # position in the stream of the next frame.
+        self._frame_start: int = 0
+        self._running: threading.Event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._running.is_set()
+
+    @property
+    def dropped(self) -> int:
+        """
+        Amount of frames discarded because nobody consumed them.
+        """
+        return self.queue.dropped
+
+    def add_callback(self, callback: typing.Callable[[SerialFrame], typing.Any]) -> None:
+        """
+        Calls ``callback(frame)`` for every new frame.
+        """
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback: typing.Callable[[SerialFrame], typing.Any]) -> None:
+        if callback in self.callbacks:
+            self.callbacks.remove(callback)
+
+    def start(self) -> None:
+        self._running.set()
+        super().start()
+
+    def stop(self, timeout: float | int | None = None) -> None:
+        """
+        Stops the reader and waits for the thread (up to ``timeout``).
+
+        The buffered bytes and frames can still be read afterwards.
+        """
+        self._running.clear()
+        cancel_read: typing.Callable = getattr(self.port, "cancel_read", None)
+        if cancel_read is not None:
+            try:
+                cancel_read()
+            except Exception:
+                pass
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def run(self) -> None:
+        try:
+            while self._running.is_set():
+                try:
+                    # blocks up to the port timeout for the first byte, then takes everything waiting.
+                    waiting: int = self.port.in_waiting
+                    data: bytes = self.port.read(waiting or 1)
+                except Exception as error:
+                    if self._running.is_set():
+                        self.error = error
+                        self.logger.warning(g_warning_msg[0].format(error=error))
+                    break
+                if data:
+                    self.feed(data)
+        finally:
+            self._running.clear()
+            self.buffer.close()
+            self.queue.put(_stopped)
+
+    def feed(self, data: bytes, timestamp: float = None) -> None:
+        """
+        Stores a chunk of the stream and dispatches the frames it completes.
+
+        Called by the reader thread; exposed to replay recorded streams.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        position: int = self.buffer.position
+        if position > self._frame_start:
+            # the raw reads took the start of the pending frame, the rest begins a new one.
+            pending: bytes = self.framer.flush()
+            self.framer.feed(pending[position - self._frame_start:])
+            self._frame_start = position
+        self.bytes_read += len(data)
+        self.buffer.write(data)
+        try:
+            self.framer.feed(data)
+        except FramingError as error:
+            self.logger.warning(g_warning_msg[1].format(error=error))
+            self._frame_start = self.bytes_read
+            return
+        for data in self.framer:
+            # the framer keeps the bytes after the frame, the rest of the stream was consumed.
+            end: int = self.bytes_read - len(self.framer)
+            frame: SerialFrame = SerialFrame(timestamp, data, self._frame_start, end)
+            self._frame_start = end
+            self.queue.put(frame)
+            for callback in self.callbacks:
+                try:
+                    callback(frame)
+                except Exception:
+                    self.logger.exception(g_warning_msg[2].format(callback=callback, frame=frame))
+
+    def read_frame(self, timeout: float | int | None = None) -> SerialFrame | None:
+        """
+        Returns the next frame, or None if the timeout expired or the reader
+        stopped and every frame was consumed.
+
+        The bytes of the frame are consumed from :attr:`buffer`, the frames
+        already read from the buffer are skipped.
+        """
+        deadline: float | None = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                if timeout == 0:
+                    frame: SerialFrame | object = self.queue.get_nowait()
+                else:
+                    frame = self.queue.get(timeout=None if deadline is None else max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                return None
+            if frame is _stopped:
+                # left for the other consumers.
+                self.queue.put(_stopped)
+                return None
+            if self.buffer.take(frame.start, frame.end) is True:
+                return frame
+
+    def frames(self, timeout: float | int | None = None) -> typing.Iterator[SerialFrame]:
+        """
+        Yields the frames as they arrive, until no frame is received for
+        ``timeout`` seconds (forever if None) or the reader stops.
+        """
+        while (frame := self.read_frame(timeout)) is not None:
+            yield frame
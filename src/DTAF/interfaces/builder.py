@@ -22,9 +22,22 @@ import weakref
 import yaml
 import gc
 import traceback
+import os
+import itertools
+import concurrent.futures
+import typing
+import hashlib
+import pickle
+import tempfile
+import threading
+import collections
+import time
+import atexit
+import copy
 
 #   imports the configuration manager instance.
 from DTAF.config import Config
+import DTAF.config
 import DTAF.factory
 
 #TODO: remove this block once our own logger has been added.
@@ -43,6 +56,15 @@ g_warning_msg: tuple[str] = (
     "Builder: Data Type not implemented. please consider notifying your supplier for more information about this error. UID:{uid}, type:{type_}.",  # 4
     "Builder: Missing Structure ID in main tree. {uid}.",  # 5
     "Builder: Device Interface section is empty. device_name: {name}.",  # 6
+    "Builder: Missing required key `{key}` in {section}.",  # 7
+    "Builder: Wrong type for `{key}` in {section}, expected {type_}, found {found}.",  # 8
+    "Builder: Unable to start the model parser processes, parsing in this process. ERROR: {error}",  # 9
+    "Builder: Bulk load finished, loaded: {loaded}, failed: {failed}.",  # 10
+    "Builder: Unable to use the model cache `{path}`, ignoring it. ERROR: {error}",  # 11
+    "Builder: Registry maintenance failed, retrying on the next run. ERROR: {type_}: {error}",  # 12
+    "Builder: Reloaded `{filename}`: {report}.",  # 13
+    "Builder: Unable to reload `{filename}`, the current devices are kept. ERROR: {type_}: {error}",  # 14
+    "Builder: Unable to disconnect the interface UID: {uid} before removing it. ERROR: {error}",  # 15
     "Builder: ",  # x
 )
 
@@ -58,12 +80,36 @@ g_error_msg: tuple[str] = (
     "Builder: Orphan registry found in main memory Tree, entry {uid} was not found in {memory_section}.",  # 8
     "Builder: Model Error: models can only have one root. found: {roots}.",  # 9
     "Builder: Attribute Error, Invalid Attribute name: Name: {name}, Value: {value}",  # 10
+    "Builder: Model Error: the device section `{name}` must be a mapping, found {type_}.",  # 11
+    "Builder: Model Error: the interfaces section of `{name}` must be a mapping, found {type_}.",  # 12
+    "Builder: Model Error: the interface `{name}` must be a mapping, found {type_}.",  # 13
+    "Builder: Unable to read model file `{filename}`. ERROR: {error}",  # 14
+    "Builder: Unable to parse model file `{filename}`. ERROR: {error}",  # 15
+    "Builder: Unable to create `{name}`. ERROR: {type_}: {error}",  # 16
+    "Builder: Model folder `{path}` is not a folder.",  # 17
+    "Builder: No single {type_} named `{name}` in memory, found UIDs: {uids}.",  # 18
     "Builder: ",  # x
 )
 """
 List of all error messages of this module.
 """
 
+g_debug_msg: tuple[str] = (
+    "Builder: Model cache hit: {filename}.",  # 0
+    "Builder: Model cache miss: {filename}.",  # 1
+    "Builder: Registry maintenance started, interval: {interval}s, batch size: {batch_size}, gc interval: {gc_interval}s.",  # 2
+    "Builder: Registry maintenance stopped.",  # 3
+    "Builder: Dead entry marked by its finalizer, UID: {uid}.",  # 4
+    "Builder: Model watcher started, paths: {paths}, interval: {interval}s.",  # 5
+    "Builder: Model change found: {filename}.",  # 6
+    "Builder: ",  # x
+)
+
+yaml_loader: type = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""
+YAML loader of the models, the LibYAML one when available.
+"""
+
 g_required_keys: dict = {
     "Config": {
         "load_sequence": (int, False),  # Load seuqence of importance.
@@ -122,6 +168,591 @@ method which attributes are required to be present, and which not.
 """
 
 
+def _check_section(section: dict, required: dict, name: str) -> list[str]:
+    # keys are matched regardless of their case, models use lower case names.
+    keys: dict[str, str] = {str(key).lower(): key for key in section}
+    problems: list[str] = []
+    for key, definition in required.items():
+        if isinstance(definition, dict):
+            continue
+        types, is_required = definition
+        types = tuple(type(None) if n is None else n for n in (types if isinstance(types, tuple) else (types, )))
+        if key.lower() not in keys:
+            if is_required is True:
+                problems.append(g_warning_msg[7].format(key=key, section=name))
+            continue
+        value: typing.Any = section[keys[key.lower()]]
+        if isinstance(value, types) is False:
+            problems.append(g_warning_msg[8].format(key=key, section=name, type_=types, found=type(value)))
+    return problems
+
+
+def validate_model(data: typing.Any, strict: bool = False) -> tuple[list[str], list[str]]:
+    """
+    Validates a parsed model against :data:`g_required_keys`.
+
+    Returns the errors (the model can't be built) and the warnings. Missing
+    required keys and wrong types are warnings, unless `strict` is True.
+    """
+    errors: list[str] = []
+    problems: list[str] = []
+    if isinstance(data, dict) is False or len(data) != 1:
+        roots = list(data.keys()) if isinstance(data, dict) else data
+        return [g_error_msg[9].format(roots=roots)], []
+    device_name, device = next(iter(data.items()))
+    if isinstance(device, dict) is False:
+        return [g_error_msg[11].format(name=device_name, type_=type(device))], []
+    problems += _check_section(device, g_required_keys["Devices"], device_name)
+    interfaces: typing.Any = device.get("interfaces", None)
+    if not interfaces:
+        problems.append(g_warning_msg[6].format(name=device_name))
+    elif isinstance(interfaces, dict) is False:
+        errors.append(g_error_msg[12].format(name=device_name, type_=type(interfaces)))
+    else:
+        for interface_name, interface in interfaces.items():
+            if isinstance(interface, dict) is False:
+                errors.append(g_error_msg[13].format(name=interface_name, type_=type(interface)))
+                continue
+            problems += _check_section(interface, g_required_keys["Devices"]["Interfaces"],
+                                       f"{device_name}.{interface_name}")
+    if strict is True:
+        return errors + problems, []
+    return errors, problems
+
+
+def parse_model_file(filename: str | pathlib.Path,
+                     strict: bool = False,
+                     use_cache: bool = None) -> tuple[str, dict, list[str], list[str]]:
+    """
+    Reads, parses and validates a model file.
+
+    Used by the parser processes of :meth:`BuilderClass.load_many`, nothing
+    is raised: returns the filename, the model (None if it's unusable), the
+    errors and the warnings.
+
+    The valid models go through the :class:`ModelCache` when `use_cache`
+    (``Config.Builder.model_cache`` by default) is True.
+    """
+    filename = str(filename)
+    cache: ModelCache = get_model_cache() if use_cache is not False else None
+    try:
+        if cache is not None:
+            entry: tuple[dict, list[str]] = cache.get(filename)
+            if entry is not None:
+                data, warnings = entry
+                return (filename, None, warnings, []) if strict is True and warnings else (filename, data, [],
+                                                                                          warnings)
+        with open(filename, "rb") as file_:
+            content: bytes = file_.read()
+    except OSError as error:
+        return filename, None, [g_error_msg[14].format(filename=filename, error=error)], []
+    try:
+        data: typing.Any = yaml.load(content, Loader=yaml_loader)
+    except yaml.YAMLError as error:
+        return filename, None, [g_error_msg[15].format(filename=filename, error=error)], []
+    errors, warnings = validate_model(data)
+    if errors:
+        return filename, None, errors, warnings
+    if cache is not None:
+        cache.put(filename, content, data, warnings)
+    if strict is True and warnings:
+        return filename, None, warnings, []
+    return filename, data, errors, warnings
+
+
+class ModelCache():
+    """
+    Cache of the parsed and validated models.
+
+    Each model is pickled into its own file, named after the hash of the model
+    path, together with the mtime, size and content hash of the model file.
+    An entry is used while the mtime and size match; otherwise the file is
+    read again and the entry is only reparsed if the content hash changed.
+
+    Only valid models are cached, the entries of other DTAF versions (see
+    :attr:`version`) are ignored.
+    """
+
+    version: int = 1
+    """
+    Version of the entries, changes with the model validation rules.
+    """
+
+    path: pathlib.Path
+    """
+    Folder of the cache files.
+    """
+
+    def __init__(self, path: str | pathlib.Path) -> None:
+        self.path = pathlib.Path(path).expanduser()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.path}>"
+
+    def entry_path(self, filename: str | pathlib.Path) -> pathlib.Path:
+        """
+        Gets the cache file of a model file.
+        """
+        key: str = str(pathlib.Path(filename).expanduser().resolve())
+        return self.path / (hashlib.sha1(key.encode("utf-8")).hexdigest() + ".pickle")
+
+    def _read(self, entry_path: pathlib.Path) -> dict:
+        try:
+            with open(entry_path, "rb") as file_:
+                entry: typing.Any = pickle.load(file_)
+        except FileNotFoundError:
+            return None
+        except Exception as error:
+            Logger.warning(g_warning_msg[11].format(path=entry_path, error=error))
+            return None
+        if isinstance(entry, dict) is False or entry.get("version", None) != self.version:
+            return None
+        return entry
+
+    def _write(self, entry_path: pathlib.Path, entry: dict) -> None:
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            # the entry is replaced at once, other processes never read half of it.
+            with tempfile.NamedTemporaryFile("wb", dir=self.path, suffix=".tmp", delete=False) as file_:
+                pickle.dump(entry, file_, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(file_.name, entry_path)
+        except Exception as error:
+            Logger.warning(g_warning_msg[11].format(path=entry_path, error=error))
+
+    def get(self, filename: str | pathlib.Path) -> tuple[dict, list[str]]:
+        """
+        Gets the model and its validation warnings, None if the model file
+        changed or isn't cached.
+
+        Raises OSError if the model file can't be read.
+        """
+        stat: os.stat_result = os.stat(filename)
+        entry_path: pathlib.Path = self.entry_path(filename)
+        entry: dict = self._read(entry_path)
+        if entry is None:
+            Logger.debug(g_debug_msg[1].format(filename=filename))
+            return None
+        if (entry["mtime"], entry["size"]) != (stat.st_mtime_ns, stat.st_size):
+            # touched but maybe not changed.
+            with open(filename, "rb") as file_:
+                content: bytes = file_.read()
+            if hashlib.sha256(content).hexdigest() != entry["hash"]:
+                Logger.debug(g_debug_msg[1].format(filename=filename))
+                return None
+            entry["mtime"], entry["size"] = stat.st_mtime_ns, stat.st_size
+            with self._lock:
+                self._write(entry_path, entry)
+        Logger.debug(g_debug_msg[0].format(filename=filename))
+        return entry["data"], entry["warnings"]
+
+    def put(self, filename: str | pathlib.Path, content: bytes, data: dict, warnings: list[str]) -> None:
+        """
+        Stores a valid model, `content` is the model file read to parse it.
+        """
+        stat: os.stat_result = os.stat(filename)
+        entry: dict = {
+            "version": self.version,
+            "filename": str(filename),
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": hashlib.sha256(content).hexdigest(),
+            "data": data,
+            "warnings": warnings,
+        }
+        with self._lock:
+            self._write(self.entry_path(filename), entry)
+
+    def remove(self, filename: str | pathlib.Path) -> bool:
+        """
+        Removes the entry of a model file, returns False if it wasn't cached.
+        """
+        try:
+            self.entry_path(filename).unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def clear(self) -> int:
+        """
+        Removes every entry, returns the number of removed entries.
+        """
+        count: int = 0
+        for entry_path in self.path.glob("*.pickle"):
+            entry_path.unlink(missing_ok=True)
+            count += 1
+        return count
+
+
+_model_cache: ModelCache = None
+
+
+def get_model_cache() -> ModelCache:
+    """
+    Gets the model cache set in ``Config.Builder``, None if it's disabled.
+
+    The cache lives in ``HOMEDIR/model_cache`` unless
+    ``Config.Builder.model_cache_dir`` is set.
+    """
+    global _model_cache
+    if not Config.Builder.model_cache:
+        return None
+    path: pathlib.Path = pathlib.Path(Config.Builder.model_cache_dir or (DTAF.config.HOMEDIR / "model_cache"))
+    if _model_cache is None or _model_cache.path != path.expanduser():
+        _model_cache = ModelCache(path)
+    return _model_cache
+
+
+class LoadReport():
+    """
+    Result of a bulk load (see :meth:`BuilderClass.load_many`).
+
+    Each file is either loaded or failed, a failed file never leaves devices
+    or interfaces registered in memory.
+    """
+
+    loaded: dict[str, weakref.proxy]
+    """
+    Device proxy of each loaded file.
+    """
+
+    errors: dict[str, list[str]]
+    """
+    Error messages of each failed file.
+    """
+
+    warnings: dict[str, list[str]]
+    """
+    Validation warnings of each file, loaded or not.
+    """
+
+    def __init__(self) -> None:
+        self.loaded = {}
+        self.errors = {}
+        self.warnings = {}
+
+    def __bool__(self) -> bool:
+        return not self.errors
+
+    def __repr__(self) -> str:
+        return f"<LoadReport loaded={len(self.loaded)} failed={len(self.errors)}>"
+
+    @property
+    def failed(self) -> list[str]:
+        """
+        Names of the files that couldn't be loaded.
+        """
+        return list(self.errors)
+
+    def summary(self) -> str:
+        """
+        Human readable report, one line per problem.
+        """
+        lines: list[str] = [g_warning_msg[10].format(loaded=len(self.loaded), failed=len(self.errors))]
+        for filename, messages in self.errors.items():
+            lines += [f"  ERROR   {filename}: {message}" for message in messages]
+        for filename, messages in self.warnings.items():
+            lines += [f"  WARNING {filename}: {message}" for message in messages]
+        return "\n".join(lines)
+
+
+class ReloadReport():
+    """
+    Result of a model reload (see :meth:`BuilderClass.reload_file`).
+
+    Interfaces are kept (same model), reconfigured in place, replaced (new
+    instance, e.g. the port changed), created or removed; only the last three
+    open or close connections.
+    """
+
+    kept: list[int]
+    """
+    UIDs of the unchanged devices and interfaces.
+    """
+
+    reconfigured: list[int]
+    """
+    UIDs of the devices and interfaces changed in place.
+    """
+
+    replaced: dict[int, int]
+    """
+    New UID of each replaced interface (or device, if its class changed).
+    """
+
+    created: list[int]
+    """
+    UIDs of the new devices and interfaces.
+    """
+
+    removed: list[int]
+    """
+    UIDs of the removed devices and interfaces.
+    """
+
+    errors: list[str]
+    """
+    Error messages of the changes that couldn't be made, e.g. a replaced
+    interface that couldn't connect again.
+    """
+
+    def __init__(self) -> None:
+        self.kept = []
+        self.reconfigured = []
+        self.replaced = {}
+        self.created = []
+        self.removed = []
+        self.errors = []
+
+    def __bool__(self) -> bool:
+        """
+        True if anything changed.
+        """
+        return bool(self.reconfigured or self.replaced or self.created or self.removed)
+
+    def __repr__(self) -> str:
+        return f"<ReloadReport {self.summary()}>"
+
+    def summary(self) -> str:
+        return (f"kept: {len(self.kept)}, reconfigured: {len(self.reconfigured)}, replaced: {len(self.replaced)}, "
+                f"created: {len(self.created)}, removed: {len(self.removed)}, errors: {len(self.errors)}")
+
+    def update(self, other: "ReloadReport") -> None:
+        """
+        Adds the results of another report.
+        """
+        self.kept += other.kept
+        self.reconfigured += other.reconfigured
+        self.replaced.update(other.replaced)
+        self.created += other.created
+        self.removed += other.removed
+        self.errors += other.errors
+
+
+class RegistryMaintenance(threading.Thread):
+    """
+    Background registry maintenance.
+
+    Every `interval` seconds (or as soon as a finalizer marks an entry dead)
+    cleans the dead entries and verifies the next `batch_size` entries of the
+    memory tree, so a large registry is checked across many short runs
+    instead of one long pause.
+
+    When `gc_interval` is set, it also runs :func:`gc.collect` on
+    `gc_generation` every `gc_interval` seconds, and `gc_thresholds` replaces
+    the collector thresholds (see :func:`gc.set_threshold`) while it runs.
+    """
+
+    keep_alive: bool = False
+    """
+    Main loop flag, set to False to stop the maintenance.
+    """
+
+    interval: float = 1.0
+    """
+    Maximum time between two maintenance runs, in seconds.
+    """
+
+    batch_size: int = 100
+    """
+    Entries cleaned and verified by each run.
+    """
+
+    gc_interval: float = 0
+    """
+    Time between the scheduled collections, in seconds. 0 disables them.
+    """
+
+    gc_generation: int = 1
+    """
+    Oldest generation collected by the scheduled collections.
+    """
+
+    def __init__(self,
+                 builder: "BuilderClass",
+                 interval: float = 1.0,
+                 batch_size: int = 100,
+                 gc_interval: float = 0,
+                 gc_generation: int = 1,
+                 gc_thresholds: typing.Iterable[int] = None) -> None:
+        super().__init__(name="DTAF-BuilderMaintenance", daemon=True)
+        self.builder: BuilderClass = builder
+        self.interval = interval
+        self.batch_size = batch_size
+        self.gc_interval = gc_interval
+        self.gc_generation = gc_generation
+        self.gc_thresholds: tuple[int] = tuple(gc_thresholds) if gc_thresholds else None
+        self._previous_thresholds: tuple[int] = None
+        self._gc_requests: collections.deque = collections.deque()
+        self._wakeup: threading.Event = threading.Event()
+        self.keep_alive = True
+
+    def wakeup(self) -> None:
+        """
+        Runs the maintenance as soon as possible.
+        """
+        self._wakeup.set()
+
+    def request_collection(self, generation: int = 2) -> None:
+        """
+        Runs :func:`gc.collect` on `generation` in the maintenance thread.
+        """
+        self._gc_requests.append(generation)
+        self.wakeup()
+
+    def stop(self, timeout: float = None) -> None:
+        """
+        Stops the maintenance and gives the collector thresholds back.
+        """
+        self.keep_alive = False
+        self.wakeup()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def step(self) -> None:
+        """
+        Runs the maintenance once: cleans a batch of dead entries, then
+        verifies a batch of entries.
+        """
+        self.builder.clean_dead_entries(self.batch_size)
+        self.builder.verify_registry(self.batch_size)
+
+    def run(self) -> None:
+        if self.gc_thresholds is not None:
+            self._previous_thresholds = gc.get_threshold()
+            gc.set_threshold(*self.gc_thresholds)
+        next_collection: float = time.monotonic() + self.gc_interval
+        try:
+            while self.keep_alive is True:
+                self._wakeup.wait(self.interval)
+                self._wakeup.clear()
+                if self.keep_alive is False:
+                    break
+                try:
+                    self.step()
+                    while self._gc_requests:
+                        gc.collect(self._gc_requests.popleft())
+                    if self.gc_interval and time.monotonic() >= next_collection:
+                        gc.collect(self.gc_generation)
+                        next_collection = time.monotonic() + self.gc_interval
+                except Exception as error:
+                    Logger.warning(g_warning_msg[12].format(type_=type(error).__name__, error=error))
+        finally:
+            if self._previous_thresholds is not None:
+                gc.set_threshold(*self._previous_thresholds)
+            Logger.debug(g_debug_msg[3])
+
+
+class ModelWatcher(threading.Thread):
+    """
+    Polling model watcher.
+
+    Every `interval` seconds checks the mtime and size of the watched model
+    files (files, or the files matching `patterns` in folders) and reloads
+    the changed ones through :meth:`BuilderClass.reload_file`. Only the
+    files already loaded in the builder are reloaded, unless `load_new` is
+    True.
+
+    Polling is used to stay portable (no inotify/FSEvents dependency), the
+    checks only call :func:`os.stat`.
+    """
+
+    keep_alive: bool = False
+    """
+    Main loop flag, set to False to stop the watcher.
+    """
+
+    interval: float = 1.0
+    """
+    Time between two checks, in seconds.
+    """
+
+    reports: dict[str, ReloadReport]
+    """
+    Last reload report of each model file.
+    """
+
+    errors: dict[str, str]
+    """
+    Last reload error of each model file, cleared by the next good reload.
+    """
+
+    def __init__(self,
+                 builder: "BuilderClass",
+                 paths: typing.Iterable[str | pathlib.Path],
+                 interval: float = 1.0,
+                 patterns: typing.Iterable[str] = ("*.yaml", "*.yml"),
+                 load_new: bool = False) -> None:
+        super().__init__(name="DTAF-ModelWatcher", daemon=True)
+        self.builder: BuilderClass = builder
+        self.paths: list[pathlib.Path] = [pathlib.Path(path) for path in paths]
+        self.interval = interval
+        self.patterns: tuple[str] = tuple(patterns)
+        self.load_new: bool = load_new
+        self.reports = {}
+        self.errors = {}
+        self._wakeup: threading.Event = threading.Event()
+        self._snapshot: dict[str, tuple[int, int]] = self.scan()
+        self.keep_alive = True
+
+    def scan(self) -> dict[str, tuple[int, int]]:
+        """
+        Gets the mtime and size of every watched model file.
+        """
+        files: dict[str, tuple[int, int]] = {}
+        for path in self.paths:
+            candidates: typing.Iterable[pathlib.Path] = [path]
+            if path.is_dir():
+                candidates = (candidate for pattern in self.patterns for candidate in path.glob(pattern))
+            for candidate in candidates:
+                try:
+                    stat: os.stat_result = candidate.stat()
+                except OSError:
+                    continue
+                files[os.path.abspath(candidate)] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def check(self) -> dict[str, ReloadReport]:
+        """
+        Reloads the model files changed since the last check, returns their
+        reports.
+        """
+        snapshot: dict[str, tuple[int, int]] = self.scan()
+        changed: list[str] = [filename for filename, stat in snapshot.items() if self._snapshot.get(filename) != stat]
+        self._snapshot = snapshot
+        reports: dict[str, ReloadReport] = {}
+        for filename in sorted(changed):
+            if self.load_new is False and not self.builder.get_devices_by_file(filename):
+                continue
+            Logger.debug(g_debug_msg[6].format(filename=filename))
+            try:
+                reports[filename] = self.builder.reload_file(filename)
+                self.errors.pop(filename, None)
+            except Exception as error:
+                self.errors[filename] = g_warning_msg[14].format(filename=filename,
+                                                                 type_=type(error).__name__,
+                                                                 error=error)
+                Logger.warning(self.errors[filename])
+        self.reports.update(reports)
+        return reports
+
+    def stop(self, timeout: float = None) -> None:
+        """
+        Stops the watcher.
+        """
+        self.keep_alive = False
+        self._wakeup.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def run(self) -> None:
+        while self.keep_alive is True:
+            self._wakeup.wait(self.interval)
+            if self.keep_alive is False:
+                break
+            self.check()
+
+
 class BuilderClass():
     __max_uid: int = 0
     "Current ID counter of all instances."
@@ -182,6 +813,117 @@ class BuilderClass():
     Store allowcation for the
     """
 
+    # ---- reverse lookup indexes, updated on register/remove ----
+    __ids: dict[int, int] = {}
+    "UID of each registered instance (and of its proxy) by `id()`."
+
+    __proxies: dict[int, weakref.proxy] = {}
+    "Proxy handed out for each UID, the same one is always returned."
+
+    __device_names: dict[str, dict[int, None]] = {}
+    "UIDs of the devices by name, in registration order."
+
+    __interface_names: dict[str, dict[int, None]] = {}
+    "UIDs of the interfaces by name, in registration order."
+
+    __device_interfaces: dict[int, dict[int, None]] = {}
+    "UIDs of the interfaces bound to each device UID."
+
+    __files: dict[str, dict[int, None]] = {}
+    "UIDs of the devices loaded from each model file (absolute path)."
+
+    __watchers: list = []
+    "Running model watchers, see :meth:`watch_models`."
+
+    __lock: threading.RLock = threading.RLock()
+    "Guards the memory tree and its indexes, also changed by the maintenance thread."
+
+    __finalizers: dict[int, weakref.finalize] = {}
+    "Finalizer of each weak entry, marks the entry dead once its instance is collected."
+
+    __dead: collections.deque = collections.deque()
+    "UIDs marked dead by the finalizers, waiting to be cleaned."
+
+    __sweep_keys: list[int] = []
+    "Snapshot of the UIDs verified by the incremental verification."
+
+    __sweep_position: int = 0
+    "Next position of the incremental verification in the snapshot."
+
+    maintenance: RegistryMaintenance = None
+    """
+    Background registry maintenance, None unless started with
+    :meth:`start_maintenance`.
+    """
+
+    @staticmethod
+    def _get_name(instance: object) -> str:
+        # InterfaceBase raises ValueError for missing attributes.
+        try:
+            return getattr(instance, "name", None)
+        except (AttributeError, ValueError, ReferenceError):
+            return None
+
+    @staticmethod
+    def _is_proxy(instance: object) -> bool:
+        return isinstance(instance, (weakref.ProxyType, weakref.CallableProxyType))
+
+    @classmethod
+    def _keep(cls, uid: int, instance: object, weak: bool) -> object:
+        # weak entries don't keep their instance alive, their finalizer marks them dead.
+        if weak is False or cls._is_proxy(instance):
+            return instance
+        cls.__finalizers[uid] = weakref.finalize(instance, cls._mark_dead, uid)
+        cls.__finalizers[uid].atexit = False
+        return weakref.proxy(instance)
+
+    @classmethod
+    def _mark_dead(cls, uid: int) -> None:
+        cls.__dead.append(uid)
+        Logger.debug(g_debug_msg[4].format(uid=uid))
+        if cls.maintenance is not None:
+            cls.maintenance.wakeup()
+
+    @classmethod
+    def _index(cls, uid: int, instance: object, names: dict, device_uid: int = None) -> None:
+        cls.__ids[id(instance)] = uid
+        name: str = cls._get_name(instance)
+        # the id and name are kept in the tree, dead entries can't be asked for them.
+        cls.__store[uid]["id"] = id(instance)
+        cls.__store[uid]["name"] = name
+        if name is not None:
+            names.setdefault(name, {})[uid] = None
+        if device_uid is not None:
+            cls.__device_interfaces.setdefault(device_uid, {})[uid] = None
+
+    @classmethod
+    def _drop_proxy(cls, uid: int) -> None:
+        # callback of the proxies, the instance is gone.
+        proxy: weakref.proxy = cls.__proxies.pop(uid, None)
+        if proxy is not None:
+            cls.__ids.pop(id(proxy), None)
+
+    @classmethod
+    def _unindex(cls, uid: int, instance: object, names: dict) -> None:
+        cls.__ids.pop(cls.__store.get(uid, {}).get("id", id(instance)), None)
+        if cls.__store.get(uid, {}).get("type", None) == "device":
+            filename: str = os.path.abspath(str(cls.__store[uid]["filename"]))
+            cls.__files.get(filename, {}).pop(uid, None)
+            if not cls.__files.get(filename, True):
+                del cls.__files[filename]
+        cls._drop_proxy(uid)
+        finalizer: weakref.finalize = cls.__finalizers.pop(uid, None)
+        if finalizer is not None:
+            finalizer.detach()
+        name: str = cls.__store.get(uid, {}).get("name", None)
+        if name in names:
+            names[name].pop(uid, None)
+            if not names[name]:
+                del names[name]
+        device_uid: int = cls.__store.get(uid, {}).get("host_device", None)
+        if device_uid in cls.__device_interfaces:
+            cls.__device_interfaces[device_uid].pop(uid, None)
+
     __root: object = None
 
     @property
@@ -228,46 +970,61 @@ class BuilderClass():
 
         The internal counter then will increase in 1.
         """
-        cls.__max_uid += 1
-        return cls.__max_uid - 1
+        with cls.__lock:
+            cls.__max_uid += 1
+            return cls.__max_uid - 1
 
     @classmethod
     def register_new_interface(cls,
                                interface_instance: object = None,
                                device_instance_uid: int = None,
-                               filename: str | pathlib.Path = "MISSING") -> int:
+                               filename: str | pathlib.Path = "MISSING",
+                               weak: bool = False) -> int:
         """
         Registers the new interface in memory and assigns it a single UID as a
         key in memory.
 
+        With `weak` the builder doesn't keep the instance alive, the entry is
+        cleaned once the instance is collected.
+
         .. note::
             You may be able to register a new interface without a device that
             it would be bound to. in this case. a log message will be emmited.
         """
-        uid: int = cls.get_new_UID()
-        cls.__interfaces[uid] = interface_instance
-        cls.__store[uid] = {"type": "interface", "devices": {}, "filename": filename}
-        cls.__store[uid]["host_device"] = device_instance_uid
-        return uid
+        with cls.__lock:
+            uid: int = cls.get_new_UID()
+            cls.__interfaces[uid] = cls._keep(uid, interface_instance, weak)
+            cls.__store[uid] = {"type": "interface", "devices": {}, "filename": filename}
+            cls.__store[uid]["host_device"] = device_instance_uid
+            cls._index(uid, interface_instance, cls.__interface_names, device_instance_uid)
+            return uid
 
     @classmethod
-    def register_new_device(cls, device_instance: object = None, filename: str | pathlib.Path = "MISSING") -> int:
+    def register_new_device(cls,
+                            device_instance: object = None,
+                            filename: str | pathlib.Path = "MISSING",
+                            weak: bool = False) -> int:
         """
         Registers a new instance of the device class (VDR) in memory.
 
         This method registers a new instance of a device and returns their ID,
         it will either return None or raise an exception in the case the task
-        failed.
+        failed. With `weak` the builder doesn't keep the instance alive, the
+        entry is cleaned once the instance is collected.
         """
         #TODO: REPLACE CHECK WITH DEVICE CLASS TYPE.
         if device_instance is None:
             raise ValueError(g_error_msg[1].format(type_=type(device_instance),
                                                    name='device_instance',
                                                    value=device_instance))
-        uid: int = cls.get_new_UID()
-        cls.__devices[uid] = device_instance
-        cls.__store[uid] = {"type": "device", "interfaces": {}, "filename": filename}
-        return uid
+        with cls.__lock:
+            uid: int = cls.get_new_UID()
+            cls.__devices[uid] = cls._keep(uid, device_instance, weak)
+            cls.__store[uid] = {"type": "device", "interfaces": {}, "filename": filename}
+            cls._index(uid, device_instance, cls.__device_names)
+            cls.__device_interfaces.setdefault(uid, {})
+            cls.__files.setdefault(os.path.abspath(str(filename)), {})[uid] = None
+            return uid
 
     def validate_string(self, string: str):
         """
@@ -292,7 +1049,7 @@ class BuilderClass():
         device_uid: int
         data: dict = {}
         try:
-            data = yaml.load(model, Loader=yaml.SafeLoader)
+            data = yaml.load(model, Loader=yaml_loader)
         except Exception as error:
             #TODO: change to logger message.
             Logger.info(g_error_msg[2].format(type_=type(error), error=error, traceback=traceback.format_exc()))
@@ -302,51 +1059,104 @@ class BuilderClass():
         #                           "modules are completed to continue this section.")
         if len(data.keys()) > 1:
             raise RuntimeError(g_error_msg[9].format(roots=list(data.keys())))
-        # Takes the first root
-        for device_name in data:
-            device = data[device_name]
-            device_cls = DTAF.factory.Factory.get_class_by_name(device_name)
-
-            # Creates the class instance and then registers it.
-            kwargs = {key: device[key] for key in list(device.keys()) if key != "interfaces"}
-            Logger.warning(f"kwargs = {kwargs}")
-            device_instance = device_cls(**kwargs)
-            device_uid = self.register_new_device(device_instance, filename)
-
-            # sets class attributes.
-            # setattr(device_instance, "name", device.get("name", "Null"))
-            # setattr(device_instance, "description", device.get("description", "Null"))
-            # setattr(device_instance, "model", device.get("model", "Null"))
-            # setattr(device_instance, "id", device.get("id", "Null"))
-            device_instance.set_uid(device_uid)
-
-            # verify the model has an "interfaces" section.
-            if not device["interfaces"]:
-                Logger.warning(g_warning_msg[6].format(name=device_name))
-                continue
-
-            # loops over all interfaces defined in the model.
-            for interface_class_name in device["interfaces"]:
-                # assigns an alias for the model section.
-                interface_model = device["interfaces"][interface_class_name]
-                #interface_model["duid"] = device_uid
-
-                # requests the class type from factory.
-                interface_cls = DTAF.factory.Factory.get_class_by_name(interface_class_name)
-
-                # Creates New Interface instance in memory. parses down all attributes from the model.
-                Interface = interface_cls(**interface_model)
+        device_instance, interfaces = self._create_instances(data)
+        return self._register_instances(device_instance, [future.result() for future in interfaces], filename, data)
+
+    def _create_instances(
+        self,
+        data: dict,
+        executor: concurrent.futures.Executor = None
+    ) -> tuple[object, list[concurrent.futures.Future]]:
+        """
+        Creates the device and interface instances of a model, nothing is
+        registered yet.
 
-                # Registers the new interface
-                interface_uid = self.register_new_interface(Interface, device_uid, filename)
-                Interface.set_duid(device_uid)
-                Interface.set_uid(interface_uid)
+        The interfaces are created in the executor when given (their
+        constructors may touch hardware), returns the futures of the
+        interface instances.
+        """
+        # Takes the first root
+        device_name, device = next(iter(data.items()))
+        device_cls = DTAF.factory.Factory.get_class_by_name(device_name)
+
+        # Creates the class instance.
+        kwargs = {key: device[key] for key in list(device.keys()) if key != "interfaces"}
+        Logger.debug(f"kwargs = {kwargs}")
+        device_instance = device_cls(**kwargs)
+
+        # sets class attributes.
+        # setattr(device_instance, "name", device.get("name", "Null"))
+        # setattr(device_instance, "description", device.get("description", "Null"))
+        # setattr(device_instance, "model", device.get("model", "Null"))
+        # setattr(device_instance, "id", device.get("id", "Null"))
+
+        interfaces: list[concurrent.futures.Future] = []
+        # verify the model has an "interfaces" section.
+        if not device.get("interfaces", None):
+            Logger.warning(g_warning_msg[6].format(name=device_name))
+            return device_instance, interfaces
+
+        # loops over all interfaces defined in the model.
+        for interface_class_name in device["interfaces"]:
+            # assigns an alias for the model section.
+            interface_model = device["interfaces"][interface_class_name]
+
+            # requests the class type from factory.
+            interface_cls = DTAF.factory.Factory.get_class_by_name(interface_class_name)
+
+            # Creates New Interface instance in memory. parses down all attributes from the model.
+            if executor is None:
+                future: concurrent.futures.Future = concurrent.futures.Future()
+                try:
+                    future.set_result(interface_cls(**interface_model))
+                except Exception as error:
+                    future.set_exception(error)
+            else:
+                future = executor.submit(interface_cls, **interface_model)
+            interfaces.append(future)
+        return device_instance, interfaces
+
+    def _register_instances(self,
+                            device_instance: object,
+                            interfaces: list[object],
+                            filename: str | pathlib.Path,
+                            data: dict = None) -> weakref.proxy:
+        """
+        Registers a device and its interfaces in memory.
 
-                # adds the interface to the device.
-                device_instance.add_interface(Interface.name, self.get_reference_by_UID(interface_uid))
+        The model (`data`) is kept with the entries, :meth:`reload_file`
+        compares it with the new one.
+        """
+        device_name, device = next(iter(data.items())) if data else (None, {})
+        models: list[tuple[str, dict]] = list((device.get("interfaces", None) or {}).items())
+        device_uid: int = self.register_new_device(device_instance, filename)
+        device_instance.set_uid(device_uid)
+        self.__store[device_uid]["class_name"] = device_name
+        self.__store[device_uid]["model"] = {key: copy.deepcopy(device[key]) for key in device if key != "interfaces"}
+        for n, Interface in enumerate(interfaces):
+            self._register_interface(device_instance, device_uid, Interface, filename,
+                                     *(models[n] if n < len(models) else (None, None)))
 
         return self.get_reference_by_UID(device_uid)
 
+    def _register_interface(self,
+                            device_instance: object,
+                            device_uid: int,
+                            Interface: object,
+                            filename: str | pathlib.Path,
+                            class_name: str = None,
+                            model: dict = None) -> int:
+        # Registers the new interface
+        interface_uid = self.register_new_interface(Interface, device_uid, filename)
+        Interface.set_duid(device_uid)
+        Interface.set_uid(interface_uid)
+        self.__store[interface_uid]["class_name"] = class_name
+        self.__store[interface_uid]["model"] = copy.deepcopy(model)
+
+        # adds the interface to the device.
+        device_instance.add_interface(Interface.name, self.get_reference_by_UID(interface_uid))
+        return interface_uid
+
     def load_file(self, filename: str | pathlib.Path) -> weakref.proxy:
         """
         File wrapper for the self.load_string method.
@@ -373,66 +1183,479 @@ class BuilderClass():
         elif filename.is_absolute() is False:
             #TODO: change this to a log message.
             Logger.warning(g_warning_msg[3])
-        with open(filename, "r") as file_:
-            model_string = file_.read()
-        return self.load_string(model=model_string, filename=str(filename))
+        if get_model_cache() is None:
+            with open(filename, "r") as file_:
+                model_string = file_.read()
+            return self.load_string(model=model_string, filename=str(filename))
+        # parses the model through the cache.
+        _, data, errors, warnings = parse_model_file(filename)
+        for message in warnings:
+            Logger.debug(message)
+        if errors:
+            raise RuntimeError(errors[0])
+        device_instance, interfaces = self._create_instances(data)
+        return self._register_instances(device_instance, [future.result() for future in interfaces], str(filename),
+                                        data)
+
+    def load_many(self,
+                  filenames: typing.Iterable[str | pathlib.Path],
+                  strict: bool = False,
+                  parse_workers: int = None,
+                  max_workers: int = None) -> LoadReport:
+        """
+        Loads many model files at once.
+
+        #. The files are read, parsed and validated against
+           :data:`g_required_keys` in a process pool of `parse_workers`
+           processes (0 parses them in this process).
+        #. The devices are created and the interface constructors (which may
+           touch hardware) run concurrently in a thread pool of
+           `max_workers` threads.
+        #. The instances of each file are registered only if the whole file
+           succeeded.
+
+        A broken file doesn't stop the batch, returns a :class:`LoadReport`
+        with the device of each loaded file and the errors of the failed
+        ones.
+        """
+        filenames = [str(pathlib.Path(filename)) for filename in filenames]
+        report: LoadReport = LoadReport()
+        parsed: list[tuple[str, dict, list[str], list[str]]] = []
+        if parse_workers is None:
+            parse_workers = min(len(filenames), os.cpu_count() or 1)
+        # a single file isn't worth a process pool.
+        if parse_workers > 1 and len(filenames) > 1:
+            try:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=parse_workers) as pool:
+                    chunksize: int = max(len(filenames) // (parse_workers * 4), 1)
+                    parsed = list(pool.map(parse_model_file, filenames, itertools.repeat(strict), chunksize=chunksize))
+            except (OSError, concurrent.futures.process.BrokenProcessPool) as error:
+                Logger.warning(g_warning_msg[9].format(error=error))
+                parsed = []
+        if not parsed:
+            parsed = [parse_model_file(filename, strict) for filename in filenames]
+
+        # creates the instances, interfaces in parallel.
+        pending: list[tuple[str, object, list[concurrent.futures.Future]]] = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                   thread_name_prefix="DTAF-Builder") as executor:
+            for filename, data, errors, warnings in parsed:
+                if warnings:
+                    report.warnings[filename] = warnings
+                if errors:
+                    report.errors[filename] = errors
+                    continue
+                try:
+                    device_instance, interfaces = self._create_instances(data, executor)
+                except Exception as error:
+                    report.errors[filename] = [
+                        g_error_msg[16].format(name=next(iter(data)), type_=type(error).__name__, error=error)
+                    ]
+                    continue
+                pending.append((filename, data, device_instance, interfaces))
+            # registers the files whose interfaces were all created.
+            for filename, data, device_instance, interfaces in pending:
+                instances: list[object] = []
+                errors: list[str] = []
+                for future in interfaces:
+                    try:
+                        instances.append(future.result())
+                    except Exception as error:
+                        errors.append(g_error_msg[16].format(name=filename, type_=type(error).__name__, error=error))
+                if errors:
+                    report.errors[filename] = errors
+                    continue
+                try:
+                    report.loaded[filename] = self._register_instances(device_instance, instances, filename, data)
+                except Exception as error:
+                    report.errors[filename] = [
+                        g_error_msg[16].format(name=filename, type_=type(error).__name__, error=error)
+                    ]
+        Logger.info(g_warning_msg[10].format(loaded=len(report.loaded), failed=len(report.errors)))
+        for filename, messages in report.errors.items():
+            for message in messages:
+                Logger.error(f"Builder: load_many :: {filename}: {message}")
+        return report
+
+    def load_directory(self,
+                       path: str | pathlib.Path,
+                       patterns: typing.Iterable[str] = ("*.yaml", "*.yml"),
+                       recursive: bool = False,
+                       **kwargs) -> LoadReport:
+        """
+        Loads every model file of a folder, see :meth:`load_many` for the
+        keyword arguments.
 
-    def call_garbage_collector(self):
+        The files are loaded in name order, set `recursive` to also load the
+        sub folders.
+        """
+        path = pathlib.Path(path)
+        if path.exists() is False:
+            raise ValueError(g_error_msg[4])
+        if path.is_dir() is False:
+            raise ValueError(g_error_msg[17].format(path=path))
+        filenames: set[pathlib.Path] = set()
+        for pattern in patterns:
+            filenames.update(path.rglob(pattern) if recursive is True else path.glob(pattern))
+        return self.load_many(sorted(filename for filename in filenames if filename.is_file()), **kwargs)
+
+    def get_devices_by_file(self, filename: str | pathlib.Path) -> list[int]:
+        """
+        Returns the UIDs of the devices loaded from a model file.
+        """
+        return list(self.__files.get(os.path.abspath(str(filename)), {}))
+
+    def _close_interface(self, uid: int) -> bool:
+        # disconnects an interface about to be removed, returns True if it was connected.
+        instance: object = self.__interfaces[uid]
+        try:
+            is_connected: typing.Callable = getattr(instance, "is_connected", None)
+        except (AttributeError, ValueError):
+            is_connected = None
+        try:
+            if not (is_connected() if callable(is_connected) else getattr(instance, "connection", None) is not None):
+                return False
+            instance.disconnect()
+        except Exception as error:
+            Logger.warning(g_warning_msg[15].format(uid=uid, error=error))
+        return True
+
+    @classmethod
+    def _rename(cls, uid: int, name: str, names: dict) -> None:
+        old_name: str = cls.__store[uid].get("name", None)
+        if old_name in names:
+            names[old_name].pop(uid, None)
+            if not names[old_name]:
+                del names[old_name]
+        names.setdefault(name, {})[uid] = None
+        cls.__store[uid]["name"] = name
+
+    def reload_model(self, uid: int, data: dict, filename: str | pathlib.Path = None) -> ReloadReport:
+        """
+        Applies a new model to a registered device, changing only what differs
+        from the model it was built with.
+
+        * Unchanged interfaces are kept with their connections.
+        * Interfaces whose changes don't touch their connection (see
+          :meth:`InterfaceBase.reconfigure`) are reconfigured in place.
+        * Other changed interfaces are replaced, the new instance connects if
+          the old one was connected.
+        * Interfaces missing from the new model are disconnected and removed,
+          new ones are created.
+
+        A device whose class changed is rebuilt from scratch.
+        """
+        report: ReloadReport = ReloadReport()
+        missing: object = object()
+        with self.__lock:
+            if uid not in self.__devices:
+                raise ValueError(g_error_msg[6].format(uid=uid, keys=self.devices) + " type: Device")
+            entry: dict = self.__store[uid]
+            filename = entry["filename"] if filename is None else str(filename)
+            device_name, section = next(iter(data.items()))
+            if entry.get("class_name", None) != device_name or "model" not in entry:
+                # the old connections are closed, the new interfaces of the same classes connect again.
+                reconnect: set[str] = {
+                    self.__store[interface_uid].get("class_name", None)
+                    for interface_uid in list(self.__device_interfaces.get(uid, {}))
+                    if self._close_interface(interface_uid) is True
+                }
+                self.remove_device_by_UID(uid)
+                device_instance, interfaces = self._create_instances(data)
+                proxy: weakref.proxy = self._register_instances(device_instance,
+                                                                [future.result() for future in interfaces], filename,
+                                                                data)
+                report.replaced[uid] = proxy.uid
+                for interface_uid in self.__device_interfaces.get(proxy.uid, {}):
+                    class_name: str = self.__store[interface_uid].get("class_name", None)
+                    if class_name not in reconnect:
+                        continue
+                    try:
+                        self.__interfaces[interface_uid].connect()
+                    except Exception as error:
+                        report.errors.append(g_error_msg[16].format(name=class_name, type_=type(error).__name__,
+                                                                    error=error))
+                return report
+
+            # ---- device attributes ----
+            device: object = self.__devices[uid]
+            model: dict = {key: section[key] for key in section if key != "interfaces"}
+            changes: dict = {key: value for key, value in model.items() if entry["model"].get(key, missing) != value}
+            for key, value in changes.items():
+                setattr(device, key, copy.deepcopy(value))
+            if "name" in changes:
+                self._rename(uid, changes["name"], self.__device_names)
+            entry["model"] = copy.deepcopy(model)
+            (report.reconfigured if changes else report.kept).append(uid)
+
+            # ---- interfaces ----
+            current: dict[str, int] = {
+                self.__store[interface_uid].get("class_name", None): interface_uid
+                for interface_uid in self.__device_interfaces.get(uid, {})
+            }
+            models: dict = section.get("interfaces", None) or {}
+            for class_name, interface_uid in current.items():
+                if class_name not in models:
+                    self._close_interface(interface_uid)
+                    self.remove_interface_by_UID(interface_uid)
+                    report.removed.append(interface_uid)
+            for class_name, interface_model in models.items():
+                interface_uid = current.get(class_name, None)
+                if interface_uid is not None:
+                    interface_entry: dict = self.__store[interface_uid]
+                    old_model: dict = interface_entry.get("model", None) or {}
+                    if old_model == interface_model:
+                        report.kept.append(interface_uid)
+                        continue
+                    changes = {
+                        key: value
+                        for key, value in interface_model.items()
+                        if key != "name" and old_model.get(key, missing) != value
+                    }
+                    instance: object = self.__interfaces[interface_uid]
+                    try:
+                        reconfigure: typing.Callable = getattr(instance, "reconfigure", None)
+                    except (AttributeError, ValueError):
+                        reconfigure = None
+                    # removed keys have no value to go back to, the interface is created again.
+                    if set(old_model) <= set(interface_model) and reconfigure is not None and reconfigure(**changes):
+                        name: str = interface_model.get("name", None)
+                        if name is not None and name != interface_entry.get("name", None):
+                            device.remove_interface(interface_entry["name"])
+                            instance.name = name
+                            self._rename(interface_uid, name, self.__interface_names)
+                            device.add_interface(name, self.get_reference_by_UID(interface_uid))
+                        interface_entry["model"] = copy.deepcopy(interface_model)
+                        report.reconfigured.append(interface_uid)
+                        continue
+                    connected: bool = self._close_interface(interface_uid)
+                    self.remove_interface_by_UID(interface_uid)
+                else:
+                    connected = False
+                try:
+                    interface_cls = DTAF.factory.Factory.get_class_by_name(class_name)
+                    new_uid: int = self._register_interface(device, uid, interface_cls(**interface_model), filename,
+                                                            class_name, interface_model)
+                except Exception as error:
+                    report.errors.append(g_error_msg[16].format(name=class_name, type_=type(error).__name__,
+                                                                error=error))
+                    if interface_uid is not None:
+                        report.removed.append(interface_uid)
+                    continue
+                if interface_uid is None:
+                    report.created.append(new_uid)
+                    continue
+                report.replaced[interface_uid] = new_uid
+                if connected is True:
+                    try:
+                        self.__interfaces[new_uid].connect()
+                    except Exception as error:
+                        report.errors.append(g_error_msg[16].format(name=class_name, type_=type(error).__name__,
+                                                                    error=error))
+        return report
+
+    def reload_file(self, filename: str | pathlib.Path) -> ReloadReport:
+        """
+        Reloads a model file, applying only the differences to the devices
+        loaded from it (see :meth:`reload_model`).
+
+        The file is loaded if no device comes from it. Raises RuntimeError if
+        the new model is invalid, nothing is changed in that case.
+        """
+        filename = pathlib.Path(filename)
+        if filename.exists() is False:
+            raise ValueError(g_error_msg[4])
+        elif filename.is_dir() is True:
+            raise ValueError(g_error_msg[5])
+        _, data, errors, warnings = parse_model_file(filename)
+        if errors:
+            raise RuntimeError(errors[0])
+        report: ReloadReport = ReloadReport()
+        uids: list[int] = self.get_devices_by_file(filename)
+        if not uids:
+            device_instance, interfaces = self._create_instances(data)
+            proxy: weakref.proxy = self._register_instances(device_instance,
+                                                            [future.result() for future in interfaces], str(filename),
+                                                            data)
+            report.created.append(proxy.uid)
+        for uid in uids:
+            report.update(self.reload_model(uid, data))
+        Logger.info(g_warning_msg[13].format(filename=filename, report=report.summary()))
+        for message in report.errors:
+            Logger.error(f"Builder: reload_file :: {filename}: {message}")
+        return report
+
+    def watch_models(self,
+                     paths: str | pathlib.Path | typing.Iterable[str | pathlib.Path],
+                     interval: float = 1.0,
+                     patterns: typing.Iterable[str] = ("*.yaml", "*.yml"),
+                     load_new: bool = False) -> ModelWatcher:
+        """
+        Starts a :class:`ModelWatcher` reloading the changed model files of
+        `paths` (files or folders).
+        """
+        if isinstance(paths, (str, pathlib.Path)):
+            paths = [paths]
+        watcher: ModelWatcher = ModelWatcher(self, paths, interval=interval, patterns=patterns, load_new=load_new)
+        with self.__lock:
+            self.__watchers.append(watcher)
+        watcher.start()
+        Logger.debug(g_debug_msg[5].format(paths=watcher.paths, interval=interval))
+        return watcher
+
+    def stop_watching(self, timeout: float = None) -> None:
+        """
+        Stops every model watcher.
+        """
+        with self.__lock:
+            watchers: list[ModelWatcher] = self.__watchers[:]
+            self.__watchers.clear()
+        for watcher in watchers:
+            watcher.stop(timeout)
+
+    def call_garbage_collector(self, generation: int = 2, background: bool = False):
         """
         Cleanup method to request the recollection of the garbage collector
         module.
+
+        With `background` the collection runs in the maintenance thread (or
+        a short lived thread if the maintenance isn't running), so the caller
+        never waits for it.
         """
-        #TODO: improve this method to run asynchronously.
         gc.enable()
-        gc.collect()
-        pass
+        if background is False:
+            gc.collect(generation)
+        elif self.maintenance is not None and self.maintenance.is_alive():
+            self.maintenance.request_collection(generation)
+        else:
+            threading.Thread(target=gc.collect, args=(generation, ), name="DTAF-BuilderGC", daemon=True).start()
 
     @classmethod
-    def verify_registry(cls):
+    def _discard(cls, uid: int) -> None:
+        # removes a dead entry from the tree and every index.
+        Logger.warning(g_warning_msg[0].format(uid=uid))
+        if uid in cls.__devices:
+            Logger.warning(g_warning_msg[1])
+            cls._unindex(uid, cls.__devices[uid], cls.__device_names)
+            cls.__device_interfaces.pop(uid, None)
+            del cls.__devices[uid]
+        if uid in cls.__interfaces:
+            Logger.warning(g_warning_msg[2])
+            cls._unindex(uid, cls.__interfaces[uid], cls.__interface_names)
+            del cls.__interfaces[uid]
+        cls.__store.pop(uid, None)
+
+    @classmethod
+    def clean_dead_entries(cls, batch_size: int = None) -> int:
+        """
+        Removes the entries marked dead by their finalizers.
+
+        Cleans up to `batch_size` entries (all of them if None), returns the
+        number of removed entries.
+        """
+        count: int = 0
+        while cls.__dead and (batch_size is None or count < batch_size):
+            uid: int = cls.__dead.popleft()
+            with cls.__lock:
+                if uid in cls.__store:
+                    cls._discard(uid)
+                    count += 1
+        return count
+
+    @classmethod
+    def verify_registry(cls, batch_size: int = None) -> bool:
         """
         Verifies that the storage values are set correctly, and no children are left without a parent.
 
         This method will look up all memories storage and clean after an object has been discarded.
         It will return True when the scan has been successful, False if there was an error.
 
+        With `batch_size` only the next `batch_size` entries are verified, each
+        call continues where the previous one stopped (see
+        :class:`RegistryMaintenance`).
+
         .. warning::
             This method will look the whole tree table and try to find any
             missing or broken object reference in memory, if the reference is
             found dead, the method will remove it from the tree.
         """
-        doc: str = ''
         type_: str = ''
-        keys = cls.__store[:]
+        result: bool = True
+        with cls.__lock:
+            if batch_size is None:
+                keys: list[int] = list(cls.__store)
+            else:
+                if cls.__sweep_position >= len(cls.__sweep_keys):
+                    cls.__sweep_keys = list(cls.__store)
+                    cls.__sweep_position = 0
+                keys = cls.__sweep_keys[cls.__sweep_position:cls.__sweep_position + batch_size]
+                cls.__sweep_position += len(keys)
         for key in keys:
             try:
-                type_ = cls.__store[key]["type"]
-                if type_ == 'device':
-                    data = cls.__devices[key]
-                elif type_ == 'interface':
-                    data = cls.__interfaces[key]
-                else:
-                    raise ValueError(g_error_msg[3].format(uid=key, type_=type_))
-                if data:
-                    # we check contents of the object to verify that the object is still alive
-                    doc = data.__doc__
-                    continue
-            except ReferenceError as error:
-                #TODO: add here log message
-                Logger.warning(g_warning_msg[0].format(uid=key))
-                del cls.__store[key]
-                # removes reference object from list.
-                if key in cls.__devices:
-                    Logger.warning(g_warning_msg[1])
-                    del cls.__devices[key]
-
-                if key in cls.__interfaces:
-                    Logger.warning(g_warning_msg[2])
-                    del cls.__interfaces[key]
-
+                with cls.__lock:
+                    if key not in cls.__store:
+                        continue
+                    type_ = cls.__store[key]["type"]
+                    if type_ == 'device':
+                        memory_section: dict = cls.__devices
+                    elif type_ == 'interface':
+                        memory_section = cls.__interfaces
+                    else:
+                        raise ValueError(g_error_msg[3].format(uid=key, type_=type_))
+                    if key not in memory_section:
+                        Logger.error(g_error_msg[8].format(uid=key, memory_section=f"__{type_}s"))
+                        del cls.__store[key]
+                        continue
+                    try:
+                        # we check contents of the object to verify that the object is still alive
+                        memory_section[key].__doc__
+                    except ReferenceError:
+                        cls._discard(key)
             except Exception as error:
-                #TODO: Adde error log here.
                 Logger.error(g_error_msg[2].format(type_=type(error), error=error, traceback=traceback.format_exc()))
-                pass
+                result = False
+        return result
+
+    def start_maintenance(self,
+                          interval: float = None,
+                          batch_size: int = None,
+                          gc_interval: float = None,
+                          gc_generation: int = None,
+                          gc_thresholds: typing.Iterable[int] = None) -> RegistryMaintenance:
+        """
+        Starts the background registry maintenance (see
+        :class:`RegistryMaintenance`), the arguments default to the
+        ``Config.Builder`` entries.
+
+        Returns the running maintenance if it was already started.
+        """
+        with self.__lock:
+            if self.maintenance is not None and self.maintenance.is_alive():
+                return self.maintenance
+            config = Config.Builder
+            maintenance: RegistryMaintenance = RegistryMaintenance(
+                self,
+                interval=interval or config.maintenance_interval or 1.0,
+                batch_size=batch_size or config.maintenance_batch_size,
+                gc_interval=config.gc_interval if gc_interval is None else gc_interval,
+                gc_generation=config.gc_generation if gc_generation is None else gc_generation,
+                gc_thresholds=gc_thresholds or config.gc_thresholds or None)
+            BuilderClass.maintenance = maintenance
+            maintenance.start()
+        Logger.debug(g_debug_msg[2].format(interval=maintenance.interval,
+                                           batch_size=maintenance.batch_size,
+                                           gc_interval=maintenance.gc_interval))
+        return maintenance
+
+    def stop_maintenance(self, timeout: float = None) -> None:
+        """
+        Stops the background registry maintenance.
+        """
+        with self.__lock:
+            maintenance: RegistryMaintenance = self.maintenance
+            BuilderClass.maintenance = None
+        if maintenance is not None:
+            maintenance.stop(timeout)
 
     def get_reference_by_UID(self, uid: int = None) -> weakref.proxy:
         """
@@ -448,35 +1671,88 @@ class BuilderClass():
         # checks the model has the type attribute in the entry.
         if type_ is None:
             raise RuntimeError(g_error_msg[7].format(uid=uid, missing_attrs="type"))
+        # the proxy of each entry is created once.
+        elif uid in self.__proxies:
+            return self.__proxies[uid]
+        # weak entries are already proxies.
+        elif self._is_proxy(self.__devices.get(uid, self.__interfaces.get(uid, None))):
+            proxy = self.__devices.get(uid, self.__interfaces.get(uid, None))
         # checks if the entry belongs to a device.
         elif type_ == 'device':
             if uid not in self.__devices:
                 raise RuntimeError(g_error_msg[8].format(uid=uid, memory_section="__devices"))
-            return weakref.proxy(self.__devices[uid], lambda *x: self.remove_device_by_uid)
+            proxy = weakref.proxy(self.__devices[uid], lambda _, uid=uid: self._drop_proxy(uid))
         # checks if the entry belongs to an interface.
         elif type_ == 'interface':
             if uid not in self.__interfaces:
                 raise RuntimeError(g_error_msg[8].format(uid=uid, memory_section="__interfaces"))
-            return weakref.proxy(self.__interfaces[uid], lambda *x: self.remove_device_by_uid)
+            proxy = weakref.proxy(self.__interfaces[uid], lambda _, uid=uid: self._drop_proxy(uid))
         else:
             raise NotImplementedError(g_warning_msg[4].format(uid=uid, type_=type_) + " entry: " +
                                       str(self.__store[uid]) + "</END>")
-        return None
+        self.__proxies[uid] = proxy
+        self.__ids[id(proxy)] = uid
+        return proxy
 
     def get_UID_by_reference(self, proxy_object: weakref.proxy) -> int:
         """
-        Returns the object's UID based on the proxy object.
+        Returns the object's UID based on the proxy object (or the instance).
 
-        Ideally we would try to check the objec internal memory (uid).
+        Returns None if the object isn't registered.
         """
-        uid: int = None
-        for uid in self.__devices:
-            if self.__devices[uid] == proxy_object:
-                return uid
-        for uid in self.__interfaces:
-            if self.__devices[uid] == proxy_object:
+        uid: int = self.__ids.get(id(proxy_object), None)
+        if uid is not None:
+            return uid
+        # other proxies of the instance, checked through the internal memory (uid).
+        try:
+            uid = proxy_object.uid
+        except (AttributeError, ValueError, ReferenceError):
+            return None
+        instance: object = self.__devices.get(uid, self.__interfaces.get(uid, None))
+        try:
+            if instance is not None and instance == proxy_object:
                 return uid
-        return uid
+        except ReferenceError:
+            pass
+        return None
+
+    def get_UIDs_by_name(self, name: str, type_: str = None) -> list[int]:
+        """
+        Returns the UIDs of the devices and interfaces with the given name, in
+        registration order.
+
+        `type_` may be "device" or "interface" to only look for one kind.
+        """
+        uids: list[int] = []
+        if type_ in (None, "device"):
+            uids += self.__device_names.get(name, {})
+        if type_ in (None, "interface"):
+            uids += self.__interface_names.get(name, {})
+        return uids
+
+    def get_UID_by_name(self, name: str, type_: str = None, duid: int = None) -> int:
+        """
+        Returns the UID of the only device or interface with the given name.
+
+        Interface names are only unique within their device, give the device
+        UID (`duid`) to look for the interface of one device.
+
+        Raises ValueError if there isn't exactly one match.
+        """
+        uids: list[int] = self.get_UIDs_by_name(name, "interface" if duid is not None else type_)
+        if duid is not None:
+            uids = [uid for uid in uids if uid in self.__device_interfaces.get(duid, {})]
+        if len(uids) != 1:
+            raise ValueError(g_error_msg[18].format(type_=type_ or "entry", name=name, uids=uids))
+        return uids[0]
+
+    def get_interfaces_by_device(self, duid: int) -> list[int]:
+        """
+        Returns the UIDs of the interfaces bound to a device.
+        """
+        if duid not in self.__devices:
+            raise ValueError(g_error_msg[6].format(uid=duid, keys=self.devices) + " type: Device")
+        return list(self.__device_interfaces.get(duid, {}))
 
     def remove_device_by_UID(self, uid: int) -> bool:
         """
@@ -484,19 +1760,19 @@ class BuilderClass():
 
         Removes all interface connections from the device's memory links and builders instance.
         """
-        device: object = None
         interfaces: list[int] = []
-        pass
-        if uid not in self.__devices:
-            raise ValueError(g_error_msg[6].format(uid=uid, keys=self.devices) + " type: Interface")
-        device = self.get_reference_byeteng_UID(uid)
-        interfaces = device.get_interface_list()[:]
-        del self.__devices[uid]
-        if uid in self.__store:
-            del self.__store[uid]
-        for interface_id in interfaces:
-            self.remove_interface_by_UID(interface_id)
-        return True
+        with self.__lock:
+            if uid not in self.__devices:
+                raise ValueError(g_error_msg[6].format(uid=uid, keys=self.devices) + " type: Device")
+            interfaces = self.get_interfaces_by_device(uid)
+            for interface_id in interfaces:
+                self.remove_interface_by_UID(interface_id)
+            self._unindex(uid, self.__devices[uid], self.__device_names)
+            self.__device_interfaces.pop(uid, None)
+            del self.__devices[uid]
+            if uid in self.__store:
+                del self.__store[uid]
+            return True
 
     def remove_interface_by_UID(self, uid: int) -> bool:
         """
@@ -505,14 +1781,21 @@ class BuilderClass():
         It will discard any object from the internal structure and their links on
         the main db.
         """
-        if uid not in self.__interfaces:
-            raise ValueError(g_error_msg[6].format(uid=uid, keys=self.interfaces) + " type: Interface")
-        del self.__interfaces[uid]
-        if uid in self.__store:
-            del self.__store[uid]
-        else:
-            Logger.warning(g_warning_msg[5].format(uid=uid) + " type: Interface")
-        return True
+        with self.__lock:
+            if uid not in self.__interfaces:
+                raise ValueError(g_error_msg[6].format(uid=uid, keys=self.interfaces) + " type: Interface")
+            # unlinks the interface from its device.
+            device_uid: int = self.__store.get(uid, {}).get("host_device", None)
+            name: str = self.__store.get(uid, {}).get("name", None)
+            if device_uid in self.__devices and name is not None:
+                self.__devices[device_uid].remove_interface(name)
+            self._unindex(uid, self.__interfaces[uid], self.__interface_names)
+            del self.__interfaces[uid]
+            if uid in self.__store:
+                del self.__store[uid]
+            else:
+                Logger.warning(g_warning_msg[5].format(uid=uid) + " type: Interface")
+            return True
 
     def remove_interface_by_proxy(self, proxy_object: weakref.proxy) -> bool:
         """
@@ -536,5 +1819,9 @@ class BuilderClass():
 
 
 Builder = BuilderClass()
+atexit.register(Builder.stop_maintenance)
+atexit.register(Builder.stop_watching)
+if Config.Builder.maintenance_interval:
+    Builder.start_maintenance()
 
-__all__ = ("Builder", )
+__all__ = ("Builder", "LoadReport", "ModelCache", "ModelWatcher", "RegistryMaintenance", "ReloadReport")
@@ -5,7 +5,9 @@ import copy
 import logging
 import traceback
 
-from DTAF.logger import InterfaceLogger as Logger, SystemLogger
+from DTAF.logger import InterfaceLogger as Logger, SystemLogger, Payload, hot_path_logger
+
+_hot = hot_path_logger(__name__, Logger)
 
 
 class InterfaceBase:
@@ -20,11 +22,21 @@ class InterfaceBase:
         logfile: The filename of the log file for the interface, initialized to None.
     """
 
-    __store: dict = {}
+    __store: dict = None
     """
     Memory Storage area.
 
     This is where we store any non standard attributes by name and value.
+    Each instance gets its own dictionary from :meth:`__new__`, before any
+    ``__init__`` runs.
+    """
+
+    __fields: frozenset[str] = frozenset()
+    """
+    Names declared by the class (attributes, properties and methods).
+
+    Assigning one of them sets an instance attribute, any other name goes to
+    the ``__store``. Cached per class, see :meth:`refresh_fields`.
     """
 
     connection = None
@@ -62,6 +74,16 @@ class InterfaceBase:
     Both interface and device IDs can't be the same number. they're from the same scale.
     """
 
+    connection_keys: tuple[str] = ("port", "host", "hostname", "url", "ip_address", "mac_address", "baudrate",
+                                   "bitrate", "channel", "bus_number", "device_address", "device_number", "username",
+                                   "password", "mode", "max_speed_hz", "type_of_communication", "type_of_ip", "fileno")
+    """
+    Model keys used to open the connection.
+
+    Changing any of them needs a new interface instance, see
+    :meth:`reconfigure`.
+    """
+
     __uid: int = None
     """
     Internal storage of the UID.
@@ -79,19 +101,45 @@ class InterfaceBase:
             "interface_class": self.__class__
         })
 
+    def __new__(cls, *args, **kwargs):
+        instance = super().__new__(cls)
+        instance.__store = {}
+        return instance
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.refresh_fields()
+
+    @classmethod
+    def refresh_fields(cls) -> frozenset[str]:
+        """
+        Caches the names declared by the class.
+
+        Called when the class is created, call it again after adding class
+        attributes at runtime (the subclasses keep their own cache).
+        """
+        cls.__fields = frozenset(dir(cls))
+        return cls.__fields
+
     def __getattr__(self, attr: str) -> typing.Any:
-        if attr in self.__store:
+        if self.__store is not None and attr in self.__store:
             return self.__store[attr]
         raise ValueError("InterfaceBase: getattr :: Unable to find attribute `{}`, not found in __store.".format(attr))
 
     def __setattr__(self, attr: str, value: typing.Any) -> None:
-        if attr not in dir(self):
-            # TODO: ADD LOG MESSAGE HERE TO INDICATE WE ADDED A NEW ATTRIBUTE
-            # if attr not in self.__store:
-            #     Logger.warning("Attribute [{name}] not found in __store, assigning memory space for value: {value}".format (name = attr, value = value))
-            self.__store[attr] = value
+        if attr in self.__fields or attr in self.__dict__:
+            super().__setattr__(attr, value)
             return
-        super().__setattr__(attr, value)
+        # TODO: ADD LOG MESSAGE HERE TO INDICATE WE ADDED A NEW ATTRIBUTE
+        # if attr not in self.__store:
+        #     Logger.warning("Attribute [{name}] not found in __store, assigning memory space for value: {value}".format (name = attr, value = value))
+        self.__store[attr] = value
+
+    def __delattr__(self, attr: str) -> None:
+        if attr in self.__store:
+            del self.__store[attr]
+            return
+        super().__delattr__(attr)
 
     @property
     def uid(self) -> None:
@@ -204,14 +252,26 @@ class InterfaceBase:
         kwargs["name"] = kwargs.get("name", self.get_new_interface_name(interface_counter))
 
         self.connection = None
-        self.__store = {}
 
         for attr in kwargs:
-            if attr in dir(self) and not attr in ["logfile", "connection", 'uid', 'duid']:
+            if attr in self.__fields and not attr in ["logfile", "connection", 'uid', 'duid']:
                 setattr(self, attr, kwargs[attr])
                 continue
             self.__store[attr] = kwargs[attr]
 
+    def reconfigure(self, **changes) -> bool:
+        """
+        Applies model changes to the live interface, keeping its connection.
+
+        Returns False without changing anything if any of the changed keys is
+        in :attr:`connection_keys`, the interface must be created again.
+        """
+        if any(key in self.connection_keys for key in changes):
+            return False
+        for key, value in changes.items():
+            setattr(self, key, value)
+        return True
+
     def connect(self) -> None:
         """
         Connect to the interface.
@@ -294,11 +354,12 @@ class InterfaceBase:
         """
         try:
             data = self.read_impl()
-            self.logger.debug("InterfaceBase: read :: Read {} bytes from {}, data: {}".format(
-                len(data), self.connection, data))
+            if _hot.debug:
+                self.logger.debug("InterfaceBase: read :: Read %d bytes from %s, data: %s", len(data), self.connection,
+                                  Payload(data, direction="rx"))
             return data
         except Exception as error:
-            self.logger.exception("InterfaceBase: read :: Unable to read from interface.", error)
+            self.logger.exception("InterfaceBase: read :: Unable to read from interface.", exc_info=error)
             raise
 
     def read_impl(self) -> bytes:
@@ -333,8 +394,9 @@ class InterfaceBase:
         """
         try:
             self.write_impl(data)
-            self.logger.debug("InterfaceBase: write :: Wrote {} bytes to {}, data: {}".format(
-                len(data), self.connection, data))
+            if _hot.debug:
+                self.logger.debug("InterfaceBase: write :: Wrote %d bytes to %s, data: %s", len(data), self.connection,
+                                  Payload(data, direction="tx"))
         except Exception as error:
             self.logger.exception("InterfaceBase: write :: Unable to write into interface.", exc_info=error)
             raise
@@ -376,3 +438,6 @@ class InterfaceBase:
 
     def __exit__(self):
         self.disconnect()
+
+
+InterfaceBase.refresh_fields()
@@ -8,24 +8,29 @@ import string
 import pathlib
 import weakref
 import os
+import typing
+import queue
+import atexit
+import threading
+import logging.handlers
+import re
+import time
+import math
+import gzip
+import bz2
+import lzma
+import shutil
+import concurrent.futures
+import copy
 
 #BOOTLOADER LOGGER:
 
 Logger = logging.getLogger("BOOTLOADER")
 Logger.setLevel(logging.DEBUG)
-Logger.debug("Test Logging 0")
 
-# only adds a file handler if we're not running on documentation mode.
+# the startup log file handler is added by DTAF.init (see init_logging).
 import DTAF
 
-if DTAF.SPHINX_DOC_MODE is False:
-    # We only add a file handler if we're not in documentation mode.
-
-    Logger.addHandler(
-        logging.FileHandler((pathlib.Path("~/TAF/DTAF-Startup log.txt").expanduser().resolve()), mode="a"), )
-
-Logger.warning(
-    "\n\n--- Logger starts --- {dt}\n".format(dt=datetime.datetime.now().strftime("%Y-%m-%d YMD :: %Hh-%Mm-%Ss")))
 #imports the logger configurations.
 
 import DTAF.config.logger_config
@@ -33,6 +38,7 @@ from DTAF.config.logger_config import _format_map
 from DTAF.config.logger_config import _format_map_device
 from DTAF.config.logger_config import _format_map_interface
 from DTAF.config import Config
+from DTAF.structured_log import StructuredLogHandler
 
 # checks if we're running on terinal or in background.
 import sys
@@ -47,7 +53,10 @@ InterfaceLogger: logging.Logger = None
 if sys.stdin and len(os.getenv('PSModulePath', '').split(os.pathsep)) >= 3:
     g_running_on_terminal = True
 
-Logger.info(f"Running on terminal: {g_running_on_terminal}")
+_logging_initialized: bool = False
+"""
+True once :func:`init_logging` added the handlers.
+"""
 
 # Set Globals #
 #--------------
@@ -60,6 +69,7 @@ g_error_msg: tuple[str] = (
     "Logger: Configuration Error, the configuration `{conf_name}`. {conf_msg}",  # 4
     "Logger: invalid format key, logger `{logger_name}` uses the key index [{index}], while the valid keys are {keys}",  # 5
     "Logger: Invalid format stringg, missing `%` format parametters. format: `{ftm}`",  # 6
+    "Logger: Invalid log compression `{compression}`, valid compressions: {valid}",  # 7
     "Logger: ",  # x
 )
 """
@@ -71,6 +81,8 @@ g_warning_msg: tuple[str] = (
     "Logger: Missing format field name: {fname}",  # 1
     "Logger: Invalid `log_dir` value; it's a file, using parent path instead. value: `{path}`",  # 2
     "Logger: New folder has been assigned as logging file home, creating parents if necessary. path: `{path}`",  # 3
+    "Logger: Unable to archive the rotated log `{path}`. ERROR: {error}",  # 4
+    "Logger: Rotating log template `{template}` doesn't contain the logger name, `{{name}}` was added. name: {name}",  # 5
     "Logger: ",  # x
 )
 """
@@ -100,6 +112,13 @@ def trace(self, message, *args, **kws):
     self._log(9, message, args, **kws)
 
 
+def adapter_trace(self, message, *args, **kws):
+    """
+    Trace function of the logger adapters.
+    """
+    self.log(9, message, *args, **kws)
+
+
 def add_trace_level():
     """
     Trace level adder.
@@ -111,10 +130,11 @@ def add_trace_level():
         logging.addLevelName(9, "TRACE")
     if hasattr(logging.Logger, "trace") is False:
         logging.Logger.trace = trace
+    if hasattr(logging.LoggerAdapter, "trace") is False:
+        logging.LoggerAdapter.trace = adapter_trace
 
 
-if "TRACE" not in _nameToLevel:
-    add_trace_level()
+add_trace_level()
 #MO
 # ROOT LOGGER:
 # |-> Device Logger
@@ -227,7 +247,7 @@ def create_logger(logname: str, level: str):
     returns the logger that was created.
     """
     log = logging.getLogger(logname)
-    log.setLevel(level)
+    set_level(log, level)
     ref = weakref.ref(log)
     add_log_reg(logname, ref)
     return log
@@ -257,6 +277,49 @@ def config_terminal_handler(frmt: str) -> logging.StreamHandler:
     return console_handler
 
 
+def filename_pattern(filename: str, name: str = "Unamed_Logger") -> re.Pattern:
+    """
+    Returns the pattern matching every file produced by a filename template
+    (see :func:`format_filename`), compressed segments included.
+
+    The ``id`` group of the match holds the iteration number.
+    """
+    parts: list[str] = []
+    for literal, field, _, _ in string.Formatter().parse(filename):
+        parts.append(re.escape(literal))
+        if field is None:
+            continue
+        if field == "id":
+            parts.append(r"(?P<id>\d+)" if "(?P<id>" not in "".join(parts) else r"\d+")
+        elif field == "name":
+            parts.append(re.escape(str(name)))
+        else:
+            parts.append(".+?")
+    suffixes: str = "|".join(re.escape(suffix) for suffix in _compression_suffixes.values())
+    return re.compile("".join(parts) + f"(?:{suffixes})?$")
+
+
+def next_file_id(log_dir: str | pathlib.Path, filename: str, name: str = "Unamed_Logger") -> int:
+    """
+    Returns the next iteration number of a filename template in a folder: the
+    highest ``{id}`` found plus one, 0 if there's none.
+    """
+    path: pathlib.Path = pathlib.Path(log_dir).expanduser()
+    pattern: re.Pattern = filename_pattern(filename, name)
+    if path.is_dir() is False or "id" not in pattern.groupindex:
+        return 0
+    ids: list[int] = [int(match["id"]) for match in map(pattern.match, os.listdir(path)) if match]
+    return max(ids, default=-1) + 1
+
+
+def _file_id(kwargs: dict) -> str:
+    if "id" in kwargs:
+        return str(kwargs["id"])
+    if "log_dir" in kwargs:
+        return str(next_file_id(kwargs["log_dir"], kwargs.get("filename", ""), kwargs.get("name", "Unamed_Logger")))
+    return "0"
+
+
 def format_filename(**kwargs: dict) -> str:
     """
     Formats the filename based on the pressence of the different supported key
@@ -266,7 +329,8 @@ def format_filename(**kwargs: dict) -> str:
         name: name of the logger as in the config file.
         filename: str : name of the file, with the format placeholders.
         date: datetime.datetime : datetime object to use as source for the strftime method.
-        id: int : Numeric ID of the file iteration. it will be based on the sum of al the files in the folder.
+        id: int : Numeric ID of the file iteration. If missing and `log_dir` is given, the next free ID of the folder is used (see :func:`next_file_id`).
+        log_dir: str : folder where the file is going to be written.
         * custom arguments: typing.any : Add any argument as you desire to parse methods to contorl and format the source. use functools.partial or lamda functions.
 
     Supported keyfields:
@@ -294,11 +358,11 @@ def format_filename(**kwargs: dict) -> str:
     format_dict: dict = Default_format_dictionary({
         "std_date": functools.partial(date.strftime, "%Y-%m-%d %H-%M-%S"),
         "usa_date": functools.partial(date.strftime, "%m-%d-%Y %H-%M-%S"),
-        "id": functools.partial(kwargs.get, "id", "0"),
+        "id": functools.partial(_file_id, {
+            **kwargs, "filename": filename
+        }),
         "name": functools.partial(kwargs.get, "name", "Unamed_Logger"),
-    }
-                                                  # TODO: ADD ID ASSIGNATION METHOD
-                                                  )
+    })
     Logger.debug(f"Logger: filename = `{filename}`")
     buffer: dict = {}
     for key in format_keys:
@@ -311,14 +375,227 @@ def format_filename(**kwargs: dict) -> str:
     return filename
 
 
+class BatchFileHandler(logging.FileHandler):
+    """
+    File handler able to defer its flushes.
+
+    While ``batched`` is True (set by the asynchronous log writer, see
+    :func:`start_async_logging`) the records are only written into the stream
+    buffer, the writer thread flushes once per batch of records.
+    """
+
+    batched: bool = False
+    """
+    True if the flushes are managed by the log writer.
+    """
+
+    def flush(self) -> None:
+        if self.batched is False:
+            super().flush()
+
+    def flush_batch(self) -> None:
+        """
+        Flushes the stream, even in batched mode.
+        """
+        super().flush()
+
+    def close(self) -> None:
+        self.batched = False
+        super().close()
+
+
+_compression_suffixes: dict[str, str] = {
+    "gzip": ".gz",
+    "bz2": ".bz2",
+    "lzma": ".xz",
+}
+"""
+File suffix of each supported compression of the rotated logs.
+"""
+
+_compression_openers: dict[str, typing.Callable] = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "lzma": lzma.open,
+}
+
+_archive_executor: concurrent.futures.ThreadPoolExecutor = None
+_archive_executor_lock: threading.Lock = threading.Lock()
+
+
+def get_archive_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """
+    Returns the background thread that compresses the rotated logs.
+    """
+    global _archive_executor
+    with _archive_executor_lock:
+        if _archive_executor is None:
+            _archive_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1,
+                                                                      thread_name_prefix="DTAF-log-archive")
+        return _archive_executor
+
+
+def compress_log(path: str | pathlib.Path, compression: str = "gzip") -> pathlib.Path:
+    """
+    Compresses a log file next to it and removes the original.
+
+    Returns the path of the compressed file.
+    """
+    if compression not in _compression_openers:
+        raise ValueError(g_error_msg[7].format(compression=compression, valid=tuple(_compression_openers)))
+    path = pathlib.Path(path)
+    target: pathlib.Path = path.with_name(path.name + _compression_suffixes[compression])
+    temp: pathlib.Path = target.with_name(target.name + ".tmp")
+    with open(path, "rb") as source, _compression_openers[compression](temp, "wb") as destination:
+        shutil.copyfileobj(source, destination, 1024 * 1024)
+    os.replace(temp, target)
+    path.unlink()
+    return target
+
+
+class RotatingLogHandler(BatchFileHandler):
+    """
+    Log file split in segments by size and/or time.
+
+    Each segment is named after the filename template (see
+    :func:`format_filename`), with the next free ``{id}`` of the folder. The
+    rotated segments are compressed (``gzip``, ``bz2`` or ``lzma``) in a
+    background thread, then the retention limits are applied: only the last
+    ``max_files`` segments (current one included) younger than
+    ``retention_days`` are kept. 0 disables a limit.
+
+    Templates without an ``{id}`` placeholder get one before the extension,
+    so the segments never overwrite each other. Likewise, templates without
+    the logger name get a ``{name}`` placeholder (and a warning), otherwise
+    the loggers sharing the folder would number and delete each other's
+    segments.
+    """
+
+    def __init__(self,
+                 log_dir: str | pathlib.Path,
+                 template: str,
+                 name: str,
+                 mode: str = "w",
+                 max_bytes: int = 0,
+                 interval: float = 0,
+                 compression: str = "",
+                 max_files: int = 0,
+                 retention_days: float = 0,
+                 filename: str = "") -> None:
+        if "{name}" not in template and str(name) not in template:
+            Logger.warning(g_warning_msg[5].format(template=template, name=name))
+            root, extension = os.path.splitext(template)
+            template = f"{root}.{{name}}{extension}"
+        if "{id}" not in template:
+            root, extension = os.path.splitext(template)
+            template = f"{root}.{{id}}{extension}"
+        if compression and compression not in _compression_openers:
+            raise ValueError(g_error_msg[7].format(compression=compression, valid=tuple(_compression_openers)))
+        self.log_dir = pathlib.Path(log_dir).expanduser()
+        self.template = template
+        self.log_name = name
+        self.pattern: re.Pattern = filename_pattern(template, name)
+        self.max_bytes = int(max_bytes or 0)
+        self.interval = float(interval or 0)
+        self.compression = compression
+        self.max_files = int(max_files or 0)
+        self.retention_days = float(retention_days or 0)
+        self.rollover_at: float = math.inf
+        if not filename:
+            filename = self.next_filename()
+        super().__init__(str(self.log_dir / filename), mode=mode)
+        self._set_rollover_time(time.time())
+
+    def _set_rollover_time(self, now: float) -> None:
+        self.rollover_at = (now + self.interval) if self.interval > 0 else math.inf
+
+    def next_filename(self) -> str:
+        return format_filename(filename=self.template, name=self.log_name, log_dir=self.log_dir)
+
+    def should_rollover(self, record: logging.LogRecord) -> bool:
+        if record.created >= self.rollover_at:
+            return True
+        if self.max_bytes > 0 and self.stream is not None:
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    def do_rollover(self) -> None:
+        """
+        Closes the current segment, opens the next one and archives the
+        closed segment in the background.
+        """
+        if self.stream is not None:
+            self.flush_batch()
+            self.stream.close()
+            self.stream = None
+        rotated: pathlib.Path = pathlib.Path(self.baseFilename)
+        self.baseFilename = os.path.abspath(self.log_dir / self.next_filename())
+        self.stream = self._open()
+        self._set_rollover_time(time.time())
+        get_archive_executor().submit(self.archive, rotated)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.should_rollover(record):
+                self.do_rollover()
+        except Exception:
+            self.handleError(record)
+            return
+        super().emit(record)
+
+    def archive(self, path: pathlib.Path) -> None:
+        """
+        Compresses a rotated segment and applies the retention limits.
+        """
+        try:
+            if self.compression and path.exists():
+                compress_log(path, self.compression)
+            self.apply_retention()
+        except OSError as error:
+            Logger.warning(g_warning_msg[4].format(path=path, error=error))
+
+    def segments(self) -> list[pathlib.Path]:
+        """
+        Returns the rotated segments of the log, oldest first.
+        """
+        current: str = os.path.basename(self.baseFilename)
+        found: list[tuple[int, float, pathlib.Path]] = []
+        for entry in os.scandir(self.log_dir):
+            match: re.Match = self.pattern.match(entry.name)
+            if match is None or entry.name == current or entry.name.endswith(".tmp"):
+                continue
+            found.append((int(match["id"]), entry.stat().st_mtime, pathlib.Path(entry.path)))
+        return [path for _, _, path in sorted(found)]
+
+    def apply_retention(self) -> None:
+        """
+        Removes the segments beyond ``max_files`` or older than
+        ``retention_days``.
+        """
+        segments: list[pathlib.Path] = self.segments()
+        expired: list[pathlib.Path] = []
+        if self.max_files > 0 and len(segments) >= self.max_files:
+            expired = segments[:len(segments) - self.max_files + 1]
+            segments = segments[len(expired):]
+        if self.retention_days > 0:
+            limit: float = time.time() - self.retention_days * 86400
+            expired += [path for path in segments if path.stat().st_mtime < limit]
+        for path in expired:
+            path.unlink(missing_ok=True)
+
+
 #configures a file handler
-def config_file_handler(lggr: logging.Logger, frmt: str, name: str = '', mode: str = 'w'):
+def config_file_handler(lggr: logging.Logger, frmt: str, name: str = '', mode: str = 'w', template: str = ''):
     """
     File Handler.
 
     This will create a file handler that will write all the logs into a file with the name of
     your logger and sets the logger for it. The handler is formatted with the
     format given and then returned to be used by add_handler.
+
+    If `rotation_max_bytes` or `rotation_interval` are set in the `Logger`
+    configuration, a :class:`RotatingLogHandler` is created instead, `template`
+    (the unformatted filename) is used to name the next segments.
     """
     path: pathlib.Path = pathlib.Path(Config.Logger.log_dir).expanduser().resolve()
     Logger.debug(f"Currently working at path: `{path}`")
@@ -332,23 +609,51 @@ def config_file_handler(lggr: logging.Logger, frmt: str, name: str = '', mode: s
         else:
             path.mkdir(parents=True, exist_ok=True)
             Logger.warning(g_warning_msg[3].format(path=path))
-    if name:
-        log_handler = logging.FileHandler(str(path / name), mode=mode)
+    if Config.Logger.rotation_max_bytes or Config.Logger.rotation_interval:
+        log_handler = RotatingLogHandler(path,
+                                         template or name or "{name}.log",
+                                         lggr.name,
+                                         mode=mode,
+                                         max_bytes=Config.Logger.rotation_max_bytes,
+                                         interval=Config.Logger.rotation_interval,
+                                         compression=Config.Logger.rotation_compression,
+                                         max_files=Config.Logger.max_files,
+                                         retention_days=Config.Logger.retention_days,
+                                         filename=name)
+    elif name:
+        log_handler = BatchFileHandler(str(path / name), mode=mode)
     # adds the file handler
     else:
-        log_handler = logging.FileHandler(str(path / str(lggr.name)) + '.log', mode=mode)
+        log_handler = BatchFileHandler(str(path / str(lggr.name)) + '.log', mode=mode)
     if not log_handler:
-        raise RuntimeError(g_error_msg[7].format(logger=lggr.name))
+        raise RuntimeError(g_error_msg[8].format(logger=lggr.name))
     log_handler.setFormatter(logging.Formatter(frmt))
     return log_handler
 
 
+def config_structured_handler(lggr: logging.Logger, name: str = '', mode: str = 'w') -> StructuredLogHandler:
+    """
+    Structured Handler.
+
+    Creates a :class:`DTAF.structured_log.StructuredLogHandler` in the log
+    folder, named after the logger unless a filename is given. The `.log`
+    suffix is replaced by `.dlog`.
+    """
+    path: pathlib.Path = pathlib.Path(Config.Logger.log_dir).expanduser().resolve()
+    path.mkdir(parents=True, exist_ok=True)
+    name = name or f"{lggr.name}.log"
+    if name.endswith(".log"):
+        name = name[:-len(".log")]
+    return StructuredLogHandler(path / f"{name}.dlog", mode=mode)
+
+
 #Method that adds a handler to a certain logger
 def add_handler(logger: logging.Logger,
                 hndlrtype: str,
                 frmt: str,
                 filename: str = '',
-                mode: str = 'w') -> logging.Handler:
+                mode: str = 'w',
+                template: str = '') -> logging.Handler:
     """
     Handler adder.
 
@@ -375,9 +680,15 @@ def add_handler(logger: logging.Logger,
                                                                 lambda *x: _handlers[logger_name[:]].pop("Terminal"))
         case "File":
             Logger.debug("Logger: adding new handler. type:`File`.")
-            hndlr = config_file_handler(logger, frmt, name=filename, mode=mode)
+            hndlr = config_file_handler(logger, frmt, name=filename, mode=mode, template=template)
             added = True
             _handlers[logger_name[:]]["File"] = weakref.ref(hndlr, lambda *x: _handlers[logger_name[:]].pop("File"))
+        case "Structured":
+            Logger.debug("Logger: adding new handler. type:`Structured`.")
+            hndlr = config_structured_handler(logger, name=filename, mode=mode)
+            added = True
+            _handlers[logger_name[:]]["Structured"] = weakref.ref(
+                hndlr, lambda *x: _handlers[logger_name[:]].pop("Structured"))
     if hndlr:
         logger.addHandler(hndlr)
     return hndlr
@@ -390,6 +701,412 @@ def get_handlers(logger_name: str) -> dict:
     return _handlers.get(logger_name)
 
 
+# Hot path logging.
+# -----------------
+# the I/O loops log on every message, these helpers keep the disabled levels
+# (and the formatting of the payloads) out of the loops.
+
+_hot_path_loggers: weakref.WeakSet = weakref.WeakSet()
+"""
+Every live :class:`HotPathLogger`, refreshed on each configuration change.
+"""
+
+_hot_path_disabled: set[str] = set()
+"""
+Name of the modules whose hot path logging is compiled out, ``*`` for all.
+"""
+
+g_payload_limit: int = 64
+"""
+Default amount of bytes (or characters) of a payload shown in the log records.
+"""
+
+
+class HotPathLogger():
+    """
+    Cached level switches for the hot I/O paths.
+
+    ``Logger.isEnabledFor`` walks the logger hierarchy (and takes the logging
+    lock) on every cache miss, these flags are plain attributes refreshed
+    whenever DTAF changes the logging configuration (the configuration load,
+    :func:`create_logger` and :func:`set_level`), so a disabled message costs
+    one attribute lookup and nothing is formatted::
+
+        _hot = hot_path_logger(__name__, Logger)
+
+        if _hot.debug:
+            self.logger.debug("read :: %d bytes: %s", len(data), Payload(data))
+
+    The modules listed in ``Config.Logger.hot_path_disabled`` or in the
+    ``DTAF_HOT_PATH_DISABLED`` environment variable (comma separated, ``*``
+    for all of them) are compiled out: their flags stay False whatever the
+    logger level is.
+
+    Levels changed outside DTAF (``Logger.setLevel``, ``logging.disable``)
+    are applied by :func:`refresh_hot_path_loggers`.
+    """
+
+    trace: bool = False
+    """
+    True if the TRACE level is enabled.
+    """
+
+    debug: bool = False
+    """
+    True if the DEBUG level is enabled.
+    """
+
+    info: bool = False
+    """
+    True if the INFO level is enabled.
+    """
+
+    def __init__(self, module: str, *loggers: logging.Logger | logging.LoggerAdapter) -> None:
+        self.module = module
+        # adapters are unwrapped, the level lives in the logger.
+        self.loggers: tuple[logging.Logger] = tuple(getattr(logger, "logger", logger) for logger in loggers)
+        self.refresh()
+        _hot_path_loggers.add(self)
+
+    def __repr__(self) -> str:
+        return f"<HotPathLogger {self.module} trace={self.trace} debug={self.debug} info={self.info}>"
+
+    @property
+    def disabled(self) -> bool:
+        """
+        True if the hot path logging of the module is compiled out.
+        """
+        return "*" in _hot_path_disabled or self.module in _hot_path_disabled
+
+    def refresh(self) -> None:
+        """
+        Reads the logger levels again.
+        """
+        if self.disabled is True:
+            self.trace = self.debug = self.info = False
+            return
+        self.trace = any(logger.isEnabledFor(9) for logger in self.loggers)
+        self.debug = any(logger.isEnabledFor(logging.DEBUG) for logger in self.loggers)
+        self.info = any(logger.isEnabledFor(logging.INFO) for logger in self.loggers)
+
+
+def hot_path_logger(module: str, *loggers: logging.Logger | logging.LoggerAdapter) -> HotPathLogger:
+    """
+    Returns the cached level switches of a module.
+
+    The flags are enabled if any of the given loggers would emit the level.
+    """
+    return HotPathLogger(module, *loggers)
+
+
+def refresh_hot_path_loggers() -> None:
+    """
+    Refreshes the flags of every hot path logger.
+
+    Call it after changing a level without :func:`set_level`, e.g. with
+    ``logging.disable``.
+    """
+    for hot_logger in list(_hot_path_loggers):
+        hot_logger.refresh()
+
+
+def set_level(logger: str | logging.Logger | logging.LoggerAdapter, level: int | str) -> logging.Logger:
+    """
+    Sets the level of a logger (by name, adapters are unwrapped) and
+    refreshes the hot path flags.
+    """
+    if isinstance(logger, str):
+        logger = logging.getLogger(logger)
+    logger = getattr(logger, "logger", logger)
+    logger.setLevel(level)
+    refresh_hot_path_loggers()
+    return logger
+
+
+def disable_hot_path_logging(module: str = "*") -> None:
+    """
+    Compiles out the hot path logging of a module, ``*`` for every module.
+    """
+    _hot_path_disabled.add(module)
+    refresh_hot_path_loggers()
+
+
+def enable_hot_path_logging(module: str = "*") -> None:
+    """
+    Restores the hot path logging of a module, ``*`` clears every module.
+    """
+    if module == "*":
+        _hot_path_disabled.clear()
+    else:
+        _hot_path_disabled.discard(module)
+    refresh_hot_path_loggers()
+
+
+def summarize_payload(data: typing.Any, limit: int = None) -> str:
+    """
+    Short representation of a payload for the log records.
+
+    Printable bytes are shown as a bytes literal, binary ones as hex. Only the
+    first ``limit`` bytes (:data:`g_payload_limit` by default) are kept, the
+    size of the rest is appended.
+    """
+    if limit is None:
+        limit = g_payload_limit
+    if isinstance(data, (bytes, bytearray, memoryview)) is False and hasattr(data, "tobytes"):
+        # pooled frames and other buffer wrappers.
+        data = data.tobytes()
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        size: int = len(data)
+        head: bytes = bytes(data[:limit])
+        if head.isascii() and all(byte >= 32 or byte in b"\r\n\t" for byte in head):
+            text: str = repr(head)
+        else:
+            text = "hex:" + head.hex(" ")
+        if size > limit:
+            return f"{text}... ({size} bytes)"
+        return text
+    text = str(data)
+    if len(text) > limit:
+        return f"{text[:limit]}... ({len(text)} chars)"
+    return text
+
+
+class Payload():
+    """
+    Lazy :func:`summarize_payload`.
+
+    Pass it as a logging argument, the payload is only summarized if the
+    record is emitted. ``direction`` (``"rx"`` or ``"tx"``) and the raw data
+    are kept by the structured logs (see :mod:`DTAF.structured_log`).
+    """
+
+    __slots__ = ("data", "limit", "direction")
+
+    def __init__(self, data: typing.Any, limit: int = None, direction: str = "") -> None:
+        self.data = data
+        self.limit = limit
+        self.direction = direction
+
+    def __str__(self) -> str:
+        return summarize_payload(self.data, self.limit)
+
+    __repr__ = __str__
+
+
+# Asynchronous logging.
+# ---------------------
+# the loggers only put the records into a bounded queue, a single writer
+# thread runs the real handlers.
+
+_log_writer: "LogWriter" = None
+"""
+Running log writer, None if the logging is synchronous.
+"""
+
+_log_writer_lock: threading.Lock = threading.Lock()
+
+
+class LogQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler of a single logger.
+
+    The records are tagged with the name of the logger the handler is
+    attached to (``route``), so the writer sends them to the handlers of that
+    logger only. When the queue is full the record is dropped (and counted)
+    instead of blocking the caller.
+    """
+
+    dropped: int = 0
+    """
+    Amount of records dropped because the queue was full.
+    """
+
+    def __init__(self, log_queue: queue.Queue, route: str) -> None:
+        super().__init__(log_queue)
+        self.route = route
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # unlike QueueHandler.prepare, the record isn't formatted here: the
+        # writer's handlers format it, off the calling (I/O) thread.
+        record = copy.copy(record)
+        record.log_route = self.route
+        if isinstance(record.args, tuple) and any(isinstance(arg, Payload) for arg in record.args):
+            # buffers may be reused before the writer runs, the payloads keep a copy.
+            args: list = list(record.args)
+            for index, arg in enumerate(args):
+                if isinstance(arg, Payload):
+                    data: typing.Any = arg.data.tobytes() if hasattr(arg.data, "tobytes") else copy.copy(arg.data)
+                    args[index] = Payload(data, arg.limit, arg.direction)
+                    if getattr(record, "payload", None) is None:
+                        record.payload = args[index]
+            record.args = tuple(args)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogWriter():
+    """
+    Single writer thread of the asynchronous logging.
+
+    Drains the queue in batches of up to ``batch_size`` records, hands each
+    record to the handlers of its logger and flushes the handlers once per
+    batch.
+    """
+
+    _sentinel: None = None
+    """
+    Queued by :meth:`stop` to end the thread.
+    """
+
+    def __init__(self, log_queue: queue.Queue, batch_size: int = 256) -> None:
+        self.queue: queue.Queue = log_queue
+        self.batch_size = batch_size
+        self.routes: dict[str, tuple[logging.Handler]] = {}
+        self._thread: threading.Thread = None
+
+    def start(self) -> None:
+        """
+        Starts the writer thread.
+        """
+        self._thread = threading.Thread(target=self._run, name="DTAF-LogWriter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Writes the queued records and stops the writer thread.
+        """
+        if self._thread is not None:
+            self.enqueue_sentinel()
+            self._thread.join()
+            self._thread = None
+
+    def add_route(self, route: str, handlers: typing.Iterable[logging.Handler]) -> None:
+        handlers = tuple(handlers)
+        for handler in handlers:
+            if hasattr(handler, "flush_batch"):
+                handler.batched = True
+        self.routes[route] = handlers
+
+    def remove_route(self, route: str) -> tuple[logging.Handler]:
+        handlers: tuple[logging.Handler] = self.routes.pop(route, ())
+        for handler in handlers:
+            if hasattr(handler, "flush_batch"):
+                handler.batched = False
+        return handlers
+
+    def handle(self, record: logging.LogRecord) -> None:
+        for handler in self.routes.get(getattr(record, "log_route", None), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def flush(self) -> None:
+        """
+        Flushes every handler.
+        """
+        for handlers in self.routes.values():
+            for handler in handlers:
+                if hasattr(handler, "flush_batch"):
+                    handler.flush_batch()
+                else:
+                    handler.flush()
+
+    def enqueue_sentinel(self) -> None:
+        # the queue may be full, the writer is still draining it.
+        self.queue.put(self._sentinel)
+
+    def _run(self) -> None:
+        running: bool = True
+        while running is True:
+            batch: list[logging.LogRecord] = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            for record in batch:
+                if record is self._sentinel:
+                    running = False
+                else:
+                    self.handle(record)
+                self.queue.task_done()
+            self.flush()
+
+
+def start_async_logging(loggers: typing.Iterable[logging.Logger] = None,
+                        queue_size: int = None,
+                        batch_size: int = None) -> LogWriter:
+    """
+    Routes the loggers through a queue and a single writer thread.
+
+    The handlers of each logger are moved to the writer, the logger gets a
+    :class:`LogQueueHandler` instead. Defaults to the DTAF system, device and
+    interface loggers and to the ``async_queue_size``/``async_batch_size``
+    configurations of the ``Logger`` section.
+    """
+    global _log_writer
+    if loggers is None:
+        loggers = (SystemLogger, DeviceLogger, InterfaceLogger)
+    if queue_size is None:
+        queue_size = int(Config.Logger.async_queue_size)
+    if batch_size is None:
+        batch_size = int(Config.Logger.async_batch_size)
+    with _log_writer_lock:
+        if _log_writer is None:
+            _log_writer = LogWriter(queue.Queue(queue_size), batch_size)
+            _log_writer.start()
+        for logger in loggers:
+            if logger.name in _log_writer.routes:
+                continue
+            handlers: list[logging.Handler] = list(logger.handlers)
+            for handler in handlers:
+                logger.removeHandler(handler)
+            _log_writer.add_route(logger.name, handlers)
+            logger.addHandler(LogQueueHandler(_log_writer.queue, logger.name))
+        return _log_writer
+
+
+def stop_async_logging() -> None:
+    """
+    Writes the pending records, stops the writer thread and gives the
+    handlers back to their loggers.
+    """
+    global _log_writer
+    with _log_writer_lock:
+        if _log_writer is None:
+            return
+        writer, _log_writer = _log_writer, None
+        # the handlers are given back first, so no record is lost meanwhile.
+        for route, handlers in writer.routes.items():
+            logger: logging.Logger = logging.getLogger(route)
+            for handler in handlers:
+                logger.addHandler(handler)
+            for handler in list(logger.handlers):
+                if isinstance(handler, LogQueueHandler):
+                    logger.removeHandler(handler)
+        writer.stop()
+        for route in list(writer.routes):
+            for handler in writer.remove_route(route):
+                handler.flush()
+
+
+atexit.register(stop_async_logging)
+
+
+def _load_hot_path_config() -> None:
+    global g_payload_limit
+    g_payload_limit = int(Config.Logger.payload_log_limit)
+    disabled: list[str] = list(Config.Logger.hot_path_disabled or [])
+    disabled += [name.strip() for name in os.getenv("DTAF_HOT_PATH_DISABLED", "").split(",") if name.strip()]
+    _hot_path_disabled.update(disabled)
+    refresh_hot_path_loggers()
+
+
 #TODO: CREATE REPORT FORMAT BASED ON PYTEST'S FORMAT AND USE DTAF'S
 # CONFIGURATION MODULE TO DETERMINE WHERE TO PUT IT OR WHERE TO SEND IT.
 #class TestReport():
@@ -481,11 +1198,7 @@ def _load_default_loggers():
     global SystemLogger, DeviceLogger, InterfaceLogger
     default_log_level: str = Config.Logger.default_log_level
     logger_names: list[str] = ["DTAF_System", "DTAF_Devices", "DTAF_Interfaces"]
-    logger_name: str = ''
-    filename: str = ''
     log_config: dict = Config.Logger.logger_config
-    handler: logging.Handler = None
-    cc: int = 0
     # Iter over log names
     # for logger_name in logger_names:
     #     if logger_name not in Config.Logger.logger_config:
@@ -500,7 +1213,6 @@ def _load_default_loggers():
     InterfaceLogger = create_logger(logger_names[2], log_config[logger_names[2]]["level"])
 
     # Sends debug message.
-    logger_name = None
     Logger.debug(f"log_config: {log_config}")
     Logger.debug(f"logger_names: {logger_names}")
     # lists loggers
@@ -509,39 +1221,117 @@ def _load_default_loggers():
         DeviceLogger,
         InterfaceLogger,
     )
+    for logger_instance in default_loggers:
+        config = Config.Logger.logger_config.get(logger_instance.name, default_config)
+        set_level(logger_instance, config.get("level", logging.WARNING))
+        if _logging_initialized is False:
+            # opens the files on the first record, see DTAF.init.
+            logger_instance.addHandler(DeferredInitHandler(logger_instance))
+
+
+def _load_default_handlers():
+    # set variables.
+    logger_name: str = ''
+    filename: str = ''
+    handler: logging.Handler = None
+    default_loggers = (
+        SystemLogger,
+        DeviceLogger,
+        InterfaceLogger,
+    )
     # configures extra handlers.
-    cc = 0
     for logger_instance in default_loggers:
-        logger_name = logger_names[cc]
+        logger_name = logger_instance.name
         Logger.debug(f"Logger: Setting Logger [{logger_instance}] for {logger_name} console handler.")
         # gest the config.
         config = Config.Logger.logger_config.get(logger_name, default_config)
         format = get_format(config.get("format", default_config.get("format", None)),
                             source=default_config[logger_name],
                             source_name=logger_name)
-        # sets logger level.
         log_level = config.get("level", logging.WARNING)
-        logger_instance.setLevel(log_level)
         # Checks we're not in sphinx doc mode.
         if DTAF.SPHINX_DOC_MODE is False:
             # adds the file handler.
             Logger.debug(f"config: {config}, format: {format}, filename = {filename}")
-            filename = format_filename(filename=config.get("file_name", "{name} - {std_date} - {id}.log"),
-                                       name=logger_instance.name)
-            handler = add_handler(logger_instance, "File", format, filename=filename)
+            template = config.get("file_name", "{name} - {std_date} - {id}.log")
+            filename = format_filename(filename=template, name=logger_instance.name, log_dir=Config.Logger.log_dir)
+            handler = add_handler(logger_instance, "File", format, filename=filename, template=template)
             handler.setLevel(log_level)
+            if Config.Logger.structured_log is True:
+                handler = add_handler(logger_instance, "Structured", format, filename=filename)
+                handler.setLevel(log_level)
         # Sets console handler if program is ran in console.
         handler = set_console_handler(logger_instance, format)
         if handler:
             handler.setLevel(log_level)
         Logger.debug(f"logger: {logger_instance.name}, handlers: {logger_instance.handlers}")
-        cc += 1
-    cc = None
+
+
+class DeferredInitHandler(logging.Handler):
+    """
+    Placeholder handler of the default loggers until :func:`DTAF.init` runs.
+
+    The first record it gets initializes DTAF, then the record is handed to
+    the handlers that replaced this one, so nothing is lost.
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        super().__init__()
+        self.logger: logging.Logger = logger
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        try:
+            DTAF.init()
+        except Exception:
+            self.handleError(record)
+            return False
+        for handler in self.logger.handlers:
+            if handler is not self and record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        pass
+
+
+def _open_startup_log() -> None:
+    bootloader: logging.Logger = logging.getLogger("BOOTLOADER")
+    if DTAF.SPHINX_DOC_MODE is False:
+        # We only add a file handler if we're not in documentation mode.
+        bootloader.addHandler(
+            logging.FileHandler((pathlib.Path("~/TAF/DTAF-Startup log.txt").expanduser().resolve()), mode="a"), )
+    bootloader.warning(
+        "\n\n--- Logger starts --- {dt}\n".format(dt=datetime.datetime.now().strftime("%Y-%m-%d YMD :: %Hh-%Mm-%Ss")))
+    bootloader.info(f"Running on terminal: {g_running_on_terminal}")
+
+
+def init_logging() -> None:
+    """
+    Opens the startup log and the handlers of the default loggers, and starts
+    the asynchronous log writer if configured.
+
+    Called once by :func:`DTAF.init`, importing this module doesn't open any
+    file.
+    """
+    global _logging_initialized
+    if _logging_initialized is True:
+        return
+    _logging_initialized = True
+    for logger_instance in (SystemLogger, DeviceLogger, InterfaceLogger):
+        # a new list: the records being handled keep iterating over the old one.
+        logger_instance.handlers = [
+            handler for handler in logger_instance.handlers if isinstance(handler, DeferredInitHandler) is False
+        ]
+    _open_startup_log()
+    _load_default_handlers()
+    if Config.Logger.async_handlers is True:
+        start_async_logging()
 
 
 def __init__():
     global Logger
     Logger.debug("Loading __init__ from DTAF.logger")
+    _load_hot_path_config()
     _load_default_loggers()
     Logger = SystemLogger
 
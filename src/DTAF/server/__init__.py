@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
-from .sockets import SocketInterface, JsonSocketInterface
+from .sockets import SocketInterface, JsonSocketInterface, ReactorSocketInterface, AsyncSocketInterface
+from .socket_server import SocketServer
 
 from DTAF.factory import Factory
 
 Factory.register("SocketInterface", SocketInterface)
 Factory.register("JsonSocketInterface", JsonSocketInterface)
+Factory.register("ReactorSocketInterface", ReactorSocketInterface)
+Factory.register("AsyncSocketInterface", AsyncSocketInterface)
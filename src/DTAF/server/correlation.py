@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Correlation Module
+==================
+
+Request/response correlation for the socket threads.
+
+Instead of writing a command and then popping whatever arrives next from the
+inbound queue, a command can be written together with an *expectation*; a
+``concurrent.futures.Future`` is returned and resolved with the first inbound
+frame that satisfies it. Frames that don't satisfy any pending expectation
+fall through to the inbound queue as usual.
+
+This allows many commands to be in flight on the same socket (pipelining)
+without waiting for each round-trip.
+
+Supported expectations:
+
+* ``bytes``/``str``: the frame must start with this prefix.
+* ``re.Pattern``: the pattern must be found in the frame (``pattern.search``).
+* ``callable``: called with the frame, must return True when it matches.
+* ``int``: sequence id, requires the correlator to be created with an
+  ``id_extractor`` that returns the id of each inbound frame. These are looked
+  up in O(1).
+"""
+import collections
+import concurrent.futures
+import re
+import threading
+import time
+import typing
+
+g_error_msg: tuple[str] = (
+    "Correlator: Invalid expectation type `{type_}`, use bytes, str, re.Pattern, callable or int.",  # 0
+    "Correlator: Sequence id expectations require an `id_extractor`. id: {id}",  # 1
+    "Correlator: Sequence id already awaiting a response. id: {id}",  # 2
+    "Correlator: No response matched before the timeout. expectation: {expect}",  # 3
+    "Correlator: Connection closed before a response was received. expectation: {expect}",  # 4
+    "Correlator: ",  # x
+)
+"""
+List of error messages of this module.
+"""
+
+_missing = object()
+
+Expectation = typing.Union[bytes, str, re.Pattern, typing.Callable[[bytes], bool], int]
+
+
+def compile_matcher(expect: Expectation) -> typing.Callable[[bytes], bool]:
+    """
+    Converts an expectation into a callable that receives the frame and
+    returns True on match.
+    """
+    if isinstance(expect, str):
+        expect = expect.encode()
+    if isinstance(expect, (bytes, bytearray)):
+        prefix: bytes = bytes(expect)
+        return lambda frame: frame.startswith(prefix)
+    if isinstance(expect, re.Pattern):
+        return lambda frame: expect.search(frame) is not None
+    if callable(expect):
+        return expect
+    raise TypeError(g_error_msg[0].format(type_=type(expect)))
+
+
+class Correlator:
+    """
+    Routes inbound frames to the futures waiting for them.
+
+    Matchers are tried in the same order they were registered, so pipelined
+    commands with identical responses are resolved FIFO.
+    """
+
+    id_extractor: typing.Callable[[bytes], typing.Any] = None
+    """
+    Callable that returns the sequence id of a frame, or None if the frame has
+    no id.
+    """
+
+    def __init__(self, id_extractor: typing.Callable[[bytes], typing.Any] = None) -> None:
+        self.id_extractor = id_extractor
+        self.lock = threading.Lock()
+        # [future, matcher, deadline, expectation]
+        self._matchers: collections.deque = collections.deque()
+        # id: [future, deadline]
+        self._ids: dict = {}
+        self._sequence: int = 0
+
+    def __len__(self) -> int:
+        return len(self._matchers) + len(self._ids)
+
+    def next_sequence(self) -> int:
+        """
+        Returns a new sequence id to tag an outgoing command with.
+        """
+        with self.lock:
+            self._sequence += 1
+            return self._sequence
+
+    def expect(self, expect: Expectation, timeout: float | int | None = None) -> concurrent.futures.Future:
+        """
+        Registers a new expectation and returns the future that will hold the
+        matching frame.
+
+        Once the timeout is reached, the future fails with ``TimeoutError``.
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        deadline: float | None = (time.monotonic() + timeout) if timeout is not None else None
+        with self.lock:
+            if isinstance(expect, int) and not isinstance(expect, bool):
+                if self.id_extractor is None:
+                    raise ValueError(g_error_msg[1].format(id=expect))
+                if expect in self._ids:
+                    raise ValueError(g_error_msg[2].format(id=expect))
+                self._ids[expect] = [future, deadline]
+            else:
+                self._matchers.append([future, compile_matcher(expect), deadline, expect])
+        return future
+
+    def dispatch(self, frame: bytes, key: typing.Any = _missing) -> bool:
+        """
+        Resolves the first pending future matching the frame.
+
+        ``key`` is the sequence id of the frame when the caller already knows
+        it (e.g. it already decoded the frame), the ``id_extractor`` is skipped.
+
+        Returns False when nobody was waiting for the frame, so the caller can
+        queue it.
+        """
+        if not self._matchers and not self._ids:
+            return False
+        future: concurrent.futures.Future = None
+        with self.lock:
+            if self._ids:
+                if key is _missing:
+                    try:
+                        key = self.id_extractor(frame)
+                    except Exception:
+                        key = None
+                try:
+                    entry = self._ids.pop(key, None)
+                except TypeError:
+                    # unhashable id.
+                    entry = None
+                # claims the future, returns False if it was cancelled by the user.
+                if entry is not None and entry[0].set_running_or_notify_cancel():
+                    future = entry[0]
+            if future is None:
+                for entry in self._matchers:
+                    if entry[0].done() or entry[1](frame) is False:
+                        continue
+                    self._matchers.remove(entry)
+                    if entry[0].set_running_or_notify_cancel():
+                        future = entry[0]
+                    break
+        if future is None:
+            return False
+        # resolved outside the lock, done callbacks may register new expectations.
+        future.set_result(frame)
+        return True
+
+    def expire(self) -> int:
+        """
+        Fails every future that reached its deadline and discards the ones
+        cancelled by the user.
+
+        Returns the amount of removed entries.
+        """
+        if not self._matchers and not self._ids:
+            return 0
+        now: float = time.monotonic()
+        removed: int = 0
+        with self.lock:
+            for entry in tuple(self._matchers):
+                if entry[0].done() or (entry[2] is not None and entry[2] <= now):
+                    self._matchers.remove(entry)
+                    self._fail(entry[0], TimeoutError(g_error_msg[3].format(expect=entry[3])))
+                    removed += 1
+            for key, entry in tuple(self._ids.items()):
+                if entry[0].done() or (entry[1] is not None and entry[1] <= now):
+                    del self._ids[key]
+                    self._fail(entry[0], TimeoutError(g_error_msg[3].format(expect=key)))
+                    removed += 1
+        return removed
+
+    def cancel_all(self, error: Exception = None) -> None:
+        """
+        Fails every pending future, used when the connection is closed.
+        """
+        with self.lock:
+            for entry in self._matchers:
+                self._fail(entry[0], error or ConnectionError(g_error_msg[4].format(expect=entry[3])))
+            for key, entry in self._ids.items():
+                self._fail(entry[0], error or ConnectionError(g_error_msg[4].format(expect=key)))
+            self._matchers.clear()
+            self._ids.clear()
+
+    @staticmethod
+    def _fail(future: concurrent.futures.Future, error: Exception) -> None:
+        if future.done() is False:
+            future.set_exception(error)
@@ -0,0 +1,451 @@
+# -*- coding: utf-8 -*-
+"""
+Framing Module
+==============
+
+Buffers used by the socket threads to split the incoming byte stream into
+messages (frames).
+
+The socket is read in large chunks straight into a preallocated, reusable
+``bytearray`` (``socket.recv_into``), frames are then located with
+``bytearray.find`` and any leftover bytes are kept for the next frame, so we
+never copy the whole message on each received byte.
+
+Frames can be returned as ``bytes``, as ``memoryview`` slices over the
+internal buffer (:meth:`FrameBuffer.next_view`) or copied into pooled buffers
+(:class:`BufferPool`, :class:`PooledFrame`) to avoid allocating a new object
+per frame.
+
+Two framing strategies are available:
+
+* :class:`FrameBuffer`: frames are terminated by a delimiter (``b"\\n"`` by
+  default), multi-byte delimiters such as ``b"\\r\\n"`` are supported.
+* :class:`LengthPrefixedFrameBuffer`: each frame starts with a fixed size
+  header containing the payload length (see :mod:`struct` for the format).
+"""
+import collections
+import struct
+import typing
+
+g_error_msg: tuple[str] = (
+    "FrameBuffer: Invalid delimiter, it must be a non empty bytes object. delimiter: {delimiter}",  # 0
+    "FrameBuffer: Frame exceeded the maximum size without finding a delimiter. size: {size}, max_size: {max_size}",  # 1
+    "FrameBuffer: Invalid data type, bytes-like object expected, got: `{type_}`",  # 2
+    "FrameBuffer: Frame payload exceeds the length header capacity. size: {size}, format: {fmt}",  # 3
+    "FrameBuffer: Invalid framing name `{name}`, valid names: {names}",  # 4
+    "FrameBuffer: ",  # x
+)
+"""
+List of error messages of this module.
+"""
+
+
+class FramingError(ValueError):
+    """
+    Raised when the incoming stream can't be split into frames.
+    """
+    pass
+
+
+class FrameBuffer:
+    """
+    Delimiter based framing buffer.
+
+    Feed it with the chunks read from the socket (or let it read the socket
+    itself with :meth:`recv_into`) and pop complete frames with
+    :meth:`next_frame` or by iterating over the buffer.
+
+    The buffer is preallocated and reused, consumed bytes are not removed on
+    each frame, the read position moves forward and the leftover bytes are
+    moved to the front only when room is needed for new data.
+    """
+
+    delimiter: bytes = b"\n"
+    """
+    Sequence of bytes that ends each frame.
+    """
+
+    keep_delimiter: bool = True
+    """
+    Set to True to return frames with the delimiter at the end (the same
+    behavior as the old byte by byte reader).
+    """
+
+    max_size: int = 1 << 20
+    """
+    Maximum amount of buffered bytes without finding a complete frame.
+    """
+
+    def __init__(self,
+                 delimiter: bytes = b"\n",
+                 keep_delimiter: bool = True,
+                 max_size: int = 1 << 20,
+                 capacity: int = 1 << 14) -> None:
+        if isinstance(delimiter, (bytes, bytearray)) is False or not delimiter:
+            raise FramingError(g_error_msg[0].format(delimiter=delimiter))
+        self.delimiter = bytes(delimiter)
+        self.keep_delimiter = keep_delimiter
+        self.max_size = max_size
+        # preallocated storage, only buffer[_start:_end] holds valid data.
+        self.buffer: bytearray = bytearray(capacity)
+        self._start: int = 0
+        self._end: int = 0
+        # position from where the next search of _scan_delimiter starts.
+        self._scan: int = 0
+        self._scan_delimiter: bytes = self.delimiter
+
+    def __len__(self) -> int:
+        """
+        Amount of buffered bytes not yet returned as a frame.
+        """
+        return self._end - self._start
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        while (frame := self.next_frame()) is not None:
+            yield frame
+
+    def feed(self, data: bytes) -> None:
+        """
+        Appends the data received from the socket.
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)) is False:
+            raise FramingError(g_error_msg[2].format(type_=type(data)))
+        size: int = len(data)
+        self._reserve(size)
+        self.buffer[self._end:self._end + size] = data
+        self._end += size
+        self._check_size()
+
+    def recv_into(self, socket: "socket.socket", size: int = 4096) -> int:
+        """
+        Reads up to ``size`` bytes from the socket straight into the buffer,
+        without allocating an intermediate ``bytes`` object.
+
+        Returns the amount of bytes read, 0 means the remote closed the
+        connection. Socket errors (timeouts included) are propagated.
+        """
+        self._reserve(size)
+        with memoryview(self.buffer) as view:
+            received: int = socket.recv_into(view[self._end:self._end + size], size)
+        self._end += received
+        self._check_size()
+        return received
+
+    def next_view(self, delimiter: bytes = None) -> memoryview | None:
+        """
+        Returns the next complete frame as a ``memoryview`` over the internal
+        buffer, without copying it, or None if there's no complete frame
+        buffered yet.
+
+        The view is only valid until the next :meth:`feed`, :meth:`recv_into`
+        or :meth:`clear` call, release it (or copy it) before that.
+        """
+        if delimiter is None:
+            delimiter = self.delimiter
+        # the bytes already scanned are skipped only when looking for the same delimiter.
+        start: int = self._start
+        if delimiter == self._scan_delimiter:
+            start = max(start, self._scan - len(delimiter) + 1)
+        index: int = self.buffer.find(delimiter, start, self._end)
+        if index < 0:
+            self._scan = self._end
+            self._scan_delimiter = delimiter
+            return None
+        end: int = index + len(delimiter)
+        view: memoryview = memoryview(self.buffer)[self._start:end if self.keep_delimiter else index]
+        self._consume(end)
+        return view
+
+    def next_frame(self, delimiter: bytes = None) -> bytes | None:
+        """
+        Returns the next complete frame or None if there's no complete frame
+        buffered yet.
+
+        A different delimiter may be provided for a single call, the leftover
+        bytes are shared.
+        """
+        view: memoryview | None = self.next_view(delimiter)
+        if view is None:
+            return None
+        with view:
+            return view.tobytes()
+
+    def next_frame_into(self, pool: "BufferPool", delimiter: bytes = None) -> "PooledFrame | None":
+        """
+        Returns the next complete frame copied into a buffer taken from the
+        pool, or None if there's no complete frame buffered yet.
+
+        Call :meth:`PooledFrame.release` once the frame is not needed anymore
+        so its buffer is reused.
+        """
+        view: memoryview | None = self.next_view(delimiter)
+        if view is None:
+            return None
+        with view:
+            return pool.frame(view)
+
+    def flush(self) -> bytes:
+        """
+        Returns all the buffered bytes, even if they're not a complete frame.
+        """
+        with memoryview(self.buffer) as view:
+            data: bytes = view[self._start:self._end].tobytes()
+        self.clear()
+        return data
+
+    def clear(self) -> None:
+        """
+        Discards all the buffered bytes, the storage is kept.
+        """
+        self._start = 0
+        self._end = 0
+        self._scan = 0
+
+    def encode(self, payload: bytes) -> bytes:
+        """
+        Returns the payload ready to be sent, the delimiter is added if
+        missing.
+        """
+        if payload.endswith(self.delimiter):
+            return payload
+        return payload + self.delimiter
+
+    def _check_size(self) -> None:
+        if len(self) > self.max_size:
+            size: int = len(self)
+            self.clear()
+            raise FramingError(g_error_msg[1].format(size=size, max_size=self.max_size))
+
+    def _reserve(self, size: int) -> None:
+        """
+        Makes room for ``size`` bytes after the buffered data.
+        """
+        if len(self.buffer) - self._end >= size:
+            return
+        if self._start > 0:
+            # moves the leftover bytes to the front, the buffer size doesn't change.
+            pending: int = len(self)
+            self.buffer[:pending] = self.buffer[self._start:self._end]
+            self._scan = max(self._scan - self._start, 0)
+            self._start = 0
+            self._end = pending
+        if len(self.buffer) - self._end < size:
+            self.buffer.extend(bytes(max(len(self.buffer), self._end + size - len(self.buffer))))
+
+    def _consume(self, end: int) -> None:
+        self._start = self._scan = end
+        if self._start == self._end:
+            self._start = self._end = self._scan = 0
+
+
+class LengthPrefixedFrameBuffer(FrameBuffer):
+    """
+    Length prefixed framing buffer.
+
+    Each frame starts with a header packed with ``length_format`` (network
+    order unsigned int by default) containing the size of the payload.
+    """
+
+    length_format: str = "!I"
+    """
+    :mod:`struct` format of the length header.
+    """
+
+    include_header: bool = False
+    """
+    Set to True to return frames with the length header included.
+    """
+
+    def __init__(self,
+                 length_format: str = "!I",
+                 include_header: bool = False,
+                 max_size: int = 1 << 20,
+                 **kwargs) -> None:
+        super().__init__(max_size=max_size, **kwargs)
+        self.length_format = length_format
+        self.include_header = include_header
+        self._header = struct.Struct(length_format)
+
+    def next_view(self, delimiter: bytes = None) -> memoryview | None:
+        if len(self) < self._header.size:
+            return None
+        size: int = self._header.unpack_from(self.buffer, self._start)[0]
+        if size > self.max_size:
+            self.clear()
+            raise FramingError(g_error_msg[1].format(size=size, max_size=self.max_size))
+        end: int = self._start + self._header.size + size
+        if self._end < end:
+            return None
+        view: memoryview = memoryview(
+            self.buffer)[self._start if self.include_header else self._start + self._header.size:end]
+        self._consume(end)
+        return view
+
+    def encode(self, payload: bytes) -> bytes:
+        try:
+            return self._header.pack(len(payload)) + payload
+        except struct.error as error:
+            raise FramingError(g_error_msg[3].format(size=len(payload), fmt=self.length_format)) from error
+
+    def _check_size(self) -> None:
+        # the limit applies to each frame, checked once its header is available.
+        pass
+
+
+class PooledFrame:
+    """
+    Frame stored in a buffer borrowed from a :class:`BufferPool`.
+
+    Behaves as a read-only bytes-like object: ``len``, indexing, slicing,
+    comparison with ``bytes``, ``startswith``/``endswith`` and ``bytes()``
+    conversion. :attr:`view` gives direct access to the data.
+
+    Call :meth:`release` (or use it as a context manager) once done, the
+    frame can't be used after that.
+    """
+
+    __slots__ = ("pool", "buffer", "view")
+
+    def __init__(self, pool: "BufferPool | None", buffer: bytearray, size: int) -> None:
+        self.pool = pool
+        self.buffer = buffer
+        self.view: memoryview = memoryview(buffer)[:size].toreadonly()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PooledFrame":
+        """
+        Creates a frame that doesn't belong to any pool.
+        """
+        return cls(None, bytearray(data), len(data))
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def __bytes__(self) -> bytes:
+        return self.view.tobytes()
+
+    def __getitem__(self, index: int | slice) -> int | memoryview:
+        return self.view[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PooledFrame):
+            other = other.view
+        try:
+            return self.view == other
+        except (TypeError, ValueError):
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"PooledFrame({self.view.tobytes()!r})"
+
+    def __reduce__(self) -> tuple:
+        # pickled (e.g. spilled to disk) as a standalone frame.
+        return (PooledFrame.from_bytes, (self.view.tobytes(), ))
+
+    def __enter__(self) -> "PooledFrame":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+    def tobytes(self) -> bytes:
+        return self.view.tobytes()
+
+    def startswith(self, prefix: bytes) -> bool:
+        return self.view[:len(prefix)] == prefix
+
+    def endswith(self, suffix: bytes) -> bool:
+        return len(self.view) >= len(suffix) and self.view[len(self.view) - len(suffix):] == suffix
+
+    def release(self) -> None:
+        """
+        Returns the buffer to its pool.
+        """
+        if self.buffer is None:
+            return
+        self.view.release()
+        if self.pool is not None:
+            self.pool.release(self.buffer)
+        self.buffer = None
+
+
+class BufferPool:
+    """
+    Pool of reusable buffers for :class:`PooledFrame` objects.
+
+    Frames bigger than ``buffer_size`` get their own buffer, which is not
+    returned to the pool.
+    """
+
+    buffer_size: int = 4096
+    """
+    Size of each pooled buffer.
+    """
+
+    max_buffers: int = 1024
+    """
+    Maximum amount of idle buffers kept by the pool.
+    """
+
+    def __init__(self, buffer_size: int = 4096, max_buffers: int = 1024) -> None:
+        self.buffer_size = buffer_size
+        self.max_buffers = max_buffers
+        self._free: collections.deque = collections.deque()
+        self.allocated: int = 0
+        self.reused: int = 0
+
+    def __len__(self) -> int:
+        """
+        Amount of idle buffers.
+        """
+        return len(self._free)
+
+    def acquire(self, size: int) -> bytearray:
+        """
+        Returns a buffer of at least ``size`` bytes.
+        """
+        if size <= self.buffer_size:
+            try:
+                buffer: bytearray = self._free.pop()
+                self.reused += 1
+                return buffer
+            except IndexError:
+                pass
+        self.allocated += 1
+        return bytearray(max(size, self.buffer_size))
+
+    def release(self, buffer: bytearray) -> None:
+        """
+        Gives a buffer back to the pool.
+        """
+        if len(buffer) == self.buffer_size and len(self._free) < self.max_buffers:
+            self._free.append(buffer)
+
+    def frame(self, data: bytes | memoryview) -> PooledFrame:
+        """
+        Copies the data into a pooled buffer.
+        """
+        size: int = len(data)
+        buffer: bytearray = self.acquire(size)
+        buffer[:size] = data
+        return PooledFrame(self, buffer, size)
+
+
+framing_classes: dict[str, type] = {
+    "delimiter": FrameBuffer,
+    "length": LengthPrefixedFrameBuffer,
+}
+"""
+Framing strategies by name, used by the socket models (``framing`` key).
+"""
+
+
+def new_frame_buffer(framing: str = "delimiter", **kwargs) -> FrameBuffer:
+    """
+    Creates a new framing buffer by strategy name.
+    """
+    if framing not in framing_classes:
+        raise FramingError(g_error_msg[4].format(name=framing, names=list(framing_classes.keys())))
+    return framing_classes[framing](**kwargs)
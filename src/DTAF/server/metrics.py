@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+Metrics Module
+==============
+
+Per socket metrics: bytes and frames in/out, read timeouts, reconnections,
+queue depths and round-trip latency histograms.
+
+Each :class:`DTAF.server.sockets.SocketThread` owns a :class:`SocketMetrics`
+object, its counters are only written by the socket thread itself so no lock
+is taken in the hot path. Readers get a consistent enough view through
+:meth:`SocketMetrics.snapshot`.
+
+Every live metrics object is tracked by the module, so all the sockets of a
+run can be exported at once::
+
+    from DTAF.server import metrics
+
+    metrics.snapshot_all()                       # list of dicts.
+    metrics.write_prometheus("/var/lib/node_exporter/dtaf.prom")
+"""
+import math
+import os
+import pathlib
+import tempfile
+import threading
+import typing
+import weakref
+
+g_error_msg: tuple[str] = (
+    "LatencyHistogram: Invalid percentile `{percentile}`, it must be between 0 and 100.",  # 0
+    "LatencyHistogram: ",  # x
+)
+"""
+List of error messages of this module.
+"""
+
+prometheus_buckets: tuple[float] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+"""
+Upper bounds (seconds) of the exported Prometheus histogram buckets.
+"""
+
+
+class LatencyHistogram:
+    """
+    HDR style (log-linear) latency histogram.
+
+    Values are stored in microseconds in buckets whose width doubles every
+    ``2 ** (sub_bucket_bits - 1)`` buckets, which keeps a relative error below
+    ``1 / 2 ** (sub_bucket_bits - 1)`` (~6% by default) with a fixed, small
+    amount of memory and O(1) recording.
+    """
+
+    sub_bucket_bits: int = 5
+    """
+    Amount of bits of precision of each bucket.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 5) -> None:
+        self.sub_bucket_bits = sub_bucket_bits
+        self._sub_count: int = 1 << sub_bucket_bits
+        self._half: int = self._sub_count >> 1
+        # enough buckets for 64 bit values.
+        self.counts: list[int] = [0] * (self._sub_count + (64 - sub_bucket_bits) * self._half)
+        self.count: int = 0
+        self.total: int = 0
+        self.min: int = 0
+        self.max: int = 0
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_count:
+            return value
+        shift: int = value.bit_length() - self.sub_bucket_bits
+        return self._sub_count + (shift - 1) * self._half + (value >> shift) - self._half
+
+    def _upper_bound(self, index: int) -> int:
+        """
+        Highest value (microseconds) stored in the bucket.
+        """
+        if index < self._sub_count:
+            return index
+        shift: int = (index - self._sub_count) // self._half + 1
+        top: int = (index - self._sub_count) % self._half + self._half
+        return ((top + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """
+        Records a latency, in seconds.
+        """
+        value: int = max(int(seconds * 1_000_000), 0)
+        self.counts[self._index(value)] += 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Returns the latency (seconds) below which the given percentage of the
+        recorded values fall.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError(g_error_msg[0].format(percentile=percentile))
+        counts: list[int] = list(self.counts)
+        total: int = sum(counts)
+        if total == 0:
+            return 0.0
+        target: int = max(math.ceil(total * percentile / 100), 1)
+        accumulated: int = 0
+        for index, count in enumerate(counts):
+            accumulated += count
+            if accumulated >= target:
+                return min(self._upper_bound(index), self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    def cumulative_counts(self, bounds: typing.Iterable[float]) -> list[int]:
+        """
+        Returns the amount of values lower or equal than each bound (seconds).
+        """
+        counts: list[int] = list(self.counts)
+        result: list[int] = []
+        index: int = 0
+        accumulated: int = 0
+        for bound in bounds:
+            limit: int = int(bound * 1_000_000)
+            while index < len(counts) and self._upper_bound(index) <= limit:
+                accumulated += counts[index]
+                index += 1
+            result.append(accumulated)
+        return result
+
+    def snapshot(self) -> dict[str, float | int]:
+        """
+        Returns the summary of the histogram, latencies in seconds.
+        """
+        count: int = self.count
+        return {
+            "count": count,
+            "min": self.min / 1_000_000,
+            "max": self.max / 1_000_000,
+            "mean": (self.total / count / 1_000_000) if count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+        }
+
+    def reset(self) -> None:
+        self.counts = [0] * len(self.counts)
+        self.count = self.total = self.min = self.max = 0
+
+
+class SocketMetrics:
+    """
+    Counters of a single socket.
+
+    Written by the socket thread only, read from anywhere.
+    """
+
+    counter_names: tuple[str] = (
+        "bytes_in",
+        "bytes_out",
+        "frames_in",
+        "frames_out",
+        "read_timeouts",
+    )
+    """
+    Name of the plain counters.
+    """
+
+    def __init__(self, uid: typing.Any, duid: typing.Any, source: object = None) -> None:
+        self.uid = uid
+        self.duid = duid
+        self.bytes_in: int = 0
+        self.bytes_out: int = 0
+        self.frames_in: int = 0
+        self.frames_out: int = 0
+        self.read_timeouts: int = 0
+        self.latency = LatencyHistogram()
+        # socket thread, used for the reconnections and queue depths.
+        self._source: weakref.ref = weakref.ref(source) if source is not None else None
+        with _registry_lock:
+            _registry.add(self)
+
+    def __repr__(self) -> str:
+        return f"<SocketMetrics uid={self.uid} duid={self.duid}>"
+
+    def record_latency(self, seconds: float) -> None:
+        """
+        Records the round-trip time of a request.
+        """
+        self.latency.record(seconds)
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        """
+        Returns every metric of the socket as a plain dictionary.
+        """
+        result: dict[str, typing.Any] = {"uid": self.uid, "duid": self.duid}
+        for name in self.counter_names:
+            result[name] = getattr(self, name)
+        source = self._source() if self._source is not None else None
+        result["reconnects"] = getattr(source, "reconnects", 0)
+        queue_stats = getattr(source, "queue_stats", None)
+        result["queues"] = queue_stats() if queue_stats is not None else {}
+        result["latency"] = self.latency.snapshot()
+        return result
+
+    def reset(self) -> None:
+        for name in self.counter_names:
+            setattr(self, name, 0)
+        self.latency.reset()
+
+
+_registry: weakref.WeakSet = weakref.WeakSet()
+_registry_lock: threading.Lock = threading.Lock()
+
+
+def all_metrics() -> list[SocketMetrics]:
+    """
+    Returns the metrics of every live socket.
+    """
+    with _registry_lock:
+        return list(_registry)
+
+
+def snapshot_all() -> list[dict[str, typing.Any]]:
+    """
+    Returns the snapshot of every live socket.
+    """
+    return [metrics.snapshot() for metrics in all_metrics()]
+
+
+def _escape(value: typing.Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def to_prometheus(metrics: typing.Iterable[SocketMetrics] = None) -> str:
+    """
+    Renders the metrics in the Prometheus text exposition format.
+    """
+    if metrics is None:
+        metrics = all_metrics()
+    snapshots: list[tuple[SocketMetrics, dict]] = [(item, item.snapshot()) for item in metrics]
+    lines: list[str] = []
+
+    def family(name: str, kind: str, help_: str) -> None:
+        lines.append(f"# HELP dtaf_socket_{name} {help_}")
+        lines.append(f"# TYPE dtaf_socket_{name} {kind}")
+
+    def labels(snapshot: dict, **extra) -> str:
+        pairs: dict = {"uid": snapshot["uid"], "duid": snapshot["duid"], **extra}
+        return ",".join(f'{key}="{_escape(value)}"' for key, value in pairs.items())
+
+    counters: tuple[tuple[str, str, str]] = (
+        ("bytes_in", "bytes_received_total", "Bytes received from the socket."),
+        ("bytes_out", "bytes_sent_total", "Bytes sent to the socket."),
+        ("frames_in", "frames_received_total", "Frames received from the socket."),
+        ("frames_out", "frames_sent_total", "Frames sent to the socket."),
+        ("read_timeouts", "read_timeouts_total", "Reads that timed out without a complete frame."),
+        ("reconnects", "reconnects_total", "Reconnection attempts."),
+    )
+    for key, name, help_ in counters:
+        family(name, "counter", help_)
+        for _, snapshot in snapshots:
+            lines.append(f"dtaf_socket_{name}{{{labels(snapshot)}}} {snapshot[key]}")
+    family("queue_depth", "gauge", "Messages waiting in the socket queues.")
+    for _, snapshot in snapshots:
+        for queue_name, stats in snapshot["queues"].items():
+            lines.append(f"dtaf_socket_queue_depth{{{labels(snapshot, queue=queue_name)}}} {stats['size']}")
+    family("queue_high_water_mark", "gauge", "Maximum amount of messages held by the socket queues.")
+    for _, snapshot in snapshots:
+        for queue_name, stats in snapshot["queues"].items():
+            lines.append(
+                f"dtaf_socket_queue_high_water_mark{{{labels(snapshot, queue=queue_name)}}} {stats['high_water_mark']}")
+    family("round_trip_seconds", "histogram", "Round-trip time of the correlated requests.")
+    for item, snapshot in snapshots:
+        cumulative: list[int] = item.latency.cumulative_counts(prometheus_buckets)
+        for bound, count in zip(prometheus_buckets, cumulative):
+            lines.append(f"dtaf_socket_round_trip_seconds_bucket{{{labels(snapshot, le=bound)}}} {count}")
+        lines.append(f"dtaf_socket_round_trip_seconds_bucket{{{labels(snapshot, le='+Inf')}}} {item.latency.count}")
+        lines.append(f"dtaf_socket_round_trip_seconds_sum{{{labels(snapshot)}}} {item.latency.total / 1_000_000}")
+        lines.append(f"dtaf_socket_round_trip_seconds_count{{{labels(snapshot)}}} {item.latency.count}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: str | pathlib.Path, metrics: typing.Iterable[SocketMetrics] = None) -> pathlib.Path:
+    """
+    Writes the metrics into a Prometheus text file (e.g. for the
+    node_exporter textfile collector).
+
+    The file is replaced atomically, so the collector never reads a partial
+    file.
+    """
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(prefix=path.name, suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(handle, "w") as file:
+            file.write(to_prometheus(metrics))
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return path
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+Queues Module
+=============
+
+Bounded queues with backpressure policies for the socket threads.
+
+A chatty device that nobody reads from would otherwise grow the inbound queue
+without limit, :class:`BoundedQueue` keeps the memory flat by applying one of
+the following policies once ``maxsize`` items are stored:
+
+* ``"block"``: ``put`` waits for room (standard :class:`queue.Queue`
+  behavior), raising ``queue.Full`` if the timeout is reached.
+* ``"drop-oldest"``: the oldest item is discarded to make room.
+* ``"drop-newest"``: the new item is discarded.
+* ``"spill"``: the new item is written to a temporary file and read back, in
+  order, once the memory queue has room again. Nothing is lost, only the
+  memory is bounded.
+
+Every queue keeps counters (:meth:`BoundedQueue.stats`) with the high water
+mark, so soak tests can check that the queues are not growing.
+"""
+import collections
+import pickle
+import queue
+import struct
+import tempfile
+import typing
+
+g_error_msg: tuple[str] = (
+    "BoundedQueue: Invalid policy `{policy}`, valid policies: {policies}",  # 0
+    "BoundedQueue: ",  # x
+)
+"""
+List of error messages of this module.
+"""
+
+queue_policies: tuple[str] = (
+    "block",
+    "drop-oldest",
+    "drop-newest",
+    "spill",
+)
+"""
+Name of the available policies.
+"""
+
+policy_aliases: dict[str, str] = {
+    "drop": "drop-newest",
+}
+"""
+Alternative names of the policies.
+"""
+
+_header: struct.Struct = struct.Struct("!I")
+
+
+class BoundedQueue(queue.Queue):
+    """
+    :class:`queue.Queue` with a backpressure policy.
+
+    ``maxsize`` 0 means unbounded, any policy behaves as a plain queue then.
+
+    ``put`` returns False when the item was dropped by the ``drop-newest``
+    policy, True otherwise.
+    """
+
+    policy: str = "block"
+    """
+    Policy applied when the queue is full, one of :data:`queue_policies`.
+    """
+
+    high_water_mark: int = 0
+    """
+    Maximum amount of items stored at the same time (memory and disk).
+    """
+
+    dropped: int = 0
+    """
+    Amount of items discarded by the drop policies.
+    """
+
+    spilled: int = 0
+    """
+    Amount of items written to disk by the spill policy.
+    """
+
+    total: int = 0
+    """
+    Amount of items accepted by the queue.
+    """
+
+    def __init__(self, maxsize: int = 0, policy: str = "block", spill_dir: str = None) -> None:
+        policy = policy_aliases.get(policy, policy)
+        if policy not in queue_policies:
+            raise ValueError(g_error_msg[0].format(policy=policy, policies=queue_policies))
+        self.policy = policy
+        self.spill_dir = spill_dir
+        self.high_water_mark = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.total = 0
+        # "block" is the only policy where put waits, the others never see the queue as full.
+        super().__init__(maxsize if policy == "block" else 0)
+        self.limit: int = maxsize
+
+    def _init(self, maxsize: int) -> None:
+        self.queue: collections.deque = collections.deque()
+        self._spill_file: typing.BinaryIO = None
+        self._spill_count: int = 0
+        self._spill_read: int = 0
+
+    def _qsize(self) -> int:
+        return len(self.queue) + self._spill_count
+
+    def _put(self, item: typing.Any) -> bool:
+        if self.limit > 0 and len(self.queue) >= self.limit:
+            if self.policy == "drop-newest":
+                self.dropped += 1
+                return False
+            if self.policy == "drop-oldest":
+                self.queue.popleft()
+                self.unfinished_tasks -= 1
+                self.dropped += 1
+            elif self.policy == "spill":
+                self._spill(item)
+                return True
+        if self._spill_count:
+            # keeps the order, the memory queue is refilled from disk.
+            self._spill(item)
+            return True
+        self.queue.append(item)
+        self.total += 1
+        self.high_water_mark = max(self.high_water_mark, self._qsize())
+        return True
+
+    def _get(self) -> typing.Any:
+        item: typing.Any = self.queue.popleft()
+        if self._spill_count:
+            self._unspill()
+        return item
+
+    def put(self, item: typing.Any, block: bool = True, timeout: float | int | None = None) -> bool:
+        if self.policy == "block":
+            super().put(item, block, timeout)
+            return True
+        with self.not_full:
+            accepted: bool = self._put(item)
+            if accepted is True:
+                self.unfinished_tasks += 1
+                self.not_empty.notify()
+        return accepted
+
+    def _spill(self, item: typing.Any) -> None:
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix="DTAF-queue-", dir=self.spill_dir)
+        data: bytes = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+        self._spill_file.seek(0, 2)
+        self._spill_file.write(_header.pack(len(data)) + data)
+        self._spill_count += 1
+        self.spilled += 1
+        self.total += 1
+        self.high_water_mark = max(self.high_water_mark, self._qsize())
+
+    def _unspill(self) -> None:
+        # moves items back to memory while there's room.
+        self._spill_file.seek(self._spill_read)
+        while self._spill_count and (self.limit <= 0 or len(self.queue) < self.limit):
+            size: int = _header.unpack(self._spill_file.read(_header.size))[0]
+            self.queue.append(pickle.loads(self._spill_file.read(size)))
+            self._spill_count -= 1
+        self._spill_read = self._spill_file.tell()
+        if self._spill_count == 0:
+            # the file is emptied so the disk usage stays flat too.
+            self._spill_file.seek(0)
+            self._spill_file.truncate()
+            self._spill_read = 0
+
+    def stats(self) -> dict[str, int | str]:
+        """
+        Returns the counters of the queue.
+        """
+        with self.mutex:
+            return {
+                "policy": self.policy,
+                "maxsize": self.limit,
+                "size": self._qsize(),
+                "spilled_size": self._spill_count,
+                "high_water_mark": self.high_water_mark,
+                "dropped": self.dropped,
+                "spilled": self.spilled,
+                "total": self.total,
+            }
+
+    def close(self) -> None:
+        """
+        Removes the spill file, if any.
+        """
+        with self.mutex:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+            self._spill_count = 0
+            self._spill_read = 0
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+Reactor Module
+==============
+
+Shared, selector based event loop for socket channels.
+
+Instead of spawning one OS thread per socket, every channel registered here is
+multiplexed by a single :class:`SocketReactor` thread that only wakes up when
+the operating system reports readiness (epoll/kqueue/select, whatever
+``selectors.DefaultSelector`` picks for the platform).
+
+A channel is any object implementing the following protocol:
+
+* ``fileno() -> int``: file descriptor to watch.
+* ``handle_read() -> None``: called when the descriptor is readable.
+* ``handle_write() -> bool``: called when the descriptor is writable, returns
+  ``True`` while there is still pending outbound data.
+* ``handle_close(error: Exception | None) -> None``: called once the channel is
+  removed from the reactor, either by request or because of an I/O error.
+
+Selector mutations are only performed from the reactor thread, any other
+thread must go through :meth:`SocketReactor.call_soon` (``register``,
+``unregister`` and ``request_write`` already do it for you).
+"""
+import collections
+import logging
+import os
+import selectors
+import socket
+import threading
+import traceback
+import typing
+
+from DTAF.logger import InterfaceLogger as Logger
+
+g_error_msg: tuple[str] = (
+    "SocketReactor: Channel is already registered. channel: {channel}",  # 0
+    "SocketReactor: Unexpected error while handling channel {channel}.\n\tERROR: {error}\nTRACEBACK:\n{tb}\n--- <TRACEBACK END> ---",  # 1
+    "SocketReactor: Unexpected error while running callback {callback}.\n\tERROR: {error}\nTRACEBACK:\n{tb}\n--- <TRACEBACK END> ---",  # 2
+    "SocketReactor: Invalid pool size, it must be a positive integer. size: {size}",  # 3
+    "SocketReactor: ",  # x
+)
+"""
+List of error messages of this module.
+"""
+
+g_debug_msg: tuple[str] = (
+    "SocketReactor: Registered channel {channel}, total channels: {count}.",  # 0
+    "SocketReactor: Unregistered channel {channel}, total channels: {count}.",  # 1
+    "SocketReactor: Reactor loop has stopped.",  # 2
+    "SocketReactor: ",  # x
+)
+
+EVENT_READ: int = selectors.EVENT_READ
+EVENT_WRITE: int = selectors.EVENT_WRITE
+
+try:
+    IOV_MAX: int = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = -1
+if IOV_MAX <= 0:
+    # not reported (e.g. Windows, where sendmsg isn't available), POSIX minimum is 16, Linux uses 1024.
+    IOV_MAX = 1024
+"""
+Maximum amount of buffers accepted by a single ``sendmsg`` call, bigger
+batches fail with ``EMSGSIZE``.
+"""
+
+
+class SocketReactor(threading.Thread):
+    """
+    Selector based reactor.
+
+    Multiplexes the I/O of all registered channels inside a single thread,
+    dispatching ``handle_read``/``handle_write`` only on readiness.
+    """
+
+    keep_alive: bool = False
+    """
+    Main loop flag, set to False to stop the reactor.
+    """
+
+    select_timeout: float | int | None = 1
+    """
+    Maximum time the selector will wait for an event before checking the
+    ``keep_alive`` flag again. Any call to :meth:`call_soon` wakes the reactor
+    immediately, so this value doesn't affect latency.
+    """
+
+    selector: selectors.BaseSelector = None
+    """
+    Selector object used to wait for readiness.
+    """
+
+    channels: dict = None
+    """
+    Registered channels, indexed by file descriptor.
+    """
+
+    def __init__(self, name: str = "DTAF-SocketReactor", select_timeout: float | int | None = 1) -> None:
+        super().__init__(name=name, daemon=True)
+        self.select_timeout = select_timeout
+        self.selector = selectors.DefaultSelector()
+        self.channels = {}
+        self._filenos: dict = {}
+        self._callbacks: collections.deque = collections.deque()
+        # self-pipe used to wake the selector from other threads.
+        self._waker_r, self._waker_w = socket.socketpair()
+        self._waker_r.setblocking(False)
+        self._waker_w.setblocking(False)
+        self.selector.register(self._waker_r, EVENT_READ, None)
+        self.logger = logging.LoggerAdapter(Logger, {
+            "uid": name,
+            "duid": "REACTOR",
+            "interface_class": self.__class__,
+        })
+        self.keep_alive = True
+
+    def __len__(self) -> int:
+        return len(self.channels)
+
+    def wakeup(self) -> None:
+        """
+        Wakes the reactor from the selector wait.
+        """
+        try:
+            self._waker_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            # the pipe is already full, the reactor will wake up anyway.
+            pass
+
+    def call_soon(self, callback: typing.Callable, *args) -> None:
+        """
+        Schedules a callback to be run inside the reactor thread.
+
+        This is the only thread safe way to interact with the selector.
+        """
+        self._callbacks.append((callback, args))
+        if threading.current_thread() is not self:
+            self.wakeup()
+
+    def register(self, channel: object) -> None:
+        """
+        Adds a channel to the reactor, it will start receiving read events.
+        """
+        self.call_soon(self._register, channel)
+
+    def unregister(self, channel: object, error: Exception = None) -> None:
+        """
+        Removes a channel from the reactor and closes it by calling
+        ``channel.handle_close``.
+        """
+        self.call_soon(self._unregister, channel, error)
+
+    def request_write(self, channel: object) -> None:
+        """
+        Tells the reactor that the channel has data waiting to be sent.
+        """
+        self.call_soon(self._set_events, channel, EVENT_READ | EVENT_WRITE)
+
+    def stop(self) -> None:
+        """
+        Stops the reactor, closing every registered channel.
+        """
+        self.keep_alive = False
+        self.wakeup()
+
+    def _register(self, channel: object) -> None:
+        fileno: int = channel.fileno()
+        if fileno in self.channels:
+            raise RuntimeError(g_error_msg[0].format(channel=channel))
+        self.channels[fileno] = channel
+        self._filenos[channel] = fileno
+        self.selector.register(fileno, EVENT_READ, channel)
+        self.logger.debug(g_debug_msg[0].format(channel=channel, count=len(self.channels)))
+
+    def _unregister(self, channel: object, error: Exception = None) -> None:
+        fileno: int = self._filenos.pop(channel, None)
+        if fileno is None:
+            return
+        del self.channels[fileno]
+        try:
+            self.selector.unregister(fileno)
+        except (KeyError, ValueError):
+            pass
+        self.logger.debug(g_debug_msg[1].format(channel=channel, count=len(self.channels)))
+        channel.handle_close(error)
+
+    def _set_events(self, channel: object, events: int) -> None:
+        try:
+            key = self.selector.get_key(self._filenos[channel])
+        except (KeyError, ValueError):
+            return
+        if key.events != events:
+            self.selector.modify(key.fd, events, channel)
+
+    def _drain_waker(self) -> None:
+        try:
+            while self._waker_r.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+    def _run_callbacks(self) -> None:
+        # only run the callbacks that were queued before this point.
+        for _ in range(len(self._callbacks)):
+            callback, args = self._callbacks.popleft()
+            try:
+                callback(*args)
+            except Exception as error:
+                self.logger.error(g_error_msg[2].format(callback=callback, error=error, tb=traceback.format_exc()))
+
+    def _handle_event(self, channel: object, mask: int) -> None:
+        try:
+            if mask & EVENT_READ:
+                channel.handle_read()
+            if mask & EVENT_WRITE:
+                if channel.handle_write() is False:
+                    self._set_events(channel, EVENT_READ)
+        except Exception as error:
+            self.logger.error(g_error_msg[1].format(channel=channel, error=error, tb=traceback.format_exc()))
+            self._unregister(channel, error)
+
+    def run(self) -> None:
+        try:
+            while self.keep_alive is True:
+                for key, mask in self.selector.select(self.select_timeout):
+                    if key.data is None:
+                        self._drain_waker()
+                        continue
+                    # the channel may have been closed by a previous event.
+                    if key.data not in self._filenos:
+                        continue
+                    self._handle_event(key.data, mask)
+                self._run_callbacks()
+        finally:
+            for channel in tuple(self.channels.values()):
+                self._unregister(channel)
+            self.selector.close()
+            self._waker_r.close()
+            self._waker_w.close()
+            self.logger.debug(g_debug_msg[2])
+
+
+def batch_size_limit(size: int) -> int:
+    """
+    Returns ``size`` clamped to the buffers a ``sendmsg`` call accepts
+    (:data:`IOV_MAX`).
+    """
+    return max(1, min(size, IOV_MAX))
+
+
+def advance_buffers(buffers: list, sent: int) -> list:
+    """
+    Removes the first ``sent`` bytes from a list of buffers.
+    """
+    index: int = 0
+    while index < len(buffers) and sent >= len(buffers[index]):
+        sent -= len(buffers[index])
+        index += 1
+    buffers = buffers[index:]
+    if sent and buffers:
+        buffers[0] = memoryview(buffers[0])[sent:]
+    return buffers
+
+
+reactor_pool_size: int = 1
+"""
+Maximum amount of reactor threads shared between all channels.
+
+Increase this value when a single thread can't keep up with the amount of
+sockets the test host drives.
+"""
+
+_reactor_pool: list[SocketReactor] = []
+_reactor_pool_lock: threading.Lock = threading.Lock()
+
+
+def set_reactor_pool_size(size: int) -> None:
+    """
+    Updates the maximum amount of shared reactor threads.
+
+    Already running reactors are kept, new channels will be spread among them.
+    """
+    global reactor_pool_size
+    if isinstance(size, int) is False or size <= 0:
+        raise ValueError(g_error_msg[3].format(size=size))
+    reactor_pool_size = size
+
+
+def get_reactor() -> SocketReactor:
+    """
+    Returns a running reactor from the shared pool.
+
+    New reactors are started on demand until ``reactor_pool_size`` is reached,
+    after that the least loaded reactor is returned.
+    """
+    with _reactor_pool_lock:
+        _reactor_pool[:] = [reactor for reactor in _reactor_pool if reactor.is_alive()]
+        if len(_reactor_pool) < reactor_pool_size:
+            reactor = SocketReactor(name="DTAF-SocketReactor-{}".format(len(_reactor_pool)))
+            reactor.start()
+            _reactor_pool.append(reactor)
+            return reactor
+        return min(_reactor_pool, key=len)
+
+
+def stop_reactors() -> None:
+    """
+    Stops every reactor in the shared pool.
+    """
+    with _reactor_pool_lock:
+        for reactor in _reactor_pool:
+            reactor.stop()
+        for reactor in _reactor_pool:
+            if reactor is not threading.current_thread():
+                reactor.join(timeout=5)
+        _reactor_pool.clear()
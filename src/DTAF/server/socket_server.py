@@ -0,0 +1,457 @@
+# -*- coding: utf-8 -*-
+"""
+Socket Server Module
+====================
+
+Server side counterpart of :mod:`DTAF.server.sockets`.
+
+:class:`SocketServer` listens on a port and accepts any number of concurrent
+clients. All connections are multiplexed by a
+:class:`DTAF.server.reactor.SocketReactor`, so hundreds of virtual DUTs can be
+simulated from a single test host without one thread per connection.
+
+Inbound data is split with the same framing buffers used by the client
+threads (:mod:`DTAF.server.framing`), and every frame is handed to the
+``message_manager`` hook, patched the same way as
+:attr:`DTAF.server.sockets.SocketThread.method_patch`:
+
+* message_manager(client, frame) -> bytes | None: handles a frame, the
+  returned bytes (if any) are sent back to the client. When no manager is
+  set, ``(client, frame)`` tuples are put in :attr:`SocketServer.inbound_queue`.
+* on_connect(client) -> bytes | None: called for each new client, the returned
+  bytes (if any) are sent as greeting.
+* on_disconnect(client, error) -> None: called once the client is closed.
+"""
+import logging
+import queue
+import socket
+import threading
+import traceback
+import typing
+
+from DTAF.logger import InterfaceLogger as Logger
+from DTAF.server.reactor import SocketReactor, advance_buffers, batch_size_limit
+from DTAF.server.framing import FrameBuffer, new_frame_buffer
+
+g_error_msg: tuple[str] = (
+    "SocketServer: Server is already listening. address: {address}",  # 0
+    "SocketServer: Unknown client. client: {client}",  # 1
+    "SocketServer: Hook `{name}` failed for client {client}.\n\tERROR: {error}\nTRACEBACK:\n{tb}\n--- <TRACEBACK END> ---",  # 2
+    "SocketServer: Invalid hook name `{name}`, valid names: {names}",  # 3
+    "SocketServer: ",  # x
+)
+"""
+List of error messages of this module.
+"""
+
+g_debug_msg: tuple[str] = (
+    "SocketServer: Listening on {address}.",  # 0
+    "SocketServer: Client {client} connected, total clients: {count}.",  # 1
+    "SocketServer: Client {client} disconnected, total clients: {count}.",  # 2
+    "SocketServer: Server stopped.",  # 3
+    "SocketServer: ",  # x
+)
+
+hook_names: tuple[str] = (
+    "message_manager",
+    "on_connect",
+    "on_disconnect",
+)
+"""
+Name of the methods that can be patched in the server.
+"""
+
+
+class ClientChannel():
+    """
+    Connection accepted by the :class:`SocketServer`.
+    """
+
+    server: "SocketServer" = None
+    """
+    Server that accepted this connection.
+    """
+
+    Socket: socket.socket = None
+    """
+    Non blocking socket of the connection.
+    """
+
+    address: tuple = None
+    """
+    Remote address of the client.
+    """
+
+    uid: int = None
+    """
+    Sequential id of the client within the server.
+    """
+
+    framer: FrameBuffer = None
+    """
+    Framing buffer of the inbound data.
+    """
+
+    data: dict = None
+    """
+    Free storage for the hooks, e.g. to keep the state of a virtual DUT.
+    """
+
+    def __init__(self, server: "SocketServer", connection: socket.socket, address: tuple, uid: int) -> None:
+        self.server = server
+        self.Socket = connection
+        self.address = address
+        self.uid = uid
+        self.framer = server.new_framer()
+        self.data = {}
+        self.closed = False
+        self._tx_lock = threading.Lock()
+        self._tx_pending: list = []
+
+    def __repr__(self) -> str:
+        return f"<ClientChannel uid={self.uid} address={self.address}>"
+
+    def fileno(self) -> int:
+        return self.Socket.fileno()
+
+    def write(self, data: bytes) -> int:
+        """
+        Queues the data to be sent to the client.
+
+        Thread safe, the data is sent by the reactor thread.
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)) is False:
+            raise TypeError(f"ClientChannel: write :: data must be bytes, `{type(data)}` found")
+        if self.closed is True or not data:
+            return 0
+        with self._tx_lock:
+            self._tx_pending.append(data)
+        self.server.socket_reactor.request_write(self)
+        return len(data)
+
+    def close(self) -> None:
+        """
+        Closes the connection with the client.
+        """
+        self.server.socket_reactor.unregister(self)
+
+    def handle_read(self) -> None:
+        try:
+            received: int = self.framer.recv_into(self.Socket, self.server.recv_size)
+        except (BlockingIOError, InterruptedError):
+            return
+        if not received:
+            self.server.socket_reactor.unregister(self)
+            return
+        for frame in self.framer:
+            self.server.handle_frame(self, frame)
+
+    def handle_write(self) -> bool:
+        with self._tx_lock:
+            while self._tx_pending:
+                try:
+                    if hasattr(self.Socket, "sendmsg"):
+                        sent: int = self.Socket.sendmsg(self._tx_pending[:self.server.max_batch_size])
+                    else:
+                        sent: int = self.Socket.send(self._tx_pending[0])
+                except (BlockingIOError, InterruptedError):
+                    return True
+                self._tx_pending = advance_buffers(self._tx_pending, sent)
+        return False
+
+    def handle_close(self, error: Exception = None) -> None:
+        self.closed = True
+        try:
+            self.Socket.close()
+        finally:
+            self.server.client_closed(self, error)
+
+
+class ListenerChannel():
+    """
+    Listening socket of the :class:`SocketServer`, accepts the new clients.
+    """
+
+    def __init__(self, server: "SocketServer", listener: socket.socket) -> None:
+        self.server = server
+        self.Socket = listener
+
+    def fileno(self) -> int:
+        return self.Socket.fileno()
+
+    def handle_read(self) -> None:
+        # accepts every pending connection, up to the backlog.
+        for _ in range(self.server.backlog):
+            try:
+                connection, address = self.Socket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            self.server.client_accepted(connection, address)
+
+    def handle_write(self) -> bool:
+        return False
+
+    def handle_close(self, error: Exception = None) -> None:
+        self.Socket.close()
+        self.server.listener_closed(error)
+
+
+class SocketServer():
+    """
+    Multi-client socket server.
+
+    Usage::
+
+        def manager(client: ClientChannel, frame: bytes) -> bytes:
+            return b"received: " + frame
+
+        with SocketServer(host="0.0.0.0", port=8080, message_manager=manager) as server:
+            ...
+
+    The server owns its reactor thread unless a ``socket_reactor`` is given.
+    Frames are delimited by ``endline`` (``b"\\n"`` by default), set
+    ``framing="length"`` for length prefixed frames, the same as in
+    :class:`DTAF.server.sockets.SocketThread`.
+    """
+
+    HOST: str = "0.0.0.0"
+    """
+    Address to listen on.
+    """
+
+    PORT: int = 8080
+    """
+    Port to listen on, use 0 to let the operating system pick one, the actual
+    port is available in :attr:`address` once started.
+    """
+
+    PROTOCOL: socket.AddressFamily = socket.AF_INET
+    """
+    Address family of the listening socket.
+    """
+
+    backlog: int = 128
+    """
+    Maximum amount of pending connections.
+    """
+
+    recv_size: int = 4096
+    """
+    Maximum amount of bytes requested to each client socket on each read.
+    """
+
+    max_batch_size: int = 64
+    """
+    Maximum amount of outbound messages coalesced into a single send call.
+    """
+
+    endline: bytes = b"\n"
+    """
+    Frame delimiter.
+    """
+
+    socket_reactor: SocketReactor = None
+    """
+    Reactor multiplexing the listener and every client.
+    """
+
+    clients: dict[int, ClientChannel] = None
+    """
+    Connected clients, indexed by their uid.
+    """
+
+    inbound_queue: queue.Queue = None
+    """
+    ``(client, frame)`` tuples received while no ``message_manager`` is set.
+    """
+
+    method_patch: dict[str, typing.Callable] = None
+    """
+    Storage for each patched hook, see :data:`hook_names`.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        self.HOST = kwargs.get("host", SocketServer.HOST)
+        self.PORT = kwargs.get("port", SocketServer.PORT)
+        self.PROTOCOL = kwargs.get("protocol", SocketServer.PROTOCOL)
+        self.backlog = kwargs.get("backlog", SocketServer.backlog)
+        self.recv_size = kwargs.get("recv_size", SocketServer.recv_size)
+        self.max_batch_size = batch_size_limit(kwargs.get("max_batch_size", SocketServer.max_batch_size))
+        self.endline = kwargs.get("endline", SocketServer.endline)
+        self.framing = kwargs.get("framing", "delimiter")
+        self.framing_kwargs: dict = {"max_size": kwargs.get("max_frame_size", FrameBuffer.max_size)}
+        if self.framing == "length":
+            self.framing_kwargs["length_format"] = kwargs.get("length_format", "!I")
+        else:
+            self.framing_kwargs["delimiter"] = self.endline
+        self.logger = logging.LoggerAdapter(
+            Logger, {
+                "uid": kwargs.get("uid", "SERVER"),
+                "duid": str(kwargs.get("duid", "SERVER")),
+                "interface_class": self.__class__,
+            })
+        self.socket_reactor = kwargs.get("socket_reactor", None)
+        self._own_reactor: bool = self.socket_reactor is None
+        self.clients = {}
+        self.inbound_queue = queue.Queue()
+        self.method_patch = {name: kwargs[name] for name in hook_names if callable(kwargs.get(name, None))}
+        self.address: tuple = None
+        self.listener: ListenerChannel = None
+        self._sequence: int = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def __enter__(self) -> "SocketServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+        self.join(5)
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def new_framer(self) -> FrameBuffer:
+        """
+        Returns a new framing buffer for a client.
+        """
+        return new_frame_buffer(self.framing, **self.framing_kwargs)
+
+    def assign_method(self, name: str, method: typing.Callable, update: bool = False) -> bool:
+        """
+        Patches one of the server hooks, see :data:`hook_names`.
+        """
+        if name not in hook_names:
+            raise ValueError(g_error_msg[3].format(name=name, names=hook_names))
+        if name in self.method_patch and update is False:
+            raise RuntimeError("Name is already in use. name: `{name}`, bound to: {method}".format(
+                name=name, method=self.method_patch[name]))
+        self.method_patch[name] = method
+        return True
+
+    def start(self) -> None:
+        """
+        Binds the listening socket and starts accepting clients.
+        """
+        if self.listener is not None:
+            raise RuntimeError(g_error_msg[0].format(address=self.address))
+        listener = socket.socket(self.PROTOCOL, socket.SOCK_STREAM)
+        try:
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            listener.bind((self.HOST, self.PORT))
+            listener.listen(self.backlog)
+            listener.setblocking(False)
+        except Exception:
+            listener.close()
+            raise
+        self.address = listener.getsockname()
+        self._stopped.clear()
+        # a stopped reactor can't be restarted, a new one is created.
+        if self._own_reactor is True and (self.socket_reactor is None or self.socket_reactor.is_alive() is False):
+            self.socket_reactor = SocketReactor(name=f"DTAF-SocketServer-{self.address[1]}")
+            self.socket_reactor.start()
+        self.listener = ListenerChannel(self, listener)
+        self.socket_reactor.register(self.listener)
+        self.logger.info(g_debug_msg[0].format(address=self.address))
+
+    def stop(self) -> None:
+        """
+        Stops listening and closes every client.
+        """
+        if self.listener is None:
+            return
+        if self._own_reactor is True:
+            # closes every channel on exit.
+            self.socket_reactor.stop()
+        else:
+            for client in tuple(self.clients.values()):
+                client.close()
+            self.socket_reactor.unregister(self.listener)
+
+    def join(self, timeout: float | int = None) -> bool:
+        """
+        Waits until the listener is closed.
+        """
+        return self._stopped.wait(timeout)
+
+    def send(self, uid: int, data: bytes) -> int:
+        """
+        Sends the data to a single client.
+        """
+        client: ClientChannel = self.clients.get(uid, None)
+        if client is None:
+            raise KeyError(g_error_msg[1].format(client=uid))
+        return client.write(data)
+
+    def broadcast(self, data: bytes) -> int:
+        """
+        Sends the data to every connected client, returns the amount of
+        clients.
+        """
+        clients: tuple = tuple(self.clients.values())
+        for client in clients:
+            client.write(data)
+        return len(clients)
+
+    def read(self, timeout: float | int = 1) -> tuple[ClientChannel, bytes] | None:
+        """
+        Returns the next ``(client, frame)`` tuple from the inbound queue, or
+        None on timeout.
+        """
+        try:
+            return self.inbound_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _call_hook(self, name: str, client: ClientChannel, *args) -> typing.Any:
+        try:
+            return self.method_patch[name](client, *args)
+        except Exception as error:
+            self.logger.error(g_error_msg[2].format(name=name, client=client, error=error, tb=traceback.format_exc()))
+            return None
+
+    def handle_frame(self, client: ClientChannel, frame: bytes) -> None:
+        """
+        Hands a frame to the ``message_manager``, or queues it.
+        """
+        if "message_manager" not in self.method_patch:
+            self.inbound_queue.put((client, frame))
+            return
+        response = self._call_hook("message_manager", client, frame)
+        if response:
+            client.write(response)
+
+    def client_accepted(self, connection: socket.socket, address: tuple) -> None:
+        """
+        Registers a new client, called by the listener.
+        """
+        connection.setblocking(False)
+        with self._lock:
+            self._sequence += 1
+            client = ClientChannel(self, connection, address, self._sequence)
+            self.clients[client.uid] = client
+        self.socket_reactor.register(client)
+        self.logger.debug(g_debug_msg[1].format(client=client, count=len(self.clients)))
+        if "on_connect" in self.method_patch:
+            greeting = self._call_hook("on_connect", client)
+            if greeting:
+                client.write(greeting)
+
+    def client_closed(self, client: ClientChannel, error: Exception = None) -> None:
+        """
+        Removes a client, called once its channel is closed.
+        """
+        with self._lock:
+            self.clients.pop(client.uid, None)
+        self.logger.debug(g_debug_msg[2].format(client=client, count=len(self.clients)))
+        if "on_disconnect" in self.method_patch:
+            self._call_hook("on_disconnect", client, error)
+
+    def listener_closed(self, error: Exception = None) -> None:
+        """
+        Called once the listening socket is closed.
+        """
+        self.listener = None
+        self._stopped.set()
+        self.logger.info(g_debug_msg[3])
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import concurrent.futures
 import socket
 import queue
 import threading
@@ -13,10 +15,21 @@ import copy
 import traceback
 import weakref
 import math
+import random
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from DTAF.config import Config
-from DTAF.logger import InterfaceLogger as Logger
+from DTAF.logger import InterfaceLogger as Logger, Payload, hot_path_logger
 from DTAF.interfaces.base import InterfaceBase
+from DTAF.server.reactor import SocketReactor, advance_buffers, batch_size_limit, get_reactor
+from DTAF.server.framing import BufferPool, FrameBuffer, PooledFrame, new_frame_buffer
+from DTAF.server.correlation import Correlator, Expectation
+from DTAF.server.queues import BoundedQueue
+from DTAF.server.metrics import SocketMetrics
 """
 Sockets Module
 This socket module
@@ -45,6 +58,7 @@ default_model: dict = {
 # Typing
 Socket = typing.NewType("Socket", socket.socket)
 # Logger.setLevel(logging.DEBUG)
+_hot = hot_path_logger(__name__, Logger)
 
 
 class ServiceNotStarted(Exception):
@@ -107,7 +121,7 @@ class SocketThread(threading.Thread):
     the reactor will stop, and you will need to start a new socket thread.
     """
 
-    outbound_queue: queue.Queue = None
+    outbound_queue: BoundedQueue = None
     """
     Output queue.
 
@@ -115,7 +129,7 @@ class SocketThread(threading.Thread):
 
     the reactor will pick one after the incomming buffer have been processed.
     """
-    inbound_queue: queue.Queue = None
+    inbound_queue: BoundedQueue = None
     """
     input queue.
 
@@ -158,6 +172,146 @@ class SocketThread(threading.Thread):
     spread the messages from the socket.
     """
 
+    framer: FrameBuffer = None
+    """
+    Framing buffer, it keeps the bytes received from the socket until a full
+    message is available.
+
+    Set the ``framing`` argument to ``"length"`` to use length prefixed frames
+    (``length_format`` sets the :mod:`struct` format of the header) instead of
+    ``endline`` delimited ones.
+    """
+
+    recv_size: int = 4096
+    """
+    Maximum amount of bytes requested to the socket on each read.
+    """
+
+    zero_copy: bool = False
+    """
+    Set to True to receive frames as :class:`DTAF.server.framing.PooledFrame`
+    objects instead of ``bytes``.
+
+    The socket is always read straight into the framing buffer, with this flag
+    each frame is copied once into a buffer borrowed from :attr:`buffer_pool`
+    instead of allocating a new ``bytes`` object, which reduces the allocator
+    and GC pressure on high rate sockets. Call ``frame.release()`` (or use the
+    frame as a context manager) once consumed so its buffer is reused.
+    """
+
+    buffer_pool: BufferPool = None
+    """
+    Pool of frame buffers, only used when ``zero_copy`` is enabled. Its size
+    is set with the ``pool_buffer_size`` and ``pool_max_buffers`` arguments.
+    """
+
+    metrics: SocketMetrics = None
+    """
+    Counters of this socket (bytes, frames, timeouts, round-trip latency),
+    see :mod:`DTAF.server.metrics`.
+    """
+
+    correlator: Correlator = None
+    """
+    Request/response correlator.
+
+    Inbound messages matching an expectation registered with
+    ``write(message, expect=...)`` resolve its future instead of being queued.
+    Use the ``id_extractor`` argument to correlate by sequence id.
+    """
+
+    max_batch_size: int = 64
+    """
+    Maximum amount of outbound messages coalesced into a single send call,
+    limited to the buffers ``sendmsg`` accepts (:data:`DTAF.server.reactor.IOV_MAX`).
+    """
+
+    max_batch_bytes: int = 1 << 16
+    """
+    Maximum amount of bytes coalesced into a single send call, a message bigger
+    than this value is still sent, but on its own.
+    """
+
+    connection_states: tuple[str] = ("connecting", "connected", "reconnecting", "closed")
+    """
+    States reported to the state callbacks, see :meth:`add_state_callback`.
+    """
+
+    state: str = None
+    """
+    Current connection state, one of :attr:`connection_states`.
+    """
+
+    auto_reconnect: bool = False
+    """
+    Supervised mode flag.
+
+    When enabled, a lost connection (or a failed connection attempt) doesn't
+    stop the reactor, it keeps retrying with a capped exponential backoff
+    while the outbound messages stay queued.
+    """
+
+    reconnect_delay: float | int = 0.5
+    """
+    Delay before the first reconnection attempt, doubled on each failure.
+    """
+
+    reconnect_max_delay: float | int = 30
+    """
+    Maximum delay between reconnection attempts.
+    """
+
+    reconnect_jitter: float = 0.1
+    """
+    Random variation applied to each delay, as a fraction of it.
+    """
+
+    max_reconnect_attempts: int | None = None
+    """
+    Consecutive failed attempts before giving up, None to retry forever.
+    """
+
+    reconnects: int = 0
+    """
+    Amount of reconnection attempts done so far.
+    """
+
+    max_outbound: int = 0
+    """
+    Maximum amount of messages in the outbound queue, 0 means unbounded.
+    """
+
+    outbound_policy: str = "block"
+    """
+    What to do when the outbound queue is full, see
+    :mod:`DTAF.server.queues`:
+
+    * ``"block"``: waits up to ``write_timeout`` for room, then raises
+      ``TimeoutError``.
+    * ``"drop-newest"`` (or ``"drop"``): discards the new message, ``write``
+      returns 0.
+    * ``"drop-oldest"``: discards the oldest queued message.
+    * ``"spill"``: keeps the overflow in a temporary file.
+    """
+
+    max_inbound: int = 0
+    """
+    Maximum amount of messages in the inbound queue, 0 means unbounded.
+    """
+
+    inbound_policy: str = "drop-oldest"
+    """
+    What to do when the inbound queue is full, same policies as
+    ``outbound_policy``. ``"block"`` stops reading from the socket until the
+    test reads (TCP backpressure), avoid it with a shared reactor since it
+    would block every other socket.
+    """
+
+    write_timeout: float | int | None = None
+    """
+    Maximum time ``write`` blocks on a full outbound queue, None waits forever.
+    """
+
     SOCKET_TIMEOUT: int = 1
     """
     This timeout defines the waiting period of any request.
@@ -255,8 +409,14 @@ class SocketThread(threading.Thread):
         # Keeps a backup from the kwargs.
         self.kwargs = kwargs
         # Define new queues.
-        self.inbound_queue = queue.Queue()
-        self.outbound_queue = queue.Queue()
+        self.max_outbound = kwargs["max_outbound"] = kwargs.get("max_outbound", SocketThread.max_outbound)
+        self.outbound_policy = kwargs["outbound_policy"] = kwargs.get("outbound_policy", SocketThread.outbound_policy)
+        self.max_inbound = kwargs["max_inbound"] = kwargs.get("max_inbound", SocketThread.max_inbound)
+        self.inbound_policy = kwargs["inbound_policy"] = kwargs.get("inbound_policy", SocketThread.inbound_policy)
+        self.write_timeout = kwargs["write_timeout"] = kwargs.get("write_timeout", SocketThread.write_timeout)
+        self.inbound_queue = BoundedQueue(self.max_inbound, self.inbound_policy, kwargs.get("spill_dir", None))
+        self.outbound_queue = BoundedQueue(self.max_outbound, self.outbound_policy, kwargs.get("spill_dir", None))
+        self._tx_pending: list = []
         # sets thread LOCK object.
         self.lock = threading.Lock()
         # stores initial config for diagnostics.
@@ -267,7 +427,8 @@ class SocketThread(threading.Thread):
         kwargs["duid"] = kwargs.get("duid", "UNKNOWN")
         self.logger = logging.LoggerAdapter(Logger, {
             "uid": "{}-THREAD".format(kwargs["uid"]),
-            "duid": str(kwargs["duid"])
+            "duid": str(kwargs["duid"]),
+            "interface_class": self.__class__
         })
         #
         self.HOST = kwargs["host"] = kwargs.get("host", "")
@@ -280,6 +441,35 @@ class SocketThread(threading.Thread):
         self.SOCKET_TIMEOUT = kwargs["timeout"] = kwargs.get("timeout", 1)
         #
         self.endline = kwargs["endline"] = kwargs.get("endline", b'\n')
+        #
+        self.recv_size = kwargs["recv_size"] = kwargs.get("recv_size", SocketThread.recv_size)
+        self.max_batch_size = kwargs["max_batch_size"] = batch_size_limit(
+            kwargs.get("max_batch_size", SocketThread.max_batch_size))
+        self.max_batch_bytes = kwargs["max_batch_bytes"] = kwargs.get("max_batch_bytes", SocketThread.max_batch_bytes)
+        framing_kwargs: dict = {"max_size": kwargs.get("max_frame_size", FrameBuffer.max_size)}
+        if kwargs.get("framing", "delimiter") == "length":
+            framing_kwargs["length_format"] = kwargs.get("length_format", "!I")
+        else:
+            framing_kwargs["delimiter"] = self.endline
+        self.framer = new_frame_buffer(kwargs.get("framing", "delimiter"), **framing_kwargs)
+        self.zero_copy = kwargs["zero_copy"] = kwargs.get("zero_copy", SocketThread.zero_copy)
+        if self.zero_copy is True:
+            self.buffer_pool = BufferPool(kwargs.get("pool_buffer_size", BufferPool.buffer_size),
+                                          kwargs.get("pool_max_buffers", BufferPool.max_buffers))
+        self.correlator = Correlator(id_extractor=kwargs.get("id_extractor", None))
+        self.metrics = SocketMetrics(kwargs["uid"], kwargs["duid"], source=self)
+        # supervised connection.
+        self.auto_reconnect = kwargs["auto_reconnect"] = kwargs.get("auto_reconnect", SocketThread.auto_reconnect)
+        self.reconnect_delay = kwargs["reconnect_delay"] = kwargs.get("reconnect_delay", SocketThread.reconnect_delay)
+        self.reconnect_max_delay = kwargs["reconnect_max_delay"] = kwargs.get("reconnect_max_delay",
+                                                                              SocketThread.reconnect_max_delay)
+        self.reconnect_jitter = kwargs["reconnect_jitter"] = kwargs.get("reconnect_jitter",
+                                                                        SocketThread.reconnect_jitter)
+        self.max_reconnect_attempts = kwargs["max_reconnect_attempts"] = kwargs.get(
+            "max_reconnect_attempts", SocketThread.max_reconnect_attempts)
+        self.reconnects = 0
+        self.state_callbacks: list[typing.Callable] = list(kwargs.get("state_callbacks", []))
+        self._stop_event = threading.Event()
 
         # copy initial values for tracing.
         self._initial_config = copy.copy(kwargs)
@@ -298,6 +488,28 @@ class SocketThread(threading.Thread):
             "blocking",
             "timeout",
             "endline",
+            "recv_size",
+            "framing",
+            "length_format",
+            "max_frame_size",
+            "max_batch_size",
+            "max_batch_bytes",
+            "id_extractor",
+            "zero_copy",
+            "pool_buffer_size",
+            "pool_max_buffers",
+            "max_outbound",
+            "outbound_policy",
+            "max_inbound",
+            "inbound_policy",
+            "spill_dir",
+            "write_timeout",
+            "auto_reconnect",
+            "reconnect_delay",
+            "reconnect_max_delay",
+            "reconnect_jitter",
+            "max_reconnect_attempts",
+            "state_callbacks",
         ]
         self.logger.debug(f"SocketThread: __init__ :: HOST={self.HOST}, PORT = {self.PORT}")
         # copies over the key
@@ -359,7 +571,10 @@ class SocketThread(threading.Thread):
 
         Logic:
         ______
-        1. Takes one item from the `outgoing` queue and Sends it to `Remote`.
+        1. Takes all pending items from the `outgoing` queue and sends them to
+           `Remote` in scatter/gather calls of up to ``max_batch_size``
+           messages or ``max_batch_bytes`` bytes each. Nothing is sent when
+           the queue is empty, unless ``f_send_empty`` is set.
 
             ``output_queue -> remote``
 
@@ -396,67 +611,172 @@ class SocketThread(threading.Thread):
 
               ``local -> input_queue``
 
+        #. If the connection is lost and ``auto_reconnect`` is **ENABLED**,
+           the socket is reopened after ``reconnect_delay_for(attempt)``
+           seconds, the outbound messages stay queued meanwhile (a batch that
+           failed to be sent is sent again). Otherwise the reactor stops.
+
         """
         # self.output_queue are all messages that are going out.
         # self.input_queue are all messages that are comming in.
-        empty: bool = False
-        msg: bytes = b''
         self.keep_alive = True
+        self._stop_event.clear()
+        attempt: int = 0
         self.logger.debug("SocketThread: reactor :: DEBUG: loop started")
-        with socket.socket(self.PROTOCOL, self.SOCKET_TYPE) as _Socket:
-            # configures the socket.
-            self.Socket = _Socket
-            _Socket.setblocking(self.SOCKET_BLOCKING)
-            self.Socket.connect((self.HOST, self.PORT))
-            _Socket.settimeout(self.SOCKET_TIMEOUT)
-            self.logger.debug(
-                f"SocketThread: reactor :: Connecting with {self.HOST}:{self.PORT}, timeout: {self.SOCKET_TIMEOUT}, blocking: {self.SOCKET_BLOCKING}"
-            )
-            # starts loop.
-            while self.keep_alive is True:
-                msg = b''
-                self.logger.debug("SocketThread: Reactor :: DEBUG: loop started")
-                # ------------------
-                # WRITES INTO SOCKET.
-                # -------------------
-                empty = self.outbound_queue.empty()
-                self.logger.debug(f"SocketThread: Reactor :: DEBUG: requesting output message. queue.empty: {empty}.")
-                if empty is False:
-                    msg = self.outbound_queue.get_nowait() or b""
-                #TODO: ADD EMPTY MESSAGE HERE OR HEARTBEAT.
-                self.Socket.sendall(msg)
-                self.logger.info(f"SocketThread: Reactor :: Sent msg: {msg}.")
-                #
-                # ------------------
-                # READS FROM SOCKET.
-                # ------------------
-                try:
-                    msg = self._read_line(self.Socket, timeout=self.SOCKET_TIMEOUT)
-                except TimeoutError as error:
-                    self.logger.debug(f"SocketThread: Reactor :: read method timed-out: \n\tERROR: {error}.")
-                    msg = b''
-                except Exception as error:
-                    self.logger.error(
-                        f"SocketThread: Reactor :: Unexpected error happened while hearing from socket\n\tERROR: \t{error}\nTRACEBACK: \n{traceback.format_exc()}.\n--- <EXCEPTION END> ---"
+        while self.keep_alive is True:
+            self._set_state("connecting")
+            try:
+                with socket.socket(self.PROTOCOL, self.SOCKET_TYPE) as _Socket:
+                    # configures the socket.
+                    self.Socket = _Socket
+                    _Socket.setblocking(self.SOCKET_BLOCKING)
+                    self.Socket.connect((self.HOST, self.PORT))
+                    _Socket.settimeout(self.SOCKET_TIMEOUT)
+                    self.logger.debug(
+                        f"SocketThread: reactor :: Connecting with {self.HOST}:{self.PORT}, timeout: {self.SOCKET_TIMEOUT}, blocking: {self.SOCKET_BLOCKING}"
                     )
-                    msg = b''
-                self.inbound_queue.put(msg)
-                time.sleep(self.reactor_sleep_time)
-            self.logger.info("SocketThread: reactor :: reactor has stopped. closing the connection...")
-            # TODO: add shutdown methods here
+                    attempt = 0
+                    # partial frames from a previous connection are meaningless.
+                    self.framer.clear()
+                    self._set_state("connected")
+                    error: Exception = self._serve(_Socket)
+                    self.logger.info("SocketThread: reactor :: reactor has stopped. closing the connection...")
+                    # TODO: add shutdown methods here
+            except OSError as connect_error:
+                if self.auto_reconnect is False:
+                    raise
+                error = connect_error
+                self.logger.warning(f"SocketThread: reactor :: Unable to connect with {self.HOST}:{self.PORT}. "
+                                    f"ERROR: {error}")
+            if self.keep_alive is False or self.auto_reconnect is False:
+                break
+            if self.max_reconnect_attempts is not None and attempt >= self.max_reconnect_attempts:
+                self.logger.error(f"SocketThread: reactor :: Giving up after {attempt} reconnection attempts.")
+                break
+            delay: float = self.reconnect_delay_for(attempt)
+            attempt += 1
+            self.reconnects += 1
+            self._set_state("reconnecting", error)
+            self.logger.warning(f"SocketThread: reactor :: Reconnecting in {delay:.3f}s, attempt: {attempt}.")
+            self._stop_event.wait(delay)
         self.logger.info("SocketThread: reactor :: Connection closed.")
+        self.keep_alive = False
+        self.correlator.cancel_all()
         # TODO: Add any other finallizer and cleanup sequences here.
 
         # this is implicit because we're using the `with socket.socket` statement.
         # self.socket.close()
         self._closed = True
+        self._set_state("closed")
+
+    def _serve(self, _Socket: Socket) -> Exception | None:
+        """
+        Runs the read/write loop over a connected socket.
+
+        Returns the error that broke the connection, or None when the reactor
+        was stopped.
+        """
+        msg: bytes = b''
+        while self.keep_alive is True:
+            msg = b''
+            if _hot.trace:
+                self.logger.trace("SocketThread: Reactor :: DEBUG: loop started")
+            # ------------------
+            # WRITES INTO SOCKET.
+            # -------------------
+            # the batch is kept until it's fully sent, so it's sent again after a reconnection.
+            # every message queued at wakeup is sent before reading, the newer ones wait for the next loop so the
+            # reads aren't starved by a busy writer.
+            budget: int = self.outbound_queue.qsize()
+            sent: bool = False
+            try:
+                while True:
+                    if not self._tx_pending:
+                        if budget <= 0:
+                            break
+                        self._tx_pending = self._pop_outbound_batch()
+                        if not self._tx_pending:
+                            break
+                        budget -= len(self._tx_pending)
+                    self._send_batch(_Socket, self._tx_pending)
+                    if _hot.debug:
+                        self.logger.debug("SocketThread: Reactor :: Sent %d msg(s), %d bytes.", len(self._tx_pending),
+                                          sum(len(n) for n in self._tx_pending))
+                    self._tx_pending = []
+                    sent = True
+                if sent is False and self.f_send_empty is True and self.empty_response:
+                    #TODO: ADD HEARTBEAT HERE.
+                    _Socket.sendall(self.empty_response)
+            except OSError as error:
+                self.logger.error(f"SocketThread: Reactor :: Connection lost while sending. ERROR: {error}")
+                return error
+            #
+            # ------------------
+            # READS FROM SOCKET.
+            # ------------------
+            try:
+                msg = self._read_line(_Socket, timeout=self.SOCKET_TIMEOUT)
+            except TimeoutError as error:
+                if _hot.trace:
+                    self.logger.trace("SocketThread: Reactor :: read method timed-out: \n\tERROR: %s.", error)
+                self.metrics.read_timeouts += 1
+                msg = b''
+            except ConnectionError as error:
+                self.logger.error(f"SocketThread: Reactor :: Connection lost. ERROR: {error}")
+                return error
+            except Exception as error:
+                self.logger.error(
+                    f"SocketThread: Reactor :: Unexpected error happened while hearing from socket\n\tERROR: \t{error}\nTRACEBACK: \n{traceback.format_exc()}.\n--- <EXCEPTION END> ---"
+                )
+                msg = b''
+            # timed-out reads are not queued, `read` already returns b"" on timeout.
+            if msg:
+                self.metrics.frames_in += 1
+                if _hot.debug:
+                    self.logger.debug("SocketThread: Reactor :: Received [%d] bytes, message: `%s`", len(msg),
+                                      Payload(msg, direction="rx"))
+                self._queue_inbound(msg)
+            self.correlator.expire()
+            time.sleep(self.reactor_sleep_time)
+        return None
+
+    def reconnect_delay_for(self, attempt: int) -> float:
+        """
+        Returns the time to wait before the given reconnection attempt.
 
-    def _read_line(self, socket: Socket, sequence: bytes = b"\n", timeout: float | int = 1) -> bytes:
+        The delay grows exponentially from ``reconnect_delay`` up to
+        ``reconnect_max_delay``, then a random jitter of ``reconnect_jitter``
+        (fraction of the delay) is applied so many sockets dropped at once
+        don't reconnect at the same time.
+        """
+        delay: float = min(self.reconnect_max_delay, self.reconnect_delay * (2**min(attempt, 32)))
+        return max(0, delay * (1 + random.uniform(-self.reconnect_jitter, self.reconnect_jitter)))
+
+    def add_state_callback(self, callback: typing.Callable[[str, Exception | None], typing.Any]) -> None:
+        """
+        Registers a callback called with ``(state, error)`` each time the
+        connection state changes, see :attr:`connection_states`.
+
+        Callbacks run in the socket thread, they must not block.
+        """
+        self.state_callbacks.append(callback)
+
+    def _set_state(self, state: str, error: Exception = None) -> None:
+        self.state = state
+        for callback in tuple(self.state_callbacks):
+            try:
+                callback(state, error)
+            except Exception as callback_error:
+                self.logger.error(f"SocketThread: _set_state :: State callback {callback} failed. "
+                                  f"ERROR: {callback_error}")
+
+    def _read_line(self, socket: Socket, sequence: bytes = None, timeout: float | int = 1) -> bytes:
         """
         reads the input from the socket until a new line is found.
-        by default we're expecitng a simple `\\n` character.
+        by default we're expecting the thread's `endline` sequence.
         """
-        self.logger.debug("SocketThread: _read_line :: DEBUG: Reading line")
+        if _hot.trace:
+            self.logger.trace("SocketThread: _read_line :: DEBUG: Reading line")
         msg: bytes = b''
         if isinstance(timeout, (int, float)) is False:
             timeout = 120
@@ -469,37 +789,46 @@ class SocketThread(threading.Thread):
 
     def _read_until(self,
                     socket: Socket,
-                    sequence: bytes = b"\n",
+                    sequence: bytes = None,
                     timeout: float | int = 1,
                     timeout_exception: bool = True) -> bytes:
         """
         Reads the socket until we have a matching sequence in the message.
 
+        The socket is read in chunks of ``recv_size`` bytes into the framing
+        buffer, any byte after the sequence is kept for the next message.
+
+        sequence: defaults to None, which uses the framer's delimiter.
         Set timoeut to 0 to wait forever.
         raise_exception: defaults to True, set this to false to avoid raising a timeout exception.
         """
-        self.logger.debug(f"SocketThread:\t_read_until :: DEBUG: Reading until: {sequence}.")
         if isinstance(timeout, (int, float)) is False:
             timeout = 120
-        timeout = time.time() + timeout
-        msg: bytes = b''
-        now: float = time.time()
-        while (now := time.time()) < timeout:
-            self.logger.debug(f"SocketThread:\t_read_until :: DEBUG: loop started.")
-            dt = socket.recv(1)
-            msg = msg + dt
-            self.logger.debug(f"SocketThread:\t_read_until :: DEBUG: got message {msg}.")
-            # self.logger.debug(f"SocketThread: DEBUG: _read_until msg = {msg}, type: {type(msg)}")
-            if (msg == sequence) if len(msg) > 1 else (sequence in msg[-len(sequence):]):
-                return msg
-            # addded a delay to let the socket "breath" and process incomming messages
-            if dt:
-                continue
-            time.sleep(0.01)
-            # self.logger.debug(f"SocketThread: _read_until :: DEBUG: sleeping, looking for sequence, got: {msg}")
+        deadline: float = (time.time() + timeout) if timeout > 0 else math.inf
+        frame: bytes | PooledFrame | None = self._next_frame(sequence)
+        while frame is None and time.time() < deadline:
+            try:
+                received: int = self.framer.recv_into(socket, self.recv_size)
+            except (TimeoutError, BlockingIOError):
+                break
+            if not received:
+                raise ConnectionResetError("SocketThread:\t_read_until :: Connection closed by remote.")
+            self.metrics.bytes_in += received
+            frame = self._next_frame(sequence)
+        if frame is not None:
+            return frame
         if timeout_exception is False:
-            return msg
-        raise TimeoutError(f"SocketThread:\t_read_until :: socket Timed out. \tMESSAGE: {msg}")
+            return self.framer.flush()
+        raise TimeoutError(f"SocketThread:\t_read_until :: socket Timed out. \tBUFFERED: {len(self.framer)} bytes.")
+
+    def _next_frame(self, sequence: bytes = None) -> bytes | PooledFrame | None:
+        """
+        Pops the next frame from the framing buffer, as a pooled frame when
+        ``zero_copy`` is enabled.
+        """
+        if self.buffer_pool is not None:
+            return self.framer.next_frame_into(self.buffer_pool, sequence)
+        return self.framer.next_frame(sequence)
 
     def _read(self, socket: Socket, chars: int = 2) -> bytes:
         """
@@ -518,6 +847,90 @@ class SocketThread(threading.Thread):
             Logger.exception(error)
             raise
 
+    def _queue_inbound(self, msg: bytes) -> None:
+        """
+        Delivers an inbound message, either to the future waiting for it or
+        to the inbound queue.
+        """
+        if isinstance(msg, PooledFrame):
+            # futures outlive the frame buffers, these get a copy.
+            if len(self.correlator) and self.correlator.dispatch(msg.tobytes()):
+                msg.release()
+                return
+            self._put_inbound(msg)
+            return
+        if self.correlator.dispatch(msg) is False:
+            self._put_inbound(msg)
+
+    def _put_inbound(self, msg: bytes) -> None:
+        """
+        Puts a message in the inbound queue, applying its policy.
+        """
+        if self.inbound_queue.policy != "block":
+            if self.inbound_queue.put(msg) is False:
+                if _hot.debug:
+                    self.logger.debug("SocketThread: _put_inbound :: Inbound queue is full, message dropped: `%s`",
+                                      Payload(msg))
+                if isinstance(msg, PooledFrame):
+                    msg.release()
+            return
+        # waits for the reader, but doesn't hang a stopped reactor.
+        while True:
+            try:
+                self.inbound_queue.put(msg, timeout=self.SOCKET_TIMEOUT)
+                return
+            except queue.Full:
+                if self.keep_alive is False:
+                    return
+
+    def queue_stats(self) -> dict[str, dict]:
+        """
+        Returns the counters (size, high water mark, dropped and spilled
+        messages) of both queues.
+        """
+        return {"inbound": self.inbound_queue.stats(), "outbound": self.outbound_queue.stats()}
+
+    def _pop_outbound_batch(self) -> list[bytes]:
+        """
+        Takes all the pending messages from the outbound queue, up to
+        ``max_batch_size`` messages and ``max_batch_bytes`` bytes.
+
+        Empty messages are discarded.
+        """
+        batch: list[bytes] = []
+        size: int = 0
+        while len(batch) < self.max_batch_size:
+            try:
+                msg: bytes = self.outbound_queue.get_nowait()
+            except queue.Empty:
+                break
+            if not msg:
+                continue
+            batch.append(msg)
+            size += len(msg)
+            if size >= self.max_batch_bytes:
+                break
+        self.metrics.frames_out += len(batch)
+        return batch
+
+    _advance_buffers = staticmethod(advance_buffers)
+
+    def _send_batch(self, socket: Socket, batch: list[bytes]) -> None:
+        """
+        Sends a batch of messages with a single ``sendmsg`` (scatter/gather)
+        call, falling back to ``sendall`` where ``sendmsg`` isn't supported
+        (Windows).
+        """
+        if hasattr(socket, "sendmsg") is False:
+            data: bytes = b"".join(batch)
+            socket.sendall(data)
+            self.metrics.bytes_out += len(data)
+            return
+        while batch:
+            sent: int = socket.sendmsg(batch[:self.max_batch_size])
+            self.metrics.bytes_out += sent
+            batch = self._advance_buffers(batch, sent)
+
     def flush_input(self):
         """
         Flushes the input queue.
@@ -577,17 +990,56 @@ class SocketThread(threading.Thread):
 
     def stop_reactor(self) -> None:
         self.keep_alive = False
+        # interrupts any reconnection wait.
+        self._stop_event.set()
         return
 
-    def write(self, message: bytes) -> int:
+    def write(self,
+              message: bytes,
+              expect: Expectation = None,
+              timeout: float | int | None = None) -> int | concurrent.futures.Future:
+        """
+        Puts the message in the outbound queue.
+
+        Returns the amount of bytes queued, unless an expectation is provided
+        (prefix, regex, callable or sequence id, see
+        :mod:`DTAF.server.correlation`), in which case a future resolved with
+        the matching response is returned instead. The future fails with
+        ``TimeoutError`` once the timeout is reached.
+        """
         if isinstance(message, bytes) is False:
             raise ValueError(
                 f"SocketThread: write :: Error, invalid message type, it must be bytes, `{type(message)}` found")
-        self.outbound_queue.put(message)
-        self.logger.debug(
-            f"SocketThread: write :: put [{len(message)}] bytes into the outbound socket queue, message: `{message}`")
+        future: concurrent.futures.Future = None
+        # the expectation is registered before the message leaves, the response may arrive right away.
+        if expect is not None:
+            future = self.correlator.expect(expect, timeout=timeout)
+            future.add_done_callback(functools.partial(self._record_latency, time.perf_counter()))
+        try:
+            accepted: bool = self.outbound_queue.put(message, timeout=self.write_timeout)
+        except queue.Full:
+            accepted = False
+        if accepted is False:
+            error = TimeoutError(f"SocketThread: write :: Outbound queue is full ({self.max_outbound} messages), "
+                                 f"policy: {self.outbound_queue.policy}.")
+            if future is not None:
+                future.set_exception(error)
+                return future
+            if self.outbound_queue.policy != "block":
+                self.logger.warning(f"{error} Message dropped.")
+                return 0
+            raise error
+        if _hot.debug:
+            self.logger.debug("SocketThread: write :: put [%d] bytes into the outbound socket queue, message: `%s`",
+                              len(message), Payload(message, direction="tx"))
+        if future is not None:
+            return future
         return len(message)
 
+    def _record_latency(self, start: float, future: concurrent.futures.Future) -> None:
+        if future.cancelled() is False and future.exception() is None:
+            self.metrics.record_latency(time.perf_counter() - start)
+
     def manage_message(self, msg: bytes):
         """
         basic message manager.
@@ -597,19 +1049,23 @@ class SocketThread(threading.Thread):
         return True
 
     def read(self, timeout: float | int = 1, blocking: bool = True) -> bytes:
-        self.logger.debug("SocketThread: Read :: DEBUG: READ start")
+        if _hot.trace:
+            self.logger.trace("SocketThread: Read :: DEBUG: READ start")
         # Logic to wait for a new input. if empty is True.
         if self.inbound_queue.empty() is True:
-            self.logger.debug("SocketThread: Read :: Queue is empty. waiting..")
+            if _hot.trace:
+                self.logger.trace("SocketThread: Read :: Queue is empty. waiting..")
             # waits a full cycle before attepmting to get a message.
             # time.sleep(self.reactor_sleep_time)
             # We're going to wait forever for any message.
             if timeout is None:
-                self.logger.debug("SocketThread: Read :: queue blocking read. timeout=None")
+                if _hot.trace:
+                    self.logger.trace("SocketThread: Read :: queue blocking read. timeout=None")
                 return self.inbound_queue.get(blocking)
             # We're only waiting until timeout.
             elif timeout > 0:
-                self.logger.debug(f"SocketThread: Read :: queue blocking, awaiting queue. timeout > 0: {timeout}")
+                if _hot.trace:
+                    self.logger.trace("SocketThread: Read :: queue blocking, awaiting queue. timeout > 0: %s", timeout)
                 # sleeps for a cycle
                 # Blocks until timeout is breached.
                 try:
@@ -619,18 +1075,252 @@ class SocketThread(threading.Thread):
             # Tries to get the very next item immediately.
             else:
                 try:
-                    self.logger.debug(f"SocketThread: Read :: awaiting queue. timeout = {timeout}")
+                    if _hot.trace:
+                        self.logger.trace("SocketThread: Read :: awaiting queue. timeout = %s", timeout)
                     return self.inbound_queue.get(blocking, None)
                 except queue.Empty as error:
                     self.logger.exception("SocketThread: Read :: Connection Read() timed out, no message was found.",
                                           error)
                     return b""
         # Queue was not empty, returns first item from queue.
-        self.logger.debug(f"SocketThread: read :: queue is not empty.")
+        if _hot.trace:
+            self.logger.trace("SocketThread: read :: queue is not empty.")
         return self.inbound_queue.get_nowait()
 
 
-def JsonSocketThread(SocketThread):
+class ReactorSocketThread(SocketThread):
+    """
+    Reactor driven Socket.
+
+    Drop-in replacement of :class:`SocketThread` that doesn't own an OS thread,
+    instead, the socket is registered into a shared
+    :class:`DTAF.server.reactor.SocketReactor` that multiplexes all sockets in
+    one (or a few) threads and only wakes up when the socket is ready.
+
+    The ``inbound_queue`` and ``outbound_queue`` API is the same as in
+    :class:`SocketThread`, so the interface doesn't need to know which one is
+    being used.
+
+    Extra arguments:
+
+    * socket_reactor: SocketReactor, reactor to register in, taken from the
+      shared pool by default (see :func:`DTAF.server.reactor.get_reactor`).
+    """
+
+    socket_reactor: SocketReactor = None
+    """
+    Reactor this socket is registered in.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        self.socket_reactor = kwargs.pop("socket_reactor", None)
+        super().__init__(**kwargs)
+        self._closed_event = threading.Event()
+        self._reconnect_timer: threading.Timer = None
+        self._attempt: int = 0
+
+    def start(self) -> None:
+        """
+        Connects the socket and registers it in the reactor.
+
+        Unlike :meth:`threading.Thread.start` no new thread is created, the
+        connection is done synchronously so the socket is available as soon as
+        this method returns.
+
+        In supervised mode (``auto_reconnect``) a failed connection is retried
+        in the background instead of raising.
+        """
+        self._closed = False
+        self.keep_alive = True
+        if self.socket_reactor is None:
+            self.socket_reactor = get_reactor()
+        try:
+            self._connect()
+        except OSError as error:
+            if self.auto_reconnect is False:
+                self.keep_alive = False
+                raise
+            self._schedule_reconnect(error)
+
+    def _connect(self) -> None:
+        self._set_state("connecting")
+        _Socket = socket.socket(self.PROTOCOL, self.SOCKET_TYPE)
+        _Socket.settimeout(self.SOCKET_TIMEOUT)
+        try:
+            _Socket.connect((self.HOST, self.PORT))
+        except Exception:
+            _Socket.close()
+            raise
+        _Socket.setblocking(False)
+        self.Socket = _Socket
+        self._attempt = 0
+        self.framer.clear()
+        self.logger.debug(f"ReactorSocketThread: start :: Connected with {self.HOST}:{self.PORT}, "
+                          f"reactor: {self.socket_reactor.name}")
+        self._set_state("connected")
+        self.socket_reactor.register(self)
+        # messages queued while disconnected.
+        self.socket_reactor.request_write(self)
+
+    def _schedule_reconnect(self, error: Exception = None) -> None:
+        if self.max_reconnect_attempts is not None and self._attempt >= self.max_reconnect_attempts:
+            self.logger.error(f"ReactorSocketThread: reconnect :: Giving up after {self._attempt} attempts.")
+            self._finish_close(error)
+            return
+        delay: float = self.reconnect_delay_for(self._attempt)
+        self._attempt += 1
+        self.reconnects += 1
+        self._set_state("reconnecting", error)
+        self.logger.warning(f"ReactorSocketThread: reconnect :: Reconnecting in {delay:.3f}s, attempt: {self._attempt}.")
+        self._reconnect_timer = threading.Timer(delay, self._reconnect)
+        self._reconnect_timer.daemon = True
+        self._reconnect_timer.start()
+
+    def _reconnect(self) -> None:
+        self._reconnect_timer = None
+        if self.keep_alive is False:
+            self._finish_close()
+            return
+        try:
+            self._connect()
+        except OSError as error:
+            self.logger.warning(f"ReactorSocketThread: reconnect :: Unable to connect with {self.HOST}:{self.PORT}. "
+                                f"ERROR: {error}")
+            self._schedule_reconnect(error)
+
+    def is_alive(self) -> bool:
+        """
+        Returns True while the socket is registered in the reactor.
+        """
+        return self.Socket is not None and self._closed is False
+
+    def join(self, timeout: float | int = None) -> None:
+        """
+        Waits until the reactor closes the socket.
+        """
+        self._closed_event.wait(timeout)
+
+    def stop_reactor(self) -> None:
+        self.keep_alive = False
+        timer: threading.Timer = self._reconnect_timer
+        if timer is not None:
+            # waiting to reconnect, there's nothing registered in the reactor.
+            timer.cancel()
+            self._reconnect_timer = None
+            self._finish_close()
+        elif self.socket_reactor is not None:
+            self.socket_reactor.unregister(self)
+
+    def write(self,
+              message: bytes,
+              expect: Expectation = None,
+              timeout: float | int | None = None) -> int | concurrent.futures.Future:
+        result: int | concurrent.futures.Future = super().write(message, expect=expect, timeout=timeout)
+        if self.socket_reactor is not None:
+            self.socket_reactor.request_write(self)
+        return result
+
+    def fileno(self) -> int:
+        return self.Socket.fileno()
+
+    def handle_read(self) -> None:
+        """
+        Reads all the available data and queues every complete message.
+        """
+        try:
+            received: int = self.framer.recv_into(self.Socket, self.recv_size)
+        except (BlockingIOError, InterruptedError):
+            return
+        if not received:
+            self.logger.info("ReactorSocketThread: handle_read :: Connection closed by remote.")
+            self.socket_reactor.unregister(self)
+            return
+        self.metrics.bytes_in += received
+        while (frame := self._next_frame()) is not None:
+            self.metrics.frames_in += 1
+            if _hot.debug:
+                self.logger.debug("ReactorSocketThread: handle_read :: Received [%d] bytes, message: `%s`", len(frame),
+                                  Payload(frame, direction="rx"))
+            self._queue_inbound(frame)
+        self.correlator.expire()
+
+    def handle_write(self) -> bool:
+        """
+        Sends the pending messages, returns True if there's data left to send.
+        """
+        while True:
+            if not self._tx_pending:
+                self._tx_pending = self._pop_outbound_batch()
+                if not self._tx_pending:
+                    return False
+            try:
+                if hasattr(self.Socket, "sendmsg"):
+                    sent: int = self.Socket.sendmsg(self._tx_pending[:self.max_batch_size])
+                else:
+                    sent: int = self.Socket.send(b"".join(self._tx_pending))
+            except (BlockingIOError, InterruptedError):
+                return True
+            self.metrics.bytes_out += sent
+            if _hot.debug:
+                self.logger.debug("ReactorSocketThread: handle_write :: Sent %d bytes.", sent)
+            self._tx_pending = self._advance_buffers(self._tx_pending, sent)
+
+    def handle_close(self, error: Exception = None) -> None:
+        """
+        Closes the socket once the reactor has released it, in supervised
+        mode a reconnection is scheduled unless the socket was stopped.
+        """
+        try:
+            self.Socket.close()
+        finally:
+            if self.keep_alive is True and self.auto_reconnect is True and self.socket_reactor.keep_alive is True:
+                self.logger.warning(f"ReactorSocketThread: handle_close :: Connection lost. ERROR: {error}")
+                self._schedule_reconnect(error)
+            else:
+                self._finish_close(error)
+
+    def _finish_close(self, error: Exception = None) -> None:
+        self.keep_alive = False
+        self._closed = True
+        self._closed_event.set()
+        self.correlator.cancel_all(error)
+        self._set_state("closed", error)
+        self.logger.info("ReactorSocketThread: handle_close :: Connection closed.")
+
+
+def json_dumps(payload: typing.Any) -> bytes:
+    """
+    Serializes the payload into a compact JSON document.
+
+    Uses ``orjson`` when installed, the standard ``json`` module otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def json_loads(data: bytes | str) -> typing.Any:
+    """
+    Parses a JSON document, raises ``ValueError`` when the document is invalid.
+
+    Uses ``orjson`` when installed, the standard ``json`` module otherwise.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_frame_id(frame: bytes) -> typing.Any:
+    """
+    Returns the ``id`` of a JSON frame, used to correlate the responses.
+    """
+    payload = json_loads(frame)
+    if isinstance(payload, dict):
+        return payload.get("id", None)
+    return None
+
+
+class JsonSocketThread(SocketThread):
     """
     This is a simple Json based Socket.
 
@@ -641,9 +1331,52 @@ def JsonSocketThread(SocketThread):
     raw message over the socket, and what you expect is a simple json string
     that has the command, the arguments and kword argument to operate.
 
+    Each inbound frame (one JSON document per ``endline``) is decoded once and:
+
+    * If it's a command (or a list of commands, a batch request) it's executed
+      and, when the request carries an ``id``, the response is sent back:
+      ``{"id": 1, "result": ...}`` or ``{"id": 1, "error": "..."}``. Batch
+      requests are answered with a list of responses in a single frame.
+    * If it's a response to a :meth:`call`, it resolves its future.
+    * Otherwise the raw frame is queued in the inbound queue.
+
+    Commands registered with ``blocking=True`` are executed in a thread pool so
+    a slow command doesn't stall the socket.
+
     this is an example application of the SocketThread class.
     """
 
+    command_registry: dict[str, typing.Callable] = None
+    """
+    Commands available for the remote, by name.
+    """
+
+    blocking_commands: set[str] = None
+    """
+    Name of the commands executed in the thread pool.
+    """
+
+    executor: concurrent.futures.ThreadPoolExecutor = None
+    """
+    Thread pool for the blocking commands, started on first use.
+    """
+
+    max_workers: int = 4
+    """
+    Size of the thread pool for the blocking commands.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        kwargs["id_extractor"] = kwargs.get("id_extractor", json_frame_id)
+        max_workers: int = kwargs.pop("max_workers", JsonSocketThread.max_workers)
+        commands: dict = kwargs.pop("commands", {})
+        super().__init__(**kwargs)
+        self.max_workers = max_workers
+        self.command_registry = {}
+        self.blocking_commands = set()
+        for command_name, command in commands.items():
+            self.reg_json_command(command_name, command)
+
     def json_manager(self, msg: dict) -> bool:
         """
         Simple Json command message manager.
@@ -663,15 +1396,139 @@ def JsonSocketThread(SocketThread):
         args = (msg.get("args", []), msg.get("kwargs", {}))
         if command is None:
             raise RuntimeError(f"JsonSocket: Invalid Command: {command_name}")
-        Logger.trace(f"executing command: {command_name}, with arguments {args}")
+        if _hot.debug:
+            self.logger.debug("JsonSocketThread: json_manager :: executing command: %s, with arguments %s", command_name,
+                              Payload(args))
         result = command(*args[0], **args[1])
         return result
 
-    def reg_json_command(self, command_name: str, command: typing.Callable) -> bool:
+    def reg_json_command(self, command_name: str, command: typing.Callable, blocking: bool = False) -> bool:
+        """
+        Registers a new command.
+
+        Set ``blocking`` for commands that may take a while (I/O, sleeps,
+        hardware access), these will run in the thread pool.
+        """
         if command_name in self.command_registry:
             raise RuntimeError("JsonSocket: Command name already in use.")
-        self.command_name[command_name] = command
-        pass
+        if callable(command) is False:
+            raise TypeError(f"JsonSocket: Command must be callable. command: {command_name}")
+        self.command_registry[command_name] = command
+        if blocking is True:
+            self.blocking_commands.add(command_name)
+        return True
+
+    def send_json(self,
+                  payload: typing.Any,
+                  expect: Expectation = None,
+                  timeout: float | int | None = None) -> int | concurrent.futures.Future:
+        """
+        Serializes the payload and puts it in the outbound queue, framed as
+        configured (``framing``).
+        """
+        return self.write(self.framer.encode(json_dumps(payload)), expect=expect, timeout=timeout)
+
+    def call(self,
+             command: str,
+             args: list = None,
+             kwargs: dict = None,
+             timeout: float | int | None = None) -> concurrent.futures.Future:
+        """
+        Sends a command to the remote and returns a future resolved with its
+        decoded response.
+        """
+        uid: int = self.correlator.next_sequence()
+        request: dict = {"id": uid, "command": command, "args": args or [], "kwargs": kwargs or {}}
+        future: concurrent.futures.Future = concurrent.futures.Future()
+
+        def decode(response: concurrent.futures.Future):
+            try:
+                future.set_result(json_loads(response.result()))
+            except BaseException as error:
+                future.set_exception(error)
+
+        self.send_json(request, expect=uid, timeout=timeout).add_done_callback(decode)
+        return future
+
+    def stop_reactor(self) -> None:
+        super().stop_reactor()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _queue_inbound(self, msg: bytes) -> None:
+        if isinstance(msg, PooledFrame):
+            # commands and responses outlive the frame, json works on bytes.
+            with msg:
+                msg = msg.tobytes()
+        try:
+            payload = json_loads(msg)
+        except ValueError:
+            # not a json document, gets queued as is.
+            return super()._queue_inbound(msg)
+        if isinstance(payload, dict) and "command" in payload:
+            return self._handle_requests([payload], batch=False)
+        if isinstance(payload, list) and payload and all(
+                isinstance(request, dict) and "command" in request for request in payload):
+            return self._handle_requests(payload, batch=True)
+        uid = payload.get("id", None) if isinstance(payload, dict) else None
+        if self.correlator.dispatch(msg, key=uid) is False:
+            self._put_inbound(msg)
+
+    def _handle_requests(self, requests: list[dict], batch: bool) -> None:
+        """
+        Executes the requests inline, or in the thread pool when any of them
+        is blocking.
+        """
+        if self.blocking_commands and any(request["command"] in self.blocking_commands for request in requests):
+            if self.executor is None:
+                self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers,
+                                                                      thread_name_prefix=f"{self.uid}-JSON")
+            try:
+                self.executor.submit(self._run_requests, requests, batch)
+            except RuntimeError as error:
+                # the pool was shut down by stop_reactor.
+                self.logger.warning(f"JsonSocketThread: _handle_requests :: Request dropped. ERROR: {error}")
+            return
+        self._run_requests(requests, batch)
+
+    def _run_requests(self, requests: list[dict], batch: bool) -> None:
+        responses: list[dict] = []
+        for request in requests:
+            try:
+                response = {"id": request.get("id", None), "result": self.json_manager(request)}
+            except Exception as error:
+                self.logger.error(f"JsonSocketThread: _run_requests :: Command `{request['command']}` failed. "
+                                  f"ERROR: {error}")
+                response = {"id": request.get("id", None), "error": str(error)}
+            # requests without id are notifications, these don't get a response.
+            if "id" in request:
+                responses.append(response)
+        if not responses:
+            return
+        try:
+            data: bytes = json_dumps(responses if batch else responses[0])
+        except TypeError as error:
+            self.logger.error(f"JsonSocketThread: _run_requests :: Response is not serializable. ERROR: {error}")
+            errors = [{"id": response["id"], "error": str(error)} for response in responses]
+            data = json_dumps(errors if batch else errors[0])
+        self._send_response(self.framer.encode(data))
+
+    def _send_response(self, frame: bytes) -> None:
+        """
+        Queues a response frame.
+
+        The inline commands run in the reactor, the only consumer of the
+        outbound queue, so it can't wait for room in it: when the queue is
+        full the frame goes straight to the next batch.
+        """
+        if threading.current_thread() is not self or self.outbound_queue.policy != "block":
+            self.write(frame)
+            return
+        try:
+            self.outbound_queue.put(frame, block=False)
+        except queue.Full:
+            self._tx_pending.append(frame)
+            self.metrics.frames_out += 1
 
 
 class SocketInterface(InterfaceBase):
@@ -746,7 +1603,11 @@ class SocketInterface(InterfaceBase):
         uid = kwargs["uid"] = kwargs.get("uid", "UNKNOWN")
         duid = kwargs["duid"] = kwargs.get("duid", "UNKNOWN")
         self.daemon = daemon = kwargs.get("daemon", False)
-        self.logger = logging.LoggerAdapter(Logger, {"uid": str(uid), "duid": str(duid)})
+        self.logger = logging.LoggerAdapter(Logger, {
+            "uid": str(uid),
+            "duid": str(duid),
+            "interface_class": self.__class__
+        })
 
         # calls super method.
         super().__init__(**kwargs)
@@ -769,6 +1630,7 @@ class SocketInterface(InterfaceBase):
         # Setup the threaded socket.
         self.thread = self.socket_class(**kwargs)
         self.thread.daemon = daemon
+        self.thread.add_state_callback(self._on_state_change)
         self.thread.start()
         time.sleep(0.01)
         self.connection = weakref.proxy(self.thread.Socket, lambda *x: setattr(self, "connection", None))
@@ -796,7 +1658,8 @@ class SocketInterface(InterfaceBase):
         else:
             raise RuntimeError("SocketInterface: Unable to communicate with a dead thread.")
 
-        self.logger.debug(f"SocketInterface: read_impl :: DEBUG: CONNECTION: {connection}, TIMEOUT {timeout}")
+        if _hot.trace:
+            self.logger.trace("SocketInterface: read_impl :: DEBUG: CONNECTION: %s, TIMEOUT %s", connection, timeout)
         return self.thread.read()
         # if timeout is None:
         #     self.logger.debug(f"SocketInterface: read_impl :: DEBUG: RUNNING LOGIC FROM: if timeout is None:")
@@ -816,16 +1679,37 @@ class SocketInterface(InterfaceBase):
         managed inside the thread and logged directly into the logfile
         (managed by LoggerAdapter).
         """
-        self.logger.debug(f"SocketInterface: write_impl :: DEBUG: CONNECTION: {connection}, DATA {data}")
+        if _hot.debug:
+            self.logger.debug("SocketInterface: write_impl :: DEBUG: CONNECTION: %s, DATA %s", connection, Payload(data))
         if isinstance(data, bytes) is False:
             raise TypeError(
                 f"SocketInterface: write_impl :: wrong type for message, bytes was expected, got: `{type(data)}`")
-        # makes sure that the message has an endline
-        if b"\n" not in data[-len(self.endline):]:
-            data = data + b"\n"
+        # makes sure that the message is framed (has an endline or length header)
+        data = self.thread.framer.encode(data)
         #self.thread.output_queue.put(data)
         self.thread.write(data)
 
+    def request(self,
+                data: bytes,
+                expect: Expectation,
+                timeout: float | int | None = None) -> concurrent.futures.Future:
+        """
+        Writes a command and returns a future resolved with the response
+        matching ``expect`` (prefix, regex, callable or sequence id).
+
+        Many requests may be in flight at the same time, responses not matching
+        any request are still available through ``read``.
+
+        usage::
+
+            futures = [interface.request(b"GET %d" % n, expect=b"VALUE %d " % n, timeout=5) for n in range(10)]
+            values = [future.result() for future in futures]
+        """
+        if isinstance(data, bytes) is False:
+            raise TypeError(
+                f"SocketInterface: request :: wrong type for message, bytes was expected, got: `{type(data)}`")
+        return self.thread.write(self.thread.framer.encode(data), expect=expect, timeout=timeout)
+
     def connectoin_impl(self, ) -> object:
         raise NotImplementedError(
             "SocketInterface: connectoin_impl :: Unavailable, This method is not used for this kind of interface.")
@@ -879,18 +1763,221 @@ class SocketInterface(InterfaceBase):
         self.disconnect_impl(self.connection)
 
     def reconnect(self, ):
+        """
+        Replaces the socket thread with a new one.
+
+        Messages still waiting in the old outbound queue are moved to the new
+        thread, as well as the state callbacks.
+        """
         self.logger.info("Socketinterface: reconnect :: Removing links to old object...")
         # clean up old proxy.
+        old_thread: SocketThread = self.thread
         self.stop_thread()
+        old_thread.join(old_thread.SOCKET_TIMEOUT * 2)
         self.connection = None
         # Create new thread.
         self.logger.info("Socketinterface: reconnect :: A new socket object has been created, trying to reconnect.")
         self.thread = self.socket_class(**self.kwargs)
+        self.thread.daemon = self.daemon
+        self.thread.state_callbacks.extend(old_thread.state_callbacks)
+        for message in old_thread._tx_pending:
+            self.thread.outbound_queue.put(bytes(message))
+        while old_thread.outbound_queue.empty() is False:
+            self.thread.outbound_queue.put(old_thread.outbound_queue.get_nowait())
         self.thread.start()
         time.sleep(0.1)
         # Create new proxy.
-        self.connect = weakref.proxy(self.thread.socket, lambda *x: setattr(self, "connection", None))
+        self.connection = weakref.proxy(self.thread.Socket, lambda *x: setattr(self, "connection", None))
+
+    def metrics(self) -> dict[str, typing.Any]:
+        """
+        Returns the metrics of the socket: bytes and frames in/out, read
+        timeouts, reconnections, queue depths and round-trip latency
+        percentiles (seconds).
+
+        See :mod:`DTAF.server.metrics` to export every socket at once.
+        """
+        return self.thread.metrics.snapshot()
+
+    def add_state_callback(self, callback: typing.Callable[[str, Exception | None], typing.Any]) -> None:
+        """
+        Registers a callback called with ``(state, error)`` each time the
+        connection state changes (``"connecting"``, ``"connected"``,
+        ``"reconnecting"``, ``"closed"``).
+
+        Set ``auto_reconnect=True`` when creating the interface to keep the
+        connection supervised, see :class:`SocketThread`.
+        """
+        self.thread.add_state_callback(callback)
+
+    def _on_state_change(self, state: str, error: Exception = None) -> None:
+        # keeps the connection proxy pointing to the current socket.
+        if state == "connected" and self.thread is not None and self.thread.Socket is not None:
+            self.connection = weakref.proxy(self.thread.Socket, lambda *x: setattr(self, "connection", None))
 
 
 class JsonSocketInterface(SocketInterface):
     socket_class: SocketThread = JsonSocketThread
+
+    def reg_json_command(self, command_name: str, command: typing.Callable, blocking: bool = False) -> bool:
+        """
+        Registers a command the remote can call, see
+        :meth:`JsonSocketThread.reg_json_command`.
+        """
+        return self.thread.reg_json_command(command_name, command, blocking=blocking)
+
+    def call(self,
+             command: str,
+             args: list = None,
+             kwargs: dict = None,
+             timeout: float | int | None = None) -> concurrent.futures.Future:
+        """
+        Calls a command on the remote, returns a future resolved with the
+        decoded response.
+        """
+        return self.thread.call(command, args=args, kwargs=kwargs, timeout=timeout)
+
+
+class AsyncSocketInterface(InterfaceBase):
+    """
+    asyncio based socket interface.
+
+    Native coroutine API built on ``asyncio.StreamReader`` and
+    ``asyncio.StreamWriter``, meant for orchestrators already running an event
+    loop, no threads nor queues are involved so thousands of socket
+    conversations can share a single loop.
+
+    usage::
+
+        async with AsyncSocketInterface(host="127.0.0.1", port=8080) as interface:
+            await interface.write(b"command")
+            response = await interface.read_line()
+
+    port: int; port of the address where we're aiming to connect.
+    host: str; address to stablish a connection to.
+    protocol: socket.AddressFamily; use IPV4's AF_INET for general purposes.
+    endline: bytes; delimiter used by read_line and appended by write.
+    timeout: float | int | None; default timeout of every operation, None waits forever.
+    limit: int; buffer limit of the stream reader (maximum size of a line).
+    """
+
+    reader: asyncio.StreamReader = None
+    """
+    Stream reader of the current connection.
+    """
+
+    writer: asyncio.StreamWriter = None
+    """
+    Stream writer of the current connection.
+    """
+
+    host: str = "192.168.1.168"
+    port: int = 8080
+    protocol: socket.AddressFamily = socket.AF_INET
+    endline: bytes = b"\n"
+    timeout: float | int | None = None
+    limit: int = 1 << 16
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.port = kwargs.get("port", 8080)
+        self.host = kwargs.get("host", "192.168.1.168")
+        self.protocol = kwargs.get("protocol", socket.AF_INET)
+        self.endline = kwargs.get("endline", b"\n")
+        self.timeout = kwargs.get("timeout", None)
+        self.limit = kwargs.get("limit", 1 << 16)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.disconnect()
+
+    async def _wait(self, coroutine: typing.Awaitable, timeout: float | int | None) -> typing.Any:
+        if timeout is None:
+            timeout = self.timeout
+        if timeout is None:
+            return await coroutine
+        return await asyncio.wait_for(coroutine, timeout)
+
+    def is_connected(self) -> bool:
+        """
+        Returns True while the stream is open.
+        """
+        return self.writer is not None and self.writer.is_closing() is False
+
+    async def connect(self, timeout: float | int | None = None) -> None:
+        """
+        Opens the connection with the remote socket.
+        """
+        if self.is_connected():
+            return
+        self.reader, self.writer = await self._wait(
+            asyncio.open_connection(self.host, self.port, family=self.protocol, limit=self.limit), timeout)
+        self.connection = self.writer.get_extra_info("socket")
+        self.logger.info(f"AsyncSocketInterface: connect :: Connected with {self.host}:{self.port}")
+
+    async def disconnect(self) -> None:
+        """
+        Closes the connection and waits until the transport is released.
+        """
+        if self.writer is None:
+            return
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        self.logger.info(f"AsyncSocketInterface: disconnect :: Disconnected from {self.host}:{self.port}")
+        self.reader = self.writer = self.connection = None
+
+    async def read(self, size: int = -1, timeout: float | int | None = None) -> bytes:
+        """
+        Reads up to ``size`` bytes, set size to -1 to read until EOF.
+        """
+        return await self._wait(self.reader.read(size), timeout)
+
+    async def read_exactly(self, size: int, timeout: float | int | None = None) -> bytes:
+        """
+        Reads exactly ``size`` bytes, raises ``asyncio.IncompleteReadError`` if
+        the connection is closed before.
+        """
+        return await self._wait(self.reader.readexactly(size), timeout)
+
+    async def read_until(self, sequence: bytes = None, timeout: float | int | None = None) -> bytes:
+        """
+        Reads until the sequence is found, the sequence is included in the
+        returned message. Defaults to ``endline``.
+        """
+        return await self._wait(self.reader.readuntil(sequence or self.endline), timeout)
+
+    async def read_line(self, timeout: float | int | None = None) -> bytes:
+        """
+        Reads a single message ended by ``endline``.
+        """
+        return await self.read_until(self.endline, timeout=timeout)
+
+    async def write(self, data: bytes, timeout: float | int | None = None) -> int:
+        """
+        Writes the message (adding the endline if missing) and waits until the
+        transport buffer is drained.
+        """
+        if isinstance(data, bytes) is False:
+            raise TypeError(
+                f"AsyncSocketInterface: write :: wrong type for message, bytes was expected, got: `{type(data)}`")
+        if data.endswith(self.endline) is False:
+            data = data + self.endline
+        self.writer.write(data)
+        await self._wait(self.writer.drain(), timeout)
+        return len(data)
+
+
+class ReactorSocketInterface(SocketInterface):
+    """
+    Socket interface driven by the shared selector reactor.
+
+    Same API as :class:`SocketInterface`, but the socket doesn't own a thread,
+    allowing a single test host to drive hundreds of sockets.
+    """
+    socket_class: SocketThread = ReactorSocketThread
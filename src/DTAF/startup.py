@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+Startup Profiling Module
+========================
+
+Records how long DTAF takes to start: the import of every module and each
+step of :func:`DTAF.init`. It's disabled unless the ``DTAF_PROFILE_STARTUP``
+environment variable is set, then nothing but the flag check runs::
+
+    DTAF_PROFILE_STARTUP=1 python -c "import DTAF; DTAF.init()"
+    DTAF_PROFILE_STARTUP=startup.json python -m pytest tests
+
+``1`` prints the report into stderr, any other value is used as the filename
+of a JSON report (see :func:`report`), handy to track regressions. The report
+is written once :func:`DTAF.init` finishes, or at exit if it never ran.
+
+Import times are measured like ``python -X importtime``: ``duration``
+includes the nested imports, ``self_duration`` doesn't.
+"""
+import atexit
+import contextlib
+import dataclasses
+import json
+import os
+import sys
+import threading
+import time
+import typing
+
+g_warning_msg: tuple[str] = (
+    "Startup: Unable to write the startup profile `{path}`. ERROR: {error}",  # 0
+    "Startup: ",  # x
+)
+"""
+Global Warning Message pointer.
+"""
+
+setting: str = os.environ.get("DTAF_PROFILE_STARTUP", "")
+"""
+Value of the ``DTAF_PROFILE_STARTUP`` environment variable.
+"""
+
+enabled: bool = setting not in ("", "0")
+"""
+True if the startup is being profiled.
+"""
+
+
+@dataclasses.dataclass
+class StartupRecord:
+    """
+    Timing of an import or an init step.
+    """
+
+    kind: str
+    """
+    ``import`` or ``init``.
+    """
+    name: str
+    start: float
+    duration: float = 0.0
+    self_duration: float = 0.0
+    depth: int = 0
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        return dataclasses.asdict(self)
+
+
+records: list[StartupRecord] = []
+"""
+Records in completion order, nested entries come before their parent.
+"""
+
+_origin: float = time.perf_counter()
+_local: threading.local = threading.local()
+_reported: bool = False
+
+
+def _stack() -> list[list]:
+    stack: list[list] = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+@contextlib.contextmanager
+def timer(name: str, kind: str = "init") -> typing.Iterator[StartupRecord | None]:
+    """
+    Times the block as a record named ``name``, does nothing if the profiling
+    is disabled.
+    """
+    if enabled is False:
+        yield None
+        return
+    stack: list[list] = _stack()
+    record: StartupRecord = StartupRecord(kind=kind, name=name, start=time.perf_counter() - _origin, depth=len(stack))
+    # the record and the time spent by its children.
+    stack.append([record, 0.0])
+    try:
+        yield record
+    finally:
+        children: float = stack.pop()[1]
+        record.duration = time.perf_counter() - _origin - record.start
+        record.self_duration = record.duration - children
+        if stack:
+            stack[-1][1] += record.duration
+        records.append(record)
+
+
+def record(name: str, start: float, kind: str = "import") -> StartupRecord | None:
+    """
+    Adds a record started at ``start`` (a ``time.perf_counter`` value) that
+    finishes now, wrapping the records taken meanwhile.
+
+    Used for the blocks that start before the profiler, like the import of
+    the DTAF package itself.
+    """
+    if enabled is False:
+        return None
+    new: StartupRecord = StartupRecord(kind=kind, name=name, start=start - _origin)
+    new.duration = time.perf_counter() - start
+    new.self_duration = new.duration
+    for entry in records:
+        if entry.start >= new.start and entry.depth == 0:
+            new.self_duration -= entry.duration
+    for entry in records:
+        if entry.start >= new.start:
+            entry.depth += 1
+    records.append(new)
+    return new
+
+
+class _TimedLoader():
+    """
+    Wraps a module loader to time its execution.
+
+    The module gets its real loader back before running.
+    """
+
+    def __init__(self, loader: typing.Any) -> None:
+        self._loader: typing.Any = loader
+
+    def __getattr__(self, attr: str) -> typing.Any:
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec) -> typing.Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        module.__spec__.loader = self._loader
+        module.__loader__ = self._loader
+        with timer(module.__name__, kind="import"):
+            self._loader.exec_module(module)
+
+
+class ImportTimer():
+    """
+    Meta path finder timing the import of every module found after it.
+    """
+
+    def find_spec(self, name: str, path: typing.Any = None, target: typing.Any = None) -> typing.Any:
+        if getattr(_local, "finding", False) is True:
+            return None
+        _local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or hasattr(finder, "find_spec") is False:
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            _local.finding = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader)
+        return spec
+
+
+_import_timer: ImportTimer = ImportTimer()
+
+
+def install() -> None:
+    """
+    Starts timing the imports if the profiling is enabled.
+    """
+    if enabled is True and _import_timer not in sys.meta_path:
+        sys.meta_path.insert(0, _import_timer)
+        atexit.register(finish)
+
+
+def uninstall() -> None:
+    """
+    Stops timing the imports.
+    """
+    if _import_timer in sys.meta_path:
+        sys.meta_path.remove(_import_timer)
+
+
+def report(limit: int = 0) -> str:
+    """
+    Returns the records as a text table, slowest first.
+
+    ``limit`` keeps the first rows only, 0 for all.
+    """
+    rows: list[StartupRecord] = sorted(records, key=lambda record: record.duration, reverse=True)
+    if limit:
+        rows = rows[:limit]
+    lines: list[str] = [f"{'kind':<6} | {'total [ms]':>10} | {'self [ms]':>10} | name"]
+    for record in rows:
+        lines.append(f"{record.kind:<6} | {record.duration * 1000:>10.3f} | {record.self_duration * 1000:>10.3f} | "
+                     f"{'  ' * record.depth}{record.name}")
+    return "\n".join(lines)
+
+
+def finish() -> None:
+    """
+    Writes the report where ``DTAF_PROFILE_STARTUP`` says, only once.
+    """
+    global _reported
+    if enabled is False or _reported is True:
+        return
+    _reported = True
+    if setting == "1":
+        print(report(), file=sys.stderr)
+        return
+    try:
+        with open(setting, "w") as file:
+            json.dump([record.to_dict() for record in records], file, indent=1)
+    except OSError as error:
+        print(g_warning_msg[0].format(path=setting, error=error), file=sys.stderr)
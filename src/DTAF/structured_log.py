@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+"""
+Structured Log Module
+=====================
+
+Compact binary log of the DTAF loggers, made for the post-mortem of long runs.
+
+Every record keeps its fields (timestamp, level, uid, duid, interface class,
+direction, message and the raw payload bytes) instead of a formatted line. Two
+files are written side by side:
+
+* ``<name>.dlog``: the records, each one prefixed by its length.
+* ``<name>.dlog.idx``: one fixed size entry per record with its offset,
+  timestamp and the hashes of its uid, duid and interface class.
+
+Queries only scan the index (time ranges are bisected), then read the
+matching records, so searching a multi-GB run takes milliseconds::
+
+    from DTAF.structured_log import StructuredLogReader
+
+    with StructuredLogReader("DTAF_Interfaces - 0.dlog") as reader:
+        for entry in reader.query(duid="DUT-1", start=t0, end=t1):
+            print(entry.timestamp, entry.direction, entry.payload)
+        data = reader.stream(uid="3", direction="rx")  # bytes received.
+
+The payload and direction of a record come from the first
+:class:`DTAF.logger.Payload` argument of the log call, e.g.
+``logger.debug("write :: %s", Payload(data, direction="tx"))``. See
+``cli/dtaf_log.py`` for the command line tool.
+"""
+import bisect
+import dataclasses
+import datetime
+import logging
+import os
+import pathlib
+import struct
+import typing
+import zlib
+
+g_error_msg: tuple[str] = (
+    "StructuredLog: Invalid file `{path}`, it's not a DTAF structured log.",  # 0
+    "StructuredLog: Invalid direction `{direction}`, valid directions: {directions}",  # 1
+    "StructuredLog: ",  # x
+)
+"""
+List of error messages of this module.
+"""
+
+magic: bytes = b"DTAFLOG1"
+"""
+First bytes of every structured log (and index) file.
+"""
+
+index_suffix: str = ".idx"
+"""
+Suffix added to the log filename to name its index.
+"""
+
+directions: tuple[str] = ("", "rx", "tx")
+"""
+Valid directions, stored as their position.
+"""
+
+# length, timestamp, level, direction, uid, duid, interface class, message and payload sizes.
+_record: struct.Struct = struct.Struct("!IdBBHHHII")
+# offset, timestamp, uid, duid and interface class hashes, direction.
+_entry: struct.Struct = struct.Struct("!QdIIIB3x")
+
+
+def _text(value: typing.Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, type):
+        return value.__name__
+    return str(value)
+
+
+def _hash(value: str) -> int:
+    return zlib.crc32(value.encode("utf-8"))
+
+
+def _to_timestamp(value: float | datetime.datetime | str | None) -> float | None:
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value)
+    return value.timestamp()
+
+
+@dataclasses.dataclass
+class LogEntry:
+    """
+    Record of a structured log.
+    """
+
+    timestamp: float
+    level: int
+    direction: str
+    uid: str
+    duid: str
+    interface_class: str
+    message: str
+    payload: bytes
+    offset: int = 0
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        result: dict[str, typing.Any] = dataclasses.asdict(self)
+        result["level"] = logging.getLevelName(self.level)
+        result["payload"] = self.payload.hex()
+        return result
+
+
+class StructuredLogHandler(logging.Handler):
+    """
+    Writes the records into a structured log and its index.
+
+    Like :class:`DTAF.logger.BatchFileHandler`, the flushes can be deferred to
+    the asynchronous log writer through ``batched``.
+    """
+
+    batched: bool = False
+    """
+    True if the flushes are managed by the log writer.
+    """
+
+    def __init__(self, filename: str | pathlib.Path, mode: str = "w", level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        from DTAF.logger import Payload
+        self._payload_type: type = Payload
+        self.baseFilename: str = os.path.abspath(filename)
+        mode = "ab" if "a" in mode else "wb"
+        self.stream: typing.BinaryIO = open(self.baseFilename, mode)
+        self.index: typing.BinaryIO = open(self.baseFilename + index_suffix, mode)
+        if self.stream.tell() == 0:
+            self.stream.write(magic)
+        if self.index.tell() == 0:
+            self.index.write(magic)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.baseFilename} ({logging.getLevelName(self.level)})>"
+
+    def _payload(self, record: logging.LogRecord) -> tuple[bytes, str]:
+        # records from the asynchronous writer keep the payload in an attribute.
+        payload: typing.Any = getattr(record, "payload", None)
+        if isinstance(payload, self._payload_type) is False and isinstance(record.args, tuple):
+            payload = next((arg for arg in record.args if isinstance(arg, self._payload_type)), None)
+        if payload is None:
+            return b"", ""
+        data: typing.Any = payload.data
+        if isinstance(data, (bytes, bytearray, memoryview)) is False:
+            data = data.tobytes() if hasattr(data, "tobytes") else str(data).encode("utf-8")
+        return bytes(data), payload.direction
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            payload, direction = self._payload(record)
+            uid: bytes = _text(getattr(record, "uid", "")).encode("utf-8")
+            duid: bytes = _text(getattr(record, "duid", "")).encode("utf-8")
+            interface_class: bytes = _text(getattr(record, "interface_class", "")).encode("utf-8")
+            message: bytes = record.getMessage().encode("utf-8", "replace")
+            direction_id: int = directions.index(direction) if direction in directions else 0
+            header: bytes = _record.pack(_record.size + len(uid) + len(duid) + len(interface_class) + len(message) +
+                                         len(payload), record.created, record.levelno, direction_id, len(uid),
+                                         len(duid), len(interface_class), len(message), len(payload))
+            offset: int = self.stream.tell()
+            self.stream.write(b"".join((header, uid, duid, interface_class, message, payload)))
+            self.index.write(
+                _entry.pack(offset, record.created, zlib.crc32(uid), zlib.crc32(duid), zlib.crc32(interface_class),
+                            direction_id))
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        if self.batched is False:
+            self.flush_batch()
+
+    def flush_batch(self) -> None:
+        """
+        Flushes the log and the index, even in batched mode.
+        """
+        with self.lock:
+            if self.stream.closed is False:
+                self.stream.flush()
+                self.index.flush()
+
+    def close(self) -> None:
+        with self.lock:
+            self.batched = False
+            self.flush_batch()
+            self.stream.close()
+            self.index.close()
+        super().close()
+
+
+class StructuredLogReader:
+    """
+    Reads and queries a structured log through its index.
+
+    The index is rebuilt from the log if it's missing or shorter than the log
+    (e.g. the run was killed before the last flush).
+    """
+
+    def __init__(self, filename: str | pathlib.Path) -> None:
+        self.path: pathlib.Path = pathlib.Path(filename)
+        self.file: typing.BinaryIO = open(self.path, "rb")
+        if self.file.read(len(magic)) != magic:
+            self.file.close()
+            raise ValueError(g_error_msg[0].format(path=self.path))
+        self.offsets: list[int] = []
+        self.timestamps: list[float] = []
+        self.hashes: list[tuple[int, int, int, int]] = []
+        self.load_index()
+
+    def __enter__(self) -> "StructuredLogReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def close(self) -> None:
+        self.file.close()
+
+    @property
+    def index_path(self) -> pathlib.Path:
+        return self.path.with_name(self.path.name + index_suffix)
+
+    def load_index(self) -> None:
+        """
+        Loads the index, rebuilding it if needed.
+        """
+        data: bytes = b""
+        if self.index_path.exists():
+            data = self.index_path.read_bytes()
+        if data[:len(magic)] != magic:
+            self.rebuild_index()
+            return
+        body: memoryview = memoryview(data)[len(magic):]
+        body = body[:len(body) - len(body) % _entry.size]
+        self._set_entries(_entry.iter_unpack(body))
+        # checks the index covers the whole log.
+        end: int = len(magic)
+        if self.offsets:
+            self.file.seek(self.offsets[-1])
+            end = self.offsets[-1] + _record.unpack(self.file.read(_record.size))[0]
+        if end != os.fstat(self.file.fileno()).st_size:
+            self.rebuild_index()
+
+    def _set_entries(self, entries: typing.Iterable[tuple]) -> None:
+        self.offsets, self.timestamps, self.hashes = [], [], []
+        for offset, timestamp, uid, duid, interface_class, direction in entries:
+            self.offsets.append(offset)
+            self.timestamps.append(timestamp)
+            self.hashes.append((uid, duid, interface_class, direction))
+
+    def rebuild_index(self) -> None:
+        """
+        Scans the whole log and writes its index again.
+
+        A truncated last record (killed run) is ignored.
+        """
+        entries: list[tuple] = []
+        size: int = os.fstat(self.file.fileno()).st_size
+        offset: int = len(magic)
+        while offset + _record.size <= size:
+            self.file.seek(offset)
+            header: tuple = _record.unpack(self.file.read(_record.size))
+            if offset + header[0] > size:
+                break
+            strings: bytes = self.file.read(sum(header[4:7]))
+            uid, duid, interface_class = self._split(strings, header[4:7])
+            entries.append((offset, header[1], zlib.crc32(uid), zlib.crc32(duid), zlib.crc32(interface_class),
+                            header[3]))
+            offset += header[0]
+        with open(self.index_path, "wb") as index:
+            index.write(magic)
+            for entry in entries:
+                index.write(_entry.pack(*entry))
+        self._set_entries(entries)
+
+    @staticmethod
+    def _split(data: bytes, sizes: typing.Iterable[int]) -> list[bytes]:
+        parts: list[bytes] = []
+        position: int = 0
+        for size in sizes:
+            parts.append(data[position:position + size])
+            position += size
+        return parts
+
+    def read_entry(self, position: int) -> LogEntry:
+        """
+        Reads the record at the given position of the index.
+        """
+        offset: int = self.offsets[position]
+        self.file.seek(offset)
+        header: tuple = _record.unpack(self.file.read(_record.size))
+        uid, duid, interface_class, message, payload = self._split(self.file.read(header[0] - _record.size),
+                                                                   header[4:])
+        return LogEntry(timestamp=header[1],
+                        level=header[2],
+                        direction=directions[header[3]] if header[3] < len(directions) else "",
+                        uid=uid.decode("utf-8"),
+                        duid=duid.decode("utf-8"),
+                        interface_class=interface_class.decode("utf-8"),
+                        message=message.decode("utf-8", "replace"),
+                        payload=payload,
+                        offset=offset)
+
+    def query(self,
+              uid: typing.Any = None,
+              duid: typing.Any = None,
+              interface: typing.Any = None,
+              start: float | datetime.datetime | str = None,
+              end: float | datetime.datetime | str = None,
+              direction: str = None,
+              level: int = logging.NOTSET) -> typing.Iterator[LogEntry]:
+        """
+        Yields the records matching every given filter, in order.
+
+        ``start`` and ``end`` accept timestamps, datetimes or ISO strings, the
+        range is inclusive. The records are assumed to be written in time
+        order (one log per process).
+        """
+        if direction is not None and direction not in directions:
+            raise ValueError(g_error_msg[1].format(direction=direction, directions=directions))
+        first: int = 0
+        last: int = len(self.offsets)
+        start, end = _to_timestamp(start), _to_timestamp(end)
+        if start is not None:
+            first = bisect.bisect_left(self.timestamps, start)
+        if end is not None:
+            last = bisect.bisect_right(self.timestamps, end)
+        wanted: tuple = (
+            _hash(_text(uid)) if uid is not None else None,
+            _hash(_text(duid)) if duid is not None else None,
+            _hash(_text(interface)) if interface is not None else None,
+            directions.index(direction) if direction is not None else None,
+        )
+        for position in range(first, last):
+            hashes: tuple = self.hashes[position]
+            if any(value is not None and value != hashes[n] for n, value in enumerate(wanted)):
+                continue
+            entry: LogEntry = self.read_entry(position)
+            # hashes may collide, the fields are checked again.
+            if uid is not None and entry.uid != _text(uid):
+                continue
+            if duid is not None and entry.duid != _text(duid):
+                continue
+            if interface is not None and entry.interface_class != _text(interface):
+                continue
+            if entry.level < level:
+                continue
+            yield entry
+
+    def stream(self, **filters) -> bytes:
+        """
+        Rebuilds the byte stream of the matching records (see :meth:`query`),
+        usually filtered by uid and direction.
+        """
+        return b"".join(entry.payload for entry in self.query(**filters))
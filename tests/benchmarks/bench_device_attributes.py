@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Device attribute benchmark.
+
+Measures the interface lookup (``device.SERIAL_0``), the extra attribute
+lookup and assignment, and the ``store`` property of :class:`DeviceBase`
+against the former behavior (interfaces resolved by ``__getattr__``, a
+``dir()`` call per assignment and a deep copy per ``store`` access)::
+
+    PYTHONPATH=src python tests/benchmarks/bench_device_attributes.py --number 100000
+"""
+import argparse
+import copy
+import timeit
+import weakref
+
+from DTAF.devices.device import DeviceBase
+from DTAF.interfaces.interfaces import InterfaceBase
+
+
+class LegacyDevice(DeviceBase):
+    """
+    Accesses the attributes like DeviceBase used to.
+    """
+
+    @property
+    def store(self):
+        # the interfaces are left out: their proxies can't be deep copied.
+        return copy.deepcopy({key: value for key, value in super().store.items() if key != "interfaces"})
+
+    def _bind_interface(self, name, interface_reference):
+        pass
+
+    def __setattr__(self, attr, value):
+        if attr not in dir(self):
+            self._DeviceBase__store[attr] = value
+            return
+        object.__setattr__(self, attr, value)
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=100000, help="operations per measure.")
+    parser.add_argument("--interfaces", type=int, default=8, help="interfaces added to the device.")
+    arguments = parser.parse_args(argv)
+    interfaces: list[InterfaceBase] = [InterfaceBase() for _ in range(arguments.interfaces)]
+    for cls in (DeviceBase, LegacyDevice):
+        device = cls(name="DUT", description="benchmark device", timeout=1)
+        for n, interface in enumerate(interfaces):
+            device.add_interface(f"SERIAL_{n}", weakref.proxy(interface))
+        results: dict[str, float] = {
+            "interface": timeit.timeit(lambda: device.SERIAL_0, number=arguments.number),
+            "get extra": timeit.timeit(lambda: device.timeout, number=arguments.number),
+            "set extra": timeit.timeit(lambda: setattr(device, "timeout", 2), number=arguments.number),
+            "store": timeit.timeit(lambda: device.store["name"], number=arguments.number // 10) * 10,
+        }
+        for name, elapsed in results.items():
+            print(f"{cls.__name__:<12} {name:<10} {elapsed / arguments.number * 1e9:10.1f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
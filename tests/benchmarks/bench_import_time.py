@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Import time benchmark.
+
+Measures the cold start of ``import DTAF`` in fresh interpreters, with the
+lazy Factory registries (default) and with every interface backend imported
+up front (what ``import DTAF`` used to do). The ``init`` mode adds the
+deferred initialization (:func:`DTAF.init`: configuration file, log files)::
+
+    PYTHONPATH=src python tests/benchmarks/bench_import_time.py --runs 20
+    PYTHONPATH=src python tests/benchmarks/bench_import_time.py --profile
+
+``--profile`` prints the per module report of one run instead (see
+:mod:`DTAF.startup`). Backends whose library isn't installed are skipped in
+the eager run.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+lazy_code: str = """
+import sys, time
+start = time.perf_counter()
+import DTAF
+elapsed = time.perf_counter() - start
+print(elapsed, len(sys.modules))
+"""
+
+init_code: str = """
+import sys, time
+start = time.perf_counter()
+import DTAF
+DTAF.init()
+elapsed = time.perf_counter() - start
+print(elapsed, len(sys.modules))
+"""
+
+eager_code: str = """
+import sys, time
+start = time.perf_counter()
+import DTAF
+from DTAF.factory import Factory
+for name in Factory.classnames:
+    try:
+        Factory.get_class_by_name(name)
+    except ImportError:
+        pass
+elapsed = time.perf_counter() - start
+print(elapsed, len(sys.modules))
+"""
+
+
+def measure(code: str, runs: int) -> tuple[list[float], int]:
+    times: list[float] = []
+    modules: int = 0
+    for _ in range(runs):
+        output: str = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                     check=True).stdout.split()
+        times.append(float(output[-2]))
+        modules = int(output[-1])
+    return times, modules
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="interpreters started per mode.")
+    parser.add_argument("--profile", action="store_true", help="prints the startup profile of one run.")
+    arguments = parser.parse_args(argv)
+    if arguments.profile is True:
+        subprocess.run([sys.executable, "-c", "import DTAF; DTAF.init()"],
+                       env=dict(os.environ, DTAF_PROFILE_STARTUP="1"),
+                       check=True)
+        return
+    results: dict[str, tuple[list[float], int]] = {
+        "lazy": measure(lazy_code, arguments.runs),
+        "init": measure(init_code, arguments.runs),
+        "eager": measure(eager_code, arguments.runs),
+    }
+    for mode, (times, modules) in results.items():
+        print(f"{mode:<6} median: {statistics.median(times) * 1000:8.2f} ms  "
+              f"min: {min(times) * 1000:8.2f} ms  modules: {modules}")
+    lazy, eager = (statistics.median(results[mode][0]) for mode in ("lazy", "eager"))
+    print(f"cold start reduction: {(eager - lazy) * 1000:.2f} ms ({100 * (eager - lazy) / eager:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
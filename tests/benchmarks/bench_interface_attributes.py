@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Interface attribute benchmark.
+
+Measures the attribute assignment and lookup of :class:`InterfaceBase`
+instances, for declared fields and for the extra (model) attributes kept in
+the per instance store, against the former ``dir()`` based assignment::
+
+    PYTHONPATH=src python tests/benchmarks/bench_interface_attributes.py --number 100000
+"""
+import argparse
+import timeit
+
+from DTAF.interfaces.interfaces import InterfaceBase
+
+
+class BenchInterface(InterfaceBase):
+    port: str = None
+    """
+    Declared field.
+    """
+
+
+class LegacyInterface(BenchInterface):
+    """
+    Assigns the attributes like InterfaceBase used to (a ``dir()`` call per
+    assignment).
+    """
+
+    def __setattr__(self, attr, value):
+        if attr not in dir(self):
+            self._InterfaceBase__store[attr] = value
+            return
+        object.__setattr__(self, attr, value)
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=100000, help="operations per measure.")
+    parser.add_argument("--instances", type=int, default=1000, help="instances created per measure.")
+    arguments = parser.parse_args(argv)
+    for cls in (BenchInterface, LegacyInterface):
+        interface = cls(port="COM1", timeout=1)
+        results: dict[str, float] = {
+            "set field": timeit.timeit(lambda: setattr(interface, "port", "COM2"), number=arguments.number),
+            "set extra": timeit.timeit(lambda: setattr(interface, "timeout", 2), number=arguments.number),
+            "get field": timeit.timeit(lambda: interface.port, number=arguments.number),
+            "get extra": timeit.timeit(lambda: interface.timeout, number=arguments.number),
+        }
+        for name, elapsed in results.items():
+            print(f"{cls.__name__:<15} {name:<10} {elapsed / arguments.number * 1e9:10.1f} ns/op")
+        elapsed = timeit.timeit(lambda: cls(port="COM1", timeout=1, baudrate=9600), number=arguments.instances)
+        print(f"{cls.__name__:<15} {'create':<10} {elapsed / arguments.instances * 1e6:10.1f} us/instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ data: dict = {
         "add_interface",
         "remove_interface",
         "get_interfaces",
+        "refresh_fields",
     ],
 }
 
@@ -97,3 +98,33 @@ class TestDeviceBase(unittest.TestCase):
         Device.remove_interface("Interface_0")
         self.assertNotIn("Interface_0", Device.get_interfaces())
         Logger.info("Interface_0 Removed Successfully.")
+
+    def test_attribute_access(self):
+        Interface = DTAF.interfaces.interfaces.InterfaceBase()
+        Device = DTAF.devices.device.DeviceBase(name="DUT", timeout=1)
+        Other = DTAF.devices.device.DeviceBase()
+        Device.add_interface("SERIAL_0", weakref.proxy(Interface))
+        Device.add_interface("name", weakref.proxy(Interface))
+
+        # registered interfaces are bound attributes, unless the name is declared.
+        self.assertIn("SERIAL_0", vars(Device))
+        self.assertEqual(Device.SERIAL_0.uid, Interface.uid)
+        self.assertEqual(Device.name, "DUT")
+        self.assertEqual(Device.store["interfaces"]["name"].uid, Interface.uid)
+        # every device has its own store.
+        self.assertEqual(Other.get_interfaces(), [])
+        self.assertEqual(Device.timeout, 1)
+        with self.assertRaises(AttributeError):
+            Other.timeout
+
+        # the store is a read only view.
+        with self.assertRaises(TypeError):
+            Device.store["timeout"] = 2
+        Device.timeout = 2
+        self.assertEqual(Device.store["timeout"], 2)
+
+        Device.remove_interface("SERIAL_0")
+        with self.assertRaises(AttributeError):
+            Device.SERIAL_0
+        Device.clean_store()
+        self.assertEqual(Device.get_interfaces(), [])
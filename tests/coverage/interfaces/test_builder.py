@@ -21,15 +21,28 @@ data: dict = {
         "register_new_interface",
         "call_garbage_collector",
         "verify_registry",
+        "clean_dead_entries",
+        "start_maintenance",
+        "stop_maintenance",
         "validate_string",
         "load_string",
         "load_file",
+        "load_many",
+        "load_directory",
+        "reload_model",
+        "reload_file",
+        "watch_models",
+        "stop_watching",
+        "get_devices_by_file",
         "remove_interface_by_UID",
         "remove_interface_by_proxy",
         "remove_device_by_UID",
         "remove_device_by_proxy",
         "get_reference_by_UID",
         "get_UID_by_reference",
+        "get_UID_by_name",
+        "get_UIDs_by_name",
+        "get_interfaces_by_device",
         "interfaces",
         "devices",
         "root",
@@ -45,7 +58,17 @@ data: dict = {
         "type": "interface",
         "filename": "test_interface.yaml",
     },
-    "globals": {"Builder", "__all__"}
+    "globals": {
+        "Builder",
+        "LoadReport",
+        "ModelCache",
+        "ModelWatcher",
+        "RegistryMaintenance",
+        "ReloadReport",
+        "validate_model",
+        "parse_model_file",
+        "__all__",
+    }
 }
 
 sample_yaml_model: str = """
@@ -130,3 +153,30 @@ class TestBuilder(unittest.TestCase):
             Logger.info(f"value {getattr(Device,key)}")
             values.append(getattr(Device, key))
         Logger.warning(pprint.pformat(dict(zip(keys, values))))
+
+    def test_lookup_index(self):
+        Builder = DTAF.interfaces.builder.Builder
+        model = sample_yaml_model.replace("Device_0", "INDEX_DEVICE").replace("SERIAL_1", "INDEX_SERIAL")
+        Device = Builder.load_string(model)
+        duid = Device.uid
+        self.assertEqual(Builder.get_UID_by_name("INDEX_DEVICE"), duid)
+        self.assertEqual(Builder.get_UID_by_reference(Device), duid)
+        uids = Builder.get_interfaces_by_device(duid)
+        self.assertEqual(len(uids), 1)
+        self.assertEqual(Builder.get_UID_by_name("INDEX_SERIAL", duid=duid), uids[0])
+        Interface = Builder.get_reference_by_UID(uids[0])
+        self.assertIs(Interface, Builder.get_reference_by_UID(uids[0]))
+        self.assertEqual(Builder.get_UID_by_reference(Interface), uids[0])
+        # a second device with the same names.
+        Other = Builder.load_string(model)
+        self.assertEqual(Builder.get_UIDs_by_name("INDEX_DEVICE"), [duid, Other.uid])
+        with self.assertRaises(ValueError):
+            Builder.get_UID_by_name("INDEX_DEVICE")
+        # removing a device also removes its interfaces from every index.
+        self.assertTrue(Builder.remove_device_by_proxy(Device))
+        self.assertEqual(Builder.get_UIDs_by_name("INDEX_DEVICE"), [Other.uid])
+        self.assertNotIn(uids[0], Builder.interfaces)
+        self.assertEqual(Builder.get_UIDs_by_name("INDEX_SERIAL"), Builder.get_interfaces_by_device(Other.uid))
+        self.assertIsNone(Builder.get_UID_by_reference(object()))
+        Builder.remove_device_by_UID(Other.uid)
+        self.assertEqual(Builder.get_UIDs_by_name("INDEX_SERIAL"), [])
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import pathlib
+import tempfile
+import threading
+import unittest
+import pytest
+
+import DTAF.factory
+import DTAF.interfaces.builder
+from DTAF.interfaces.interfaces import InterfaceBase
+
+barrier: threading.Barrier = threading.Barrier(2, timeout=10)
+
+
+class BulkInterface(InterfaceBase):
+    """
+    Interface whose constructor waits for another one, like a slow hardware
+    probe.
+    """
+
+    name: str = None
+
+    def __init__(self, name: str, wait: bool = False, fail: bool = False, **kwargs):
+        self.name = name
+        if wait is True:
+            barrier.wait()
+        if fail is True:
+            raise ConnectionError(f"{name}: port not found")
+
+
+model_template: str = """
+Device:
+    name: "{name}"
+    description: "bulk load test device"
+    model: "bulk"
+    id: {id}
+    interfaces:
+        BulkInterface:
+            name: "{name}_IF"
+            id: {id}
+            hosted: true
+            wait: {wait}
+            fail: {fail}
+"""
+
+
+@pytest.mark.builder_bulk
+class TestBuilderBulk(unittest.TestCase):
+
+    def setUp(self):
+        DTAF.factory.Factory.register("BulkInterface", BulkInterface)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name)
+        self.Builder = DTAF.interfaces.builder.Builder
+        barrier.reset()
+
+    def tearDown(self):
+        DTAF.factory.Factory.unregister("BulkInterface")
+        self.directory.cleanup()
+
+    def write(self, filename: str, n: int, wait: bool = False, fail: bool = False) -> pathlib.Path:
+        path = self.path / filename
+        path.write_text(model_template.format(name=f"BULK_{n}", id=n, wait=str(wait).lower(),
+                                              fail=str(fail).lower()))
+        return path
+
+    def test_load_directory(self):
+        # both waiting interfaces must be created at the same time.
+        self.write("a.yaml", 1, wait=True)
+        self.write("b.yml", 2, wait=True)
+        self.write("c.yaml", 3, fail=True)
+        (self.path / "d.yaml").write_text("Device: [unclosed")
+        (self.path / "e.yaml").write_text("Device: {name: x}\nOther: {name: y}\n")
+        (self.path / "notes.txt").write_text("not a model")
+        devices = len(self.Builder.devices)
+        interfaces = len(self.Builder.interfaces)
+        report = self.Builder.load_directory(self.path, parse_workers=2, max_workers=4)
+        self.assertEqual(sorted(pathlib.Path(n).name for n in report.loaded), ["a.yaml", "b.yml"])
+        self.assertEqual(sorted(pathlib.Path(n).name for n in report.failed), ["c.yaml", "d.yaml", "e.yaml"])
+        self.assertFalse(report)
+        self.assertIn("port not found", report.errors[str(self.path / "c.yaml")][0])
+        # failed files don't leave anything registered.
+        self.assertEqual(len(self.Builder.devices), devices + 2)
+        self.assertEqual(len(self.Builder.interfaces), interfaces + 2)
+        device = report.loaded[str(self.path / "a.yaml")]
+        self.assertIn(device.uid, self.Builder.devices)
+
+    def test_validation(self):
+        path = self.write("a.yaml", 1)
+        filename, model, errors, warnings = DTAF.interfaces.builder.parse_model_file(path)
+        self.assertEqual((errors, warnings), ([], []))
+        self.assertIn("Device", model)
+        model["Device"]["id"] = "one"
+        del model["Device"]["interfaces"]["BulkInterface"]["hosted"]
+        errors, warnings = DTAF.interfaces.builder.validate_model(model)
+        self.assertEqual(errors, [])
+        self.assertEqual(len(warnings), 2)
+        errors, warnings = DTAF.interfaces.builder.validate_model(model, strict=True)
+        self.assertEqual((len(errors), warnings), (2, []))
+        report = self.Builder.load_many([path, self.path / "missing.yaml"], parse_workers=0)
+        self.assertEqual(list(report.loaded), [str(path)])
+        self.assertIn("Unable to read", report.errors[str(self.path / "missing.yaml")][0])
+        with self.assertRaises(ValueError):
+            self.Builder.load_directory(path)
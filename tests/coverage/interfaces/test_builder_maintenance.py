@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import gc
+import time
+import unittest
+import weakref
+import pytest
+
+import DTAF.interfaces.builder
+from DTAF.devices.device import DeviceBase
+from DTAF.interfaces.builder import RegistryMaintenance
+
+
+class MaintenanceDevice(DeviceBase):
+    pass
+
+
+@pytest.mark.builder_maintenance
+class TestBuilderMaintenance(unittest.TestCase):
+
+    def setUp(self):
+        self.Builder = DTAF.interfaces.builder.Builder
+
+    def tearDown(self):
+        self.Builder.stop_maintenance(timeout=5)
+
+    def test_verify_registry(self):
+        # registered proxies can't be finalized, the verification finds them dead.
+        device = MaintenanceDevice(name="MAINTENANCE_PROXY")
+        uid = self.Builder.register_new_device(weakref.proxy(device))
+        self.assertTrue(self.Builder.verify_registry())
+        self.assertIn(uid, self.Builder.devices)
+        del device
+        gc.collect()
+        # incremental: a full cycle of small batches finds it.
+        for _ in range(len(self.Builder.devices) + len(self.Builder.interfaces) + 1):
+            self.assertTrue(self.Builder.verify_registry(batch_size=1))
+        self.assertNotIn(uid, self.Builder.devices)
+        self.assertEqual(self.Builder.get_UIDs_by_name("MAINTENANCE_PROXY"), [])
+
+    def test_weak_entries(self):
+        device = MaintenanceDevice(name="MAINTENANCE_WEAK")
+        uid = self.Builder.register_new_device(device, weak=True)
+        proxy = self.Builder.get_reference_by_UID(uid)
+        self.assertEqual(proxy.name, "MAINTENANCE_WEAK")
+        self.assertEqual(self.Builder.get_UID_by_reference(device), uid)
+        del device, proxy
+        gc.collect()
+        # the finalizer marked the entry, it's cleaned without a full verification.
+        self.assertEqual(self.Builder.clean_dead_entries(), 1)
+        self.assertNotIn(uid, self.Builder.devices)
+        self.assertEqual(self.Builder.get_UIDs_by_name("MAINTENANCE_WEAK"), [])
+        # removed entries don't fire their finalizer.
+        device = MaintenanceDevice(name="MAINTENANCE_WEAK")
+        uid = self.Builder.register_new_device(device, weak=True)
+        self.Builder.remove_device_by_UID(uid)
+        del device
+        gc.collect()
+        self.assertEqual(self.Builder.clean_dead_entries(), 0)
+
+    def test_background(self):
+        thresholds = gc.get_threshold()
+        maintenance = self.Builder.start_maintenance(interval=0.05, batch_size=10, gc_interval=0.05,
+                                                     gc_thresholds=(5000, 20, 20))
+        self.assertIsInstance(maintenance, RegistryMaintenance)
+        self.assertIs(self.Builder.start_maintenance(), maintenance)
+        device = MaintenanceDevice(name="MAINTENANCE_BACKGROUND")
+        uid = self.Builder.register_new_device(device, weak=True)
+        del device
+        gc.collect()
+        deadline = time.monotonic() + 5
+        while uid in self.Builder.devices and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertNotIn(uid, self.Builder.devices)
+        self.assertEqual(gc.get_threshold(), (5000, 20, 20))
+        self.Builder.call_garbage_collector(background=True)
+        self.Builder.stop_maintenance(timeout=5)
+        self.assertFalse(maintenance.is_alive())
+        self.assertIsNone(self.Builder.maintenance)
+        self.assertEqual(gc.get_threshold(), thresholds)
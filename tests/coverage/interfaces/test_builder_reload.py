@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+import pathlib
+import tempfile
+import time
+import unittest
+import pytest
+
+import DTAF.factory
+import DTAF.interfaces.builder
+from DTAF.devices.device import DeviceBase
+from DTAF.interfaces.interfaces import InterfaceBase
+
+
+class ReloadInterface(InterfaceBase):
+    """
+    Interface counting its connections.
+    """
+
+    name: str = None
+    port: str = None
+    connections: list = []
+    disconnections: list = []
+
+    def connect_impl(self) -> object:
+        ReloadInterface.connections.append(self.port)
+        return f"connection to {self.port}"
+
+    def disconnect_impl(self) -> None:
+        ReloadInterface.disconnections.append(self.port)
+
+
+class OtherReloadInterface(ReloadInterface):
+    pass
+
+
+class ReloadDevice(DeviceBase):
+    pass
+
+
+model_template: str = """
+{cls}:
+    name: "{device}"
+    description: "hot reload test device"
+    model: "reload"
+    id: 7
+    interfaces:
+        ReloadInterface:
+            name: "RELOAD_IF"
+            port: "{port}"
+            timeout: {timeout}
+{extra}"""
+
+other_interface: str = """        OtherReloadInterface:
+            name: "OTHER_IF"
+            port: "other"
+"""
+
+
+@pytest.mark.builder_reload
+class TestBuilderReload(unittest.TestCase):
+
+    def setUp(self):
+        DTAF.factory.Factory.register("ReloadInterface", ReloadInterface)
+        DTAF.factory.Factory.register("OtherReloadInterface", OtherReloadInterface)
+        DTAF.factory.Factory.register("ReloadDevice", ReloadDevice)
+        ReloadInterface.connections = []
+        ReloadInterface.disconnections = []
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name) / "reload.yaml"
+        self.Builder = DTAF.interfaces.builder.Builder
+
+    def tearDown(self):
+        self.Builder.stop_watching(timeout=5)
+        for uid in self.Builder.get_devices_by_file(self.path):
+            self.Builder.remove_device_by_UID(uid)
+        DTAF.factory.Factory.unregister("ReloadInterface")
+        DTAF.factory.Factory.unregister("OtherReloadInterface")
+        DTAF.factory.Factory.unregister("ReloadDevice")
+        self.directory.cleanup()
+
+    def write(self, device="RELOAD_DEVICE", port="A", timeout=1, extra="", cls="Device"):
+        self.path.write_text(model_template.format(cls=cls, device=device, port=port, timeout=timeout, extra=extra))
+
+    def interface(self, name: str):
+        duid = self.Builder.get_devices_by_file(self.path)[0]
+        return self.Builder.get_reference_by_UID(self.Builder.get_UID_by_name(name, duid=duid))
+
+    def test_reload(self):
+        self.write()
+        Device = self.Builder.load_file(self.path)
+        duid = Device.uid
+        self.interface("RELOAD_IF").connect()
+        uid = self.interface("RELOAD_IF").uid
+        # unchanged model.
+        report = self.Builder.reload_file(self.path)
+        self.assertFalse(report)
+        self.assertEqual(report.kept, [duid, uid])
+        # timeout and device name change in place, the connection is kept.
+        self.write(device="RELOADED_DEVICE", timeout=3)
+        report = self.Builder.reload_file(self.path)
+        self.assertEqual(report.reconfigured, [duid, uid])
+        self.assertEqual(self.interface("RELOAD_IF").timeout, 3)
+        self.assertEqual(self.Builder.get_UID_by_name("RELOADED_DEVICE"), duid)
+        self.assertEqual(Device.name, "RELOADED_DEVICE")
+        self.assertEqual(ReloadInterface.connections, ["A"])
+        # new interface.
+        self.write(device="RELOADED_DEVICE", timeout=3, extra=other_interface)
+        report = self.Builder.reload_file(self.path)
+        self.assertEqual(report.created, self.Builder.get_UIDs_by_name("OTHER_IF"))
+        self.assertEqual(report.kept, [duid, uid])
+        other_uid = report.created[0]
+        # the port changed: replaced and connected again, the other interface is removed.
+        self.write(device="RELOADED_DEVICE", port="B", timeout=3)
+        report = self.Builder.reload_file(self.path)
+        self.assertEqual(report.removed, [other_uid])
+        self.assertEqual(self.Builder.get_UIDs_by_name("OTHER_IF"), [])
+        self.assertIn(uid, report.replaced)
+        self.assertNotIn(uid, self.Builder.interfaces)
+        self.assertEqual(self.interface("RELOAD_IF").uid, report.replaced[uid])
+        self.assertEqual(ReloadInterface.connections, ["A", "B"])
+        self.assertEqual(self.Builder.get_interfaces_by_device(duid), [report.replaced[uid]])
+        # invalid models change nothing.
+        self.path.write_text("Device: [unclosed")
+        with self.assertRaises(RuntimeError):
+            self.Builder.reload_file(self.path)
+        self.assertEqual(self.Builder.get_interfaces_by_device(duid), [report.replaced[uid]])
+
+    def test_device_class_change(self):
+        self.write(extra=other_interface)
+        Device = self.Builder.load_file(self.path)
+        duid = Device.uid
+        self.interface("RELOAD_IF").connect()
+        # the device is rebuilt: the old connections are closed, the same interfaces connect again.
+        self.write(extra=other_interface, cls="ReloadDevice")
+        report = self.Builder.reload_file(self.path)
+        self.assertFalse(report.errors)
+        self.assertIn(duid, report.replaced)
+        self.assertNotIn(duid, self.Builder.devices)
+        self.assertIsInstance(self.Builder.get_reference_by_UID(report.replaced[duid]), ReloadDevice)
+        self.assertEqual(ReloadInterface.disconnections, ["A"])
+        self.assertEqual(ReloadInterface.connections, ["A", "A"])
+        self.assertIsNotNone(self.interface("RELOAD_IF").connection)
+        self.assertIsNone(self.interface("OTHER_IF").connection)
+
+    def test_watcher(self):
+        self.write()
+        self.Builder.load_file(self.path)
+        watcher = self.Builder.watch_models(self.path.parent, interval=0.05)
+        self.write(timeout=5)
+        deadline = time.monotonic() + 5
+        while str(self.path) not in watcher.reports and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(watcher.reports[str(self.path)].reconfigured), 1)
+        self.assertEqual(self.interface("RELOAD_IF").timeout, 5)
+        # files not loaded are ignored.
+        (self.path.parent / "new.yaml").write_text("Device: {name: x}\n")
+        self.assertEqual(watcher.check(), {})
+        self.Builder.stop_watching(timeout=5)
+        self.assertFalse(watcher.is_alive())
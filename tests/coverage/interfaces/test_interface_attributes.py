@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import unittest
+import pytest
+
+from DTAF.interfaces.interfaces import InterfaceBase
+
+
+class FieldsInterface(InterfaceBase):
+    """
+    Interface with a declared field, setting attributes before the base
+    initialization.
+    """
+
+    port: str = None
+
+    def __init__(self, **kwargs):
+        self.early = kwargs.pop("early", None)
+        super().__init__(**kwargs)
+
+
+@pytest.mark.interface_attributes
+class TestInterfaceAttributes(unittest.TestCase):
+
+    def test_fields(self):
+        interface = FieldsInterface(port="COM1", timeout=1)
+        # declared names are instance attributes, the rest goes to the store.
+        self.assertEqual(vars(interface)["port"], "COM1")
+        self.assertNotIn("timeout", vars(interface))
+        self.assertEqual(interface.timeout, 1)
+        interface.timeout = 2
+        interface.port = "COM2"
+        self.assertEqual((interface.port, interface.timeout), ("COM2", 2))
+        self.assertIn("port", FieldsInterface.refresh_fields())
+        self.assertNotIn("port", InterfaceBase.refresh_fields())
+        del interface.timeout
+        with self.assertRaises(ValueError):
+            interface.timeout
+
+    def test_store_per_instance(self):
+        first = FieldsInterface(early="first", extra=[1])
+        second = FieldsInterface()
+        # attributes set before InterfaceBase.__init__ are kept, and not shared.
+        self.assertEqual(first.early, "first")
+        self.assertIsNone(second.early)
+        self.assertEqual(first.extra, [1])
+        with self.assertRaises(ValueError):
+            second.extra
+        self.assertIsNone(InterfaceBase._InterfaceBase__store)
+
+    def test_runtime_fields(self):
+        interface = FieldsInterface()
+        FieldsInterface.added = None
+        try:
+            FieldsInterface.refresh_fields()
+            interface.added = 1
+            self.assertEqual(vars(interface)["added"], 1)
+        finally:
+            del FieldsInterface.added
+            FieldsInterface.refresh_fields()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import os
+import pathlib
+import tempfile
+import unittest
+import pytest
+
+import DTAF.interfaces.builder
+from DTAF.config import Config
+from DTAF.interfaces.builder import ModelCache, get_model_cache, parse_model_file
+
+sample_model: str = """
+Device:
+    name: "CACHED_0"
+    description: "model cache test device"
+    model: "cache"
+    id: {id}
+    interfaces: {{}}
+"""
+
+
+@pytest.mark.model_cache
+class TestModelCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name)
+        self.cache_dir = self.path / "cache"
+        self.previous = Config.Builder.model_cache_dir
+        Config.Builder.update_entry("model_cache_dir", str(self.cache_dir))
+        self.model = self.path / "model.yaml"
+        self.model.write_text(sample_model.format(id=1))
+
+    def tearDown(self):
+        Config.Builder.update_entry("model_cache_dir", self.previous)
+        self.directory.cleanup()
+
+    def test_cache(self):
+        cache: ModelCache = get_model_cache()
+        self.assertEqual(cache.path, self.cache_dir)
+        self.assertIsNone(cache.get(self.model))
+        filename, data, errors, warnings = parse_model_file(self.model)
+        self.assertEqual(errors, [])
+        self.assertEqual(data["Device"]["id"], 1)
+        # the empty interfaces section is a warning, also kept in cache.
+        self.assertEqual(len(warnings), 1)
+        self.assertEqual(cache.get(self.model), (data, warnings))
+        self.assertEqual(parse_model_file(self.model, strict=True)[1:3], (None, warnings))
+        # touched, same content.
+        stat = self.model.stat()
+        os.utime(self.model, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(cache.get(self.model), (data, warnings))
+        # changed content.
+        self.model.write_text(sample_model.format(id=22))
+        self.assertIsNone(cache.get(self.model))
+        self.assertEqual(parse_model_file(self.model)[1]["Device"]["id"], 22)
+        self.assertEqual(cache.get(self.model)[0]["Device"]["id"], 22)
+        # stale or broken entries are ignored.
+        cache.entry_path(self.model).write_bytes(b"not a pickle")
+        self.assertIsNone(cache.get(self.model))
+        self.assertEqual(cache.clear(), 1)
+        self.assertFalse(cache.remove(self.model))
+
+    def test_invalid_models_not_cached(self):
+        self.model.write_text("Device: {name: x}\nOther: {name: y}\n")
+        self.assertEqual(parse_model_file(self.model)[1], None)
+        self.assertFalse(get_model_cache().entry_path(self.model).exists())
+
+    def test_load_file(self):
+        Builder = DTAF.interfaces.builder.Builder
+        Device = Builder.load_file(self.model)
+        self.assertIn(Device.uid, Builder.devices)
+        self.assertTrue(get_model_cache().entry_path(self.model).exists())
+        Device = Builder.load_file(self.model)
+        self.assertIn(Device.uid, Builder.devices)
+        Config.Builder.update_entry("model_cache", False)
+        try:
+            self.assertIsNone(get_model_cache())
+            self.assertEqual(parse_model_file(self.model, use_cache=False)[2], [])
+        finally:
+            Config.Builder.update_entry("model_cache", True)
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+import unittest
+import pytest
+
+from DTAF.interfaces.base.serial_interface import SerialInterface, SerialException
+from DTAF.interfaces.base.serial_reader import RingBuffer, SerialFrame, SerialReader
+
+
+class FakePort():
+    """
+    Minimal pyserial port: the test pushes the incoming bytes.
+    """
+
+    def __init__(self) -> None:
+        self.pending: bytearray = bytearray()
+        self.condition: threading.Condition = threading.Condition()
+        self.cancelled: bool = False
+        self.is_open: bool = True
+        self.error: Exception = None
+        self.reads: int = 0
+
+    def push(self, data: bytes) -> None:
+        with self.condition:
+            self.pending += data
+            self.condition.notify_all()
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.pending)
+
+    def read(self, size: int = 1) -> bytes:
+        with self.condition:
+            self.condition.wait_for(lambda: self.pending or self.cancelled or self.error, 1)
+            self.cancelled = False
+            if self.error is not None:
+                raise self.error
+            self.reads += 1
+            data: bytes = bytes(self.pending[:size])
+            del self.pending[:size]
+            return data
+
+    def cancel_read(self) -> None:
+        with self.condition:
+            self.cancelled = True
+            self.condition.notify_all()
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+@pytest.mark.serial_reader
+class TestSerialReader(unittest.TestCase):
+
+    def test_ring_buffer(self):
+        buffer = RingBuffer(8)
+        buffer.write(b"abcdef")
+        self.assertEqual(buffer.read(4), b"abcd")
+        # wraps around the end of the storage.
+        self.assertEqual(buffer.write(b"ghijk"), 0)
+        self.assertEqual(buffer.read(), b"efghijk")
+        # the oldest bytes are overwritten once full.
+        self.assertEqual(buffer.write(b"0123456789"), 2)
+        self.assertEqual((buffer.overwritten, buffer.total), (2, 21))
+        self.assertEqual(buffer.read_until(b"5"), b"2345")
+        self.assertEqual(buffer.read_until(b"x", size=2), b"67")
+        self.assertEqual(buffer.read_until(b"x", timeout=0.01), b"89")
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+
+    def test_blocking_read(self):
+        buffer = RingBuffer(64)
+        timer = threading.Timer(0.05, buffer.write, (b"late\n",))
+        timer.start()
+        self.assertEqual(buffer.read_until(b"\n", timeout=5), b"late\n")
+        timer.join()
+        start = time.monotonic()
+        self.assertEqual(buffer.read(4, timeout=0.05), b"")
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+    def test_reader(self):
+        port = FakePort()
+        received: list[SerialFrame] = []
+        reader = SerialReader(port, delimiter=b"\r\n", keep_delimiter=False)
+        reader.add_callback(received.append)
+        reader.start()
+        try:
+            port.push(b"T=21.5\r\nT=2")
+            port.push(b"1.6\r\nT=21.7\r\n")
+            frames = [reader.read_frame(timeout=5) for _ in range(3)]
+        finally:
+            reader.stop(5)
+        self.assertFalse(reader.is_alive())
+        self.assertEqual([frame.data for frame in frames], [b"T=21.5", b"T=21.6", b"T=21.7"])
+        self.assertEqual(received, frames)
+        self.assertTrue(all(frame.timestamp <= time.time() for frame in frames))
+        self.assertEqual(reader.bytes_read, 24)
+        self.assertEqual([(frame.start, frame.end) for frame in frames], [(0, 8), (8, 16), (16, 24)])
+        # the frames consumed their bytes, and the iterator ends with the reader.
+        self.assertEqual(reader.buffer.read(), b"")
+        self.assertEqual(list(reader.frames(timeout=5)), [])
+
+    def test_interface(self):
+        interface = SerialInterface(port="FAKE", timeout=1)
+        interface.serial = FakePort()
+        with self.assertRaises(SerialException):
+            next(interface.frames())
+        reader = interface.start_reader()
+        self.assertIs(interface.start_reader(), reader)
+        interface.serial.push(b"boot\nready\n>")
+        self.assertEqual(interface.read_line(), b"boot")
+        self.assertEqual(interface.read_until(None, match=b">"), b"ready\n>")
+        interface.serial.push(b"abc")
+        self.assertEqual(interface.read(3), b"abc")
+        interface.disconnect()
+        self.assertFalse(reader.is_alive())
+        self.assertIsNone(interface.reader)
+
+    def test_mixed_reads(self):
+        interface = SerialInterface(port="FAKE", timeout=1)
+        interface.serial = FakePort()
+        reader = interface.start_reader()
+        interface.serial.push(b"OK 1\nLINE 2\nLINE 3\nPROMPT> ")
+        # every byte is returned once, by the raw reads or by the lines.
+        self.assertEqual(interface.read_until(None, match=b"\n"), b"OK 1\n")
+        self.assertEqual(interface.read_line(), b"LINE 2")
+        self.assertEqual(interface.read(3), b"LIN")
+        # the line partially read is skipped.
+        self.assertEqual(interface.read_line(), b"")
+        self.assertEqual(interface.read_until(None, match=b"> "), b"E 3\nPROMPT> ")
+        interface.serial.push(b"LINE 4\n")
+        self.assertEqual(next(interface.frames(timeout=5)).data, b"LINE 4\n")
+        self.assertEqual(len(reader.buffer), 0)
+        interface.stop_reader()
+
+    def test_port_error(self):
+        interface = SerialInterface(port="FAKE", timeout=1)
+        interface.serial = FakePort()
+        reader = interface.start_reader()
+        interface.serial.push(b"partial")
+        self.assertEqual(interface.read(7), b"partial")
+        interface.serial.error = OSError("device unplugged")
+        interface.serial.cancel_read()
+        reader.join(5)
+        self.assertIsInstance(reader.error, OSError)
+        with self.assertRaises(SerialException):
+            interface.read(1)
+        interface.stop_reader()
+
+    def test_port_error_lines(self):
+        interface = SerialInterface(port="FAKE", timeout=1)
+        interface.serial = FakePort()
+        reader = interface.start_reader()
+        interface.serial.push(b"last\npartial")
+        self.assertEqual(interface.read_line(), b"last")
+        interface.serial.error = OSError("device unplugged")
+        interface.serial.cancel_read()
+        reader.join(5)
+        # the raw buffer still holds bytes, but there are no more lines.
+        with self.assertRaises(SerialException):
+            interface.read_line()
+        with self.assertRaises(SerialException):
+            list(interface.frames(timeout=5))
+        self.assertEqual(interface.read(7), b"partial")
+        interface.stop_reader()
+
+    def test_default_logger(self):
+        port = FakePort()
+        port.error = OSError("device unplugged")
+        reader = SerialReader(port)
+        with self.assertLogs(reader.logger.logger, "WARNING") as logs:
+            reader.start()
+            reader.join(5)
+        self.assertIn("device unplugged", logs.output[0])
+        # the interface loggers need the device ids to format the records.
+        record = logs.records[0]
+        self.assertEqual((record.uid, record.duid), ("DTAF-SerialReader", "SERIAL_READER"))
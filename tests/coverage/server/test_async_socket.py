@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# General Imports.
+import asyncio
+import unittest
+import pytest
+
+# imports DTAF
+import DTAF
+from DTAF.server import AsyncSocketInterface
+
+
+async def echo_handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    while (data := await reader.read(4096)):
+        writer.write(data)
+        await writer.drain()
+    writer.close()
+
+
+@pytest.mark.server_socket_async
+class TestAsyncSocketInterface(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = await asyncio.start_server(echo_handler, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_read_write(self):
+        async with AsyncSocketInterface(host="127.0.0.1", port=self.port, uid=0, duid=1, timeout=5) as interface:
+            self.assertTrue(interface.is_connected())
+            self.assertEqual(await interface.write(b"hello"), 6)
+            self.assertEqual(await interface.read_line(), b"hello\n")
+            await interface.write(b"key=value\n")
+            self.assertEqual(await interface.read_until(b"="), b"key=")
+            self.assertEqual(await interface.read_exactly(6), b"value\n")
+            with self.assertRaises(TypeError):
+                await interface.write("not bytes")
+        self.assertFalse(interface.is_connected())
+
+    async def test_read_timeout(self):
+        async with AsyncSocketInterface(host="127.0.0.1", port=self.port, uid=0, duid=1) as interface:
+            with self.assertRaises(TimeoutError):
+                await interface.read_line(timeout=0.1)
+
+    async def test_concurrent_conversations(self):
+        interfaces = [AsyncSocketInterface(host="127.0.0.1", port=self.port, uid=n, duid=1, timeout=5)
+                      for n in range(100)]
+        await asyncio.gather(*(interface.connect() for interface in interfaces))
+
+        async def conversation(interface: AsyncSocketInterface, index: int) -> bytes:
+            await interface.write(f"message {index}".encode())
+            return await interface.read_line()
+
+        responses = await asyncio.gather(*(conversation(interface, n) for n, interface in enumerate(interfaces)))
+        self.assertEqual(responses, [f"message {n}\n".encode() for n in range(100)])
+        await asyncio.gather(*(interface.disconnect() for interface in interfaces))
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# General Imports.
+import concurrent.futures
+import re
+import time
+import unittest
+import pytest
+
+# imports DTAF
+import DTAF
+from DTAF.server.correlation import Correlator
+from DTAF.server.sockets import SocketThread
+
+
+@pytest.mark.server_socket_correlation
+class TestCorrelator(unittest.TestCase):
+
+    def test_matchers(self):
+        correlator = Correlator()
+        by_prefix = correlator.expect(b"OK ")
+        by_str = correlator.expect("TEMP=")
+        by_regex = correlator.expect(re.compile(rb"^VOLT=\d+"))
+        by_callable = correlator.expect(lambda frame: frame.endswith(b"!\n"))
+        self.assertEqual(len(correlator), 4)
+        # unmatched frames are not consumed.
+        self.assertFalse(correlator.dispatch(b"event: boot\n"))
+        self.assertTrue(correlator.dispatch(b"alarm!\n"))
+        self.assertTrue(correlator.dispatch(b"VOLT=12\n"))
+        self.assertTrue(correlator.dispatch(b"TEMP=30\n"))
+        self.assertTrue(correlator.dispatch(b"OK done\n"))
+        self.assertEqual(by_prefix.result(0), b"OK done\n")
+        self.assertEqual(by_str.result(0), b"TEMP=30\n")
+        self.assertEqual(by_regex.result(0), b"VOLT=12\n")
+        self.assertEqual(by_callable.result(0), b"alarm!\n")
+        self.assertEqual(len(correlator), 0)
+
+    def test_fifo_order(self):
+        correlator = Correlator()
+        futures = [correlator.expect(b"ACK") for _ in range(3)]
+        for index in range(3):
+            correlator.dispatch(b"ACK %d" % index)
+        self.assertEqual([future.result(0) for future in futures], [b"ACK 0", b"ACK 1", b"ACK 2"])
+
+    def test_sequence_id(self):
+        correlator = Correlator(id_extractor=lambda frame: int(frame.split(b":")[0]))
+        ids = [correlator.next_sequence() for _ in range(3)]
+        futures = {uid: correlator.expect(uid) for uid in ids}
+        with self.assertRaises(ValueError):
+            correlator.expect(ids[0])
+        # responses arrive out of order.
+        for uid in reversed(ids):
+            self.assertTrue(correlator.dispatch(b"%d:value" % uid))
+        self.assertFalse(correlator.dispatch(b"not an id"))
+        for uid in ids:
+            self.assertEqual(futures[uid].result(0), b"%d:value" % uid)
+        with self.assertRaises(ValueError):
+            Correlator().expect(1)
+
+    def test_expire_and_cancel(self):
+        correlator = Correlator()
+        expired = correlator.expect(b"never", timeout=0)
+        cancelled = correlator.expect(b"cancelled")
+        cancelled.cancel()
+        pending = correlator.expect(b"pending")
+        time.sleep(0.01)
+        self.assertEqual(correlator.expire(), 2)
+        with self.assertRaises(TimeoutError):
+            expired.result(0)
+        # the cancelled future doesn't consume the frame.
+        self.assertFalse(correlator.dispatch(b"cancelled"))
+        correlator.cancel_all()
+        with self.assertRaises(ConnectionError):
+            pending.result(0)
+
+    def test_socket_thread_routing(self):
+        thread = SocketThread(uid="correlation", duid="correlation")
+        future = thread.write(b"READ 1\n", expect=b"VALUE 1", timeout=5)
+        self.assertIsInstance(future, concurrent.futures.Future)
+        self.assertEqual(thread.write(b"PING\n"), 5)
+        self.assertEqual(thread._pop_outbound_batch(), [b"READ 1\n", b"PING\n"])
+        thread._queue_inbound(b"PONG\n")
+        thread._queue_inbound(b"VALUE 1 = 42\n")
+        self.assertEqual(future.result(0), b"VALUE 1 = 42\n")
+        self.assertEqual(thread.read(timeout=0.1), b"PONG\n")
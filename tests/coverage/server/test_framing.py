@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# General Imports.
+import unittest
+import pytest
+import pickle
+import socket
+import struct
+
+# imports DTAF
+import DTAF
+from DTAF.server.framing import (BufferPool, FrameBuffer, LengthPrefixedFrameBuffer, FramingError, PooledFrame,
+                                 new_frame_buffer)
+from DTAF.server.sockets import SocketThread
+
+
+@pytest.mark.server_socket_framing
+class TestFrameBuffer(unittest.TestCase):
+
+    def test_split_and_leftover(self):
+        framer = FrameBuffer(b"\n")
+        framer.feed(b"first\nsecond\nthi")
+        self.assertEqual(list(framer), [b"first\n", b"second\n"])
+        self.assertIsNone(framer.next_frame())
+        self.assertEqual(len(framer), 3)
+        framer.feed(b"rd\n")
+        self.assertEqual(framer.next_frame(), b"third\n")
+        self.assertEqual(len(framer), 0)
+
+    def test_multi_byte_delimiter(self):
+        framer = FrameBuffer(b"\r\n", keep_delimiter=False)
+        # the delimiter is split between two chunks.
+        framer.feed(b"OK\r")
+        self.assertIsNone(framer.next_frame())
+        framer.feed(b"\nERROR\r\n")
+        self.assertEqual(list(framer), [b"OK", b"ERROR"])
+
+    def test_delimiter_override(self):
+        framer = FrameBuffer(b"\n")
+        framer.feed(b"prompt> value\n")
+        self.assertEqual(framer.next_frame(b"> "), b"prompt> ")
+        self.assertEqual(framer.next_frame(), b"value\n")
+        # a miss doesn't hide the bytes already buffered from another delimiter.
+        framer.feed(b"abc;def")
+        self.assertIsNone(framer.next_frame())
+        self.assertEqual(framer.next_frame(b";"), b"abc;")
+        self.assertIsNone(framer.next_frame(b";"))
+        framer.feed(b";\n")
+        self.assertEqual(framer.next_frame(), b"def;\n")
+
+    def test_max_size(self):
+        framer = FrameBuffer(b"\n", max_size=8)
+        with self.assertRaises(FramingError):
+            framer.feed(b"0123456789")
+        self.assertEqual(len(framer), 0)
+
+    def test_encode(self):
+        framer = FrameBuffer(b"\r\n")
+        self.assertEqual(framer.encode(b"cmd"), b"cmd\r\n")
+        self.assertEqual(framer.encode(b"cmd\r\n"), b"cmd\r\n")
+
+    def test_length_prefixed(self):
+        framer = new_frame_buffer("length", length_format="!H")
+        self.assertIsInstance(framer, LengthPrefixedFrameBuffer)
+        data = framer.encode(b"hello") + framer.encode(b"") + framer.encode(b"world\n")
+        # feeds the stream one byte at a time.
+        frames = []
+        for index in range(len(data)):
+            framer.feed(data[index:index + 1])
+            frames.extend(framer)
+        self.assertEqual(frames, [b"hello", b"", b"world\n"])
+        with self.assertRaises(FramingError):
+            framer.encode(b"x" * (1 << 16))
+
+    def test_socket_thread_read_until(self):
+        local, remote = socket.socketpair()
+        thread = SocketThread(uid="framing", duid="framing", endline=b"\r\n")
+        try:
+            local.settimeout(1)
+            remote.sendall(b"line one\r\nline two\r\npartial")
+            self.assertEqual(thread._read_line(local, timeout=1), b"line one\r\n")
+            # the second line was already buffered by the previous read.
+            self.assertEqual(thread._read_line(local, timeout=1), b"line two\r\n")
+            with self.assertRaises(TimeoutError):
+                thread._read_line(local, timeout=0.2)
+            remote.sendall(b" line\r\n")
+            self.assertEqual(thread._read_line(local, timeout=1), b"partial line\r\n")
+            remote.close()
+            with self.assertRaises(ConnectionError):
+                thread._read_line(local, timeout=1)
+        finally:
+            local.close()
+
+
+@pytest.mark.server_socket_framing
+class TestZeroCopy(unittest.TestCase):
+
+    def test_recv_into(self):
+        local, remote = socket.socketpair()
+        framer = FrameBuffer(b"\n", capacity=64)
+        with local, remote:
+            for index in range(200):
+                remote.sendall(b"frame %03d\n" % index)
+                self.assertEqual(framer.recv_into(local, 64), 10)
+                self.assertEqual(framer.next_frame(), b"frame %03d\n" % index)
+            # the storage is reused, it never grows.
+            self.assertEqual(len(framer.buffer), 64)
+            remote.close()
+            self.assertEqual(framer.recv_into(local, 64), 0)
+
+    def test_next_view(self):
+        framer = FrameBuffer(b"\n", keep_delimiter=False)
+        framer.feed(b"abc\ndef\n")
+        view = framer.next_view()
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(view, b"abc")
+        view.release()
+        self.assertEqual(framer.next_frame(), b"def")
+
+    def test_pool(self):
+        pool = BufferPool(buffer_size=16, max_buffers=2)
+        framer = FrameBuffer(b"\n")
+        framer.feed(b"first\nsecond\n" + b"x" * 20 + b"\n")
+        with framer.next_frame_into(pool) as frame:
+            self.assertIsInstance(frame, PooledFrame)
+            self.assertEqual(frame, b"first\n")
+            self.assertEqual(len(frame), 6)
+            self.assertTrue(frame.startswith(b"fir"))
+            self.assertTrue(frame.endswith(b"t\n"))
+            self.assertEqual(bytes(frame[:5]), b"first")
+        self.assertEqual(len(pool), 1)
+        second = framer.next_frame_into(pool)
+        self.assertEqual(pool.reused, 1)
+        self.assertEqual(pickle.loads(pickle.dumps(second)), b"second\n")
+        second.release()
+        # bigger than the pooled buffers, it's not kept by the pool.
+        big = framer.next_frame_into(pool)
+        self.assertEqual(big.tobytes(), b"x" * 20 + b"\n")
+        big.release()
+        big.release()
+        self.assertEqual(len(pool), 1)
+
+    def test_socket_thread_zero_copy(self):
+        local, remote = socket.socketpair()
+        thread = SocketThread(uid="zero-copy", duid="zero-copy", zero_copy=True)
+        with local, remote:
+            local.settimeout(1)
+            remote.sendall(b"one\ntwo\n")
+            future = thread.write(b"GET\n", expect=b"two")
+            for _ in range(2):
+                thread._queue_inbound(thread._read_line(local, timeout=1))
+            # correlated frames are copied, the rest are queued as pooled frames.
+            self.assertEqual(future.result(0), b"two\n")
+            frame = thread.read(timeout=1)
+            self.assertIsInstance(frame, PooledFrame)
+            self.assertEqual(frame, b"one\n")
+            frame.release()
+            self.assertEqual(len(thread.buffer_pool), 2)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# General Imports.
+import json
+import socket
+import struct
+import threading
+import unittest
+import unittest.mock
+import pytest
+
+# imports DTAF
+import DTAF
+from DTAF.server import sockets
+from DTAF.server.sockets import JsonSocketThread
+
+
+@pytest.mark.server_socket_json
+class TestJsonSocketThread(unittest.TestCase):
+
+    options: dict = {}
+
+    def setUp(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.release = threading.Event()
+        self.thread = JsonSocketThread(host="127.0.0.1",
+                                       port=self.server.getsockname()[1],
+                                       uid="json",
+                                       duid="json",
+                                       timeout=0.05,
+                                       commands={"add": lambda a, b: a + b},
+                                       **self.options)
+        self.thread.reg_json_command("slow", self.release.wait, blocking=True)
+        self.thread.daemon = True
+        self.thread.start()
+        self.conn, _ = self.server.accept()
+        self.conn.settimeout(5)
+        self.remote = self.conn.makefile("rb")
+
+    def tearDown(self):
+        self.release.set()
+        self.thread.stop_reactor()
+        self.thread.join(5)
+        self.remote.close()
+        self.conn.close()
+        self.server.close()
+
+    def send(self, payload):
+        self.conn.sendall(json.dumps(payload).encode() + b"\n")
+
+    def receive(self):
+        return json.loads(self.remote.readline())
+
+    def test_command(self):
+        self.send({"id": 1, "command": "add", "args": [1, 2]})
+        self.assertEqual(self.receive(), {"id": 1, "result": 3})
+        self.send({"id": 2, "command": "add", "kwargs": {"a": "x", "b": "y"}})
+        self.assertEqual(self.receive(), {"id": 2, "result": "xy"})
+        # notifications don't get a response.
+        self.send({"command": "add", "args": [1, 1]})
+        self.send({"id": 3, "command": "unknown"})
+        self.assertEqual(self.receive(), {"id": 3, "error": "JsonSocket: Invalid Command: unknown"})
+        with self.assertRaises(RuntimeError):
+            self.thread.reg_json_command("add", print)
+
+    def test_batch(self):
+        self.send([{"id": 1, "command": "add", "args": [1, 2]}, {"id": 2, "command": "add", "args": [1]}])
+        result, error = self.receive()
+        self.assertEqual(result, {"id": 1, "result": 3})
+        self.assertEqual(error["id"], 2)
+        self.assertIn("error", error)
+
+    def test_blocking_command_does_not_stall(self):
+        self.send({"id": 1, "command": "slow", "args": [5]})
+        self.send({"id": 2, "command": "add", "args": [2, 2]})
+        self.assertEqual(self.receive(), {"id": 2, "result": 4})
+        self.release.set()
+        self.assertEqual(self.receive(), {"id": 1, "result": True})
+
+    def test_call_and_raw_frames(self):
+        future = self.thread.call("remote_add", args=[1, 2], timeout=5)
+        request = self.receive()
+        self.assertEqual(request["command"], "remote_add")
+        self.assertEqual(request["args"], [1, 2])
+        self.conn.sendall(b"not json\n")
+        self.send({"id": request["id"], "result": 3})
+        self.assertEqual(future.result(5), {"id": request["id"], "result": 3})
+        self.assertEqual(self.thread.read(timeout=5), b"not json\n")
+
+
+@pytest.mark.server_socket_json
+class TestJsonSocketFraming(TestJsonSocketThread):
+    """
+    Same tests with length prefixed frames.
+    """
+
+    options: dict = {"framing": "length"}
+
+    def send(self, payload):
+        data = json.dumps(payload).encode()
+        self.conn.sendall(struct.pack("!I", len(data)) + data)
+
+    def receive(self):
+        size = struct.unpack("!I", self.remote.read(4))[0]
+        return json.loads(self.remote.read(size))
+
+    def test_call_and_raw_frames(self):
+        future = self.thread.call("remote_add", args=[1, 2], timeout=5)
+        request = self.receive()
+        self.send({"id": request["id"], "result": 3})
+        self.assertEqual(future.result(5), {"id": request["id"], "result": 3})
+
+
+@pytest.mark.server_socket_json
+class TestJsonSocketFullQueue(TestJsonSocketThread):
+    """
+    Inline commands answering while the bounded outbound queue is full.
+    """
+
+    options: dict = {"max_outbound": 1}
+
+    def test_full_outbound_queue(self):
+        # runs in the reactor, which is the consumer of the queue.
+        self.thread.reg_json_command("fill", lambda: self.thread.outbound_queue.put(b'{"queued":true}\n'))
+        self.send({"id": 1, "command": "fill"})
+        received = [self.receive(), self.receive()]
+        self.assertIn({"id": 1, "result": True}, received)
+        self.assertIn({"queued": True}, received)
+        self.send({"id": 2, "command": "add", "args": [2, 2]})
+        self.assertEqual(self.receive(), {"id": 2, "result": 4})
+
+
+@pytest.mark.server_socket_json
+class TestJsonCodec(unittest.TestCase):
+
+    def test_stdlib_fallback(self):
+        payload = {"id": 1, "result": [1, "two", None]}
+        encoded = sockets.json_dumps(payload)
+        with unittest.mock.patch.object(sockets, "orjson", None):
+            self.assertEqual(sockets.json_dumps(payload), encoded)
+            self.assertEqual(sockets.json_loads(encoded), payload)
+            with self.assertRaises(ValueError):
+                sockets.json_loads(b"{invalid")
+            with self.assertRaises(TypeError):
+                sockets.json_dumps({"value": object()})
+        self.assertEqual(sockets.json_frame_id(encoded), 1)
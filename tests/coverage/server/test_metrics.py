@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# General Imports.
+import pathlib
+import random
+import tempfile
+import unittest
+import pytest
+
+# imports DTAF
+import DTAF
+from DTAF.server import SocketServer, metrics
+from DTAF.server.metrics import LatencyHistogram, SocketMetrics
+from DTAF.server.sockets import ReactorSocketThread
+
+
+@pytest.mark.server_socket_metrics
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        values = [random.uniform(0.0001, 2) for _ in range(10000)]
+        for value in values:
+            histogram.record(value)
+        values.sort()
+        for percentile in (50, 90, 99, 99.9):
+            expected = values[int(len(values) * percentile / 100) - 1]
+            # within the histogram precision.
+            self.assertAlmostEqual(histogram.percentile(percentile), expected, delta=expected * 0.07)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["count"], 10000)
+        self.assertAlmostEqual(snapshot["max"], values[-1], places=5)
+        self.assertAlmostEqual(snapshot["min"], values[0], places=5)
+        with self.assertRaises(ValueError):
+            histogram.percentile(101)
+
+    def test_cumulative_counts(self):
+        histogram = LatencyHistogram()
+        for value in (0.0001, 0.002, 0.02, 0.2, 20):
+            histogram.record(value)
+        self.assertEqual(histogram.cumulative_counts((0.001, 0.01, 0.1, 1, 10)), [1, 2, 3, 4, 4])
+        histogram.reset()
+        self.assertEqual(histogram.percentile(50), 0)
+
+
+@pytest.mark.server_socket_metrics
+class TestSocketMetrics(unittest.TestCase):
+
+    def test_socket_round_trip(self):
+        with SocketServer(host="127.0.0.1", port=0, message_manager=lambda client, frame: b"ACK " + frame) as server:
+            thread = ReactorSocketThread(host="127.0.0.1", port=server.address[1], uid="metrics", duid="DUT-1")
+            thread.start()
+            futures = [thread.write(b"command %d\n" % n, expect=b"ACK command %d\n" % n, timeout=5) for n in range(10)]
+            for future in futures:
+                future.result(5)
+            thread.write(b"unsolicited\n")
+            self.assertEqual(thread.read(timeout=5), b"ACK unsolicited\n")
+            snapshot = thread.metrics.snapshot()
+            thread.stop_reactor()
+            thread.join(5)
+        self.assertEqual(snapshot["uid"], "metrics")
+        self.assertEqual(snapshot["duid"], "DUT-1")
+        self.assertEqual(snapshot["frames_out"], 11)
+        self.assertEqual(snapshot["frames_in"], 11)
+        self.assertEqual(snapshot["bytes_out"], sum(len(b"command %d\n" % n) for n in range(10)) + 12)
+        self.assertEqual(snapshot["bytes_in"], snapshot["bytes_out"] + 4 * 11)
+        self.assertEqual(snapshot["latency"]["count"], 10)
+        self.assertGreater(snapshot["latency"]["p99"], 0)
+        self.assertEqual(snapshot["queues"]["inbound"]["size"], 0)
+        self.assertIn(thread.metrics, metrics.all_metrics())
+
+    def test_prometheus(self):
+        socket_metrics = SocketMetrics("uid\"1", "DUT")
+        socket_metrics.bytes_in = 10
+        socket_metrics.record_latency(0.003)
+        text = metrics.to_prometheus([socket_metrics])
+        self.assertIn('dtaf_socket_bytes_received_total{uid="uid\\"1",duid="DUT"} 10', text)
+        self.assertIn('dtaf_socket_round_trip_seconds_bucket{uid="uid\\"1",duid="DUT",le="0.0025"} 0', text)
+        self.assertIn('dtaf_socket_round_trip_seconds_bucket{uid="uid\\"1",duid="DUT",le="0.005"} 1', text)
+        self.assertIn('dtaf_socket_round_trip_seconds_count{uid="uid\\"1",duid="DUT"} 1', text)
+        self.assertIn("# TYPE dtaf_socket_round_trip_seconds histogram", text)
+        with tempfile.TemporaryDirectory() as directory:
+            path = metrics.write_prometheus(pathlib.Path(directory) / "dtaf.prom", [socket_metrics])
+            self.assertEqual(path.read_text(), text)
+            self.assertEqual(len(list(pathlib.Path(directory).iterdir())), 1)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# General Imports.
+import queue
+import socket
+import tempfile
+import time
+import unittest
+import pytest
+
+# imports DTAF
+import DTAF
+from DTAF.server.queues import BoundedQueue
+from DTAF.server.sockets import SocketThread
+
+
+def drain(bounded: BoundedQueue) -> list:
+    items = []
+    while bounded.empty() is False:
+        items.append(bounded.get_nowait())
+    return items
+
+
+@pytest.mark.server_socket_queues
+class TestBoundedQueue(unittest.TestCase):
+
+    def test_block(self):
+        bounded = BoundedQueue(2, "block")
+        self.assertTrue(bounded.put(1))
+        self.assertTrue(bounded.put(2))
+        with self.assertRaises(queue.Full):
+            bounded.put(3, timeout=0.01)
+        self.assertEqual(drain(bounded), [1, 2])
+
+    def test_drop_policies(self):
+        newest = BoundedQueue(3, "drop-newest")
+        oldest = BoundedQueue(3, "drop-oldest")
+        for item in range(10):
+            newest.put(item)
+            oldest.put(item)
+        self.assertEqual(drain(newest), [0, 1, 2])
+        self.assertEqual(drain(oldest), [7, 8, 9])
+        self.assertEqual(newest.stats()["dropped"], 7)
+        self.assertEqual(oldest.stats()["high_water_mark"], 3)
+        # task accounting is kept, join doesn't hang.
+        for _ in range(3):
+            oldest.task_done()
+        oldest.join()
+
+    def test_spill(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            bounded = BoundedQueue(4, "spill", spill_dir=spill_dir)
+            for item in range(10):
+                bounded.put((item, b"payload %d" % item))
+            stats = bounded.stats()
+            self.assertEqual(stats["size"], 10)
+            self.assertEqual(stats["spilled_size"], 6)
+            self.assertEqual(len(bounded.queue), 4)
+            self.assertEqual(bounded.get_nowait(), (0, b"payload 0"))
+            # new items go after the spilled ones.
+            bounded.put((10, b"payload 10"))
+            self.assertEqual([item[0] for item in drain(bounded)], list(range(1, 11)))
+            self.assertEqual(bounded.stats()["spilled_size"], 0)
+            self.assertEqual(bounded.stats()["high_water_mark"], 10)
+            bounded.close()
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            BoundedQueue(1, "unknown")
+        self.assertEqual(BoundedQueue(1, "drop").policy, "drop-newest")
+
+
+@pytest.mark.server_socket_queues
+class TestSocketThreadQueues(unittest.TestCase):
+
+    def test_no_empty_reads(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        thread = SocketThread(host="127.0.0.1",
+                              port=server.getsockname()[1],
+                              uid="queues",
+                              duid="queues",
+                              timeout=0.01,
+                              max_inbound=5)
+        thread.daemon = True
+        thread.start()
+        conn, _ = server.accept()
+        with server, conn:
+            conn.sendall(b"".join(b"line %d\n" % n for n in range(20)))
+            # lets the reactor time out a few times.
+            time.sleep(0.3)
+            self.assertEqual(thread.read(timeout=0.1), b"line 15\n")
+            stats = thread.queue_stats()["inbound"]
+            self.assertEqual(stats["high_water_mark"], 5)
+            self.assertEqual(stats["dropped"], 15)
+            self.assertEqual([thread.read(timeout=0.1) for _ in range(5)],
+                             [b"line 16\n", b"line 17\n", b"line 18\n", b"line 19\n", b""])
+            thread.stop_reactor()
+            thread.join(5)
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# General Imports.
+import unittest
+import pytest
+import socket
+import threading
+import time
+
+# imports DTAF
+import DTAF
+from DTAF.server.reactor import IOV_MAX, SocketReactor, get_reactor
+from DTAF.server.sockets import ReactorSocketThread, SocketThread
+
+
+class EchoServer():
+    """
+    Minimal echo server, accepts any number of clients and echoes back each
+    chunk received.
+    """
+
+    def __init__(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(64)
+        self.port = self.server.getsockname()[1]
+        self.clients: list[socket.socket] = []
+        self.thread = threading.Thread(target=self.accept, daemon=True)
+        self.thread.start()
+
+    def accept(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            self.clients.append(conn)
+            threading.Thread(target=self.echo, args=(conn, ), daemon=True).start()
+
+    @staticmethod
+    def echo(conn: socket.socket):
+        with conn:
+            while (data := conn.recv(4096)):
+                conn.sendall(data)
+
+    def close(self):
+        self.server.close()
+        for conn in self.clients:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+@pytest.mark.server_socket_reactor
+class TestSocketReactor(unittest.TestCase):
+
+    def setUp(self):
+        self.server = EchoServer()
+        self.reactor = SocketReactor(name="TestSocketReactor")
+        self.reactor.start()
+
+    def tearDown(self):
+        self.reactor.stop()
+        self.reactor.join(5)
+        self.server.close()
+
+    def new_thread(self, uid: int) -> ReactorSocketThread:
+        thread = ReactorSocketThread(host="127.0.0.1",
+                                     port=self.server.port,
+                                     uid=uid,
+                                     duid=0,
+                                     socket_reactor=self.reactor)
+        thread.start()
+        return thread
+
+    def test_is_socket_thread(self):
+        thread = self.new_thread(1)
+        self.assertIsInstance(thread, SocketThread)
+        self.assertTrue(thread.is_alive())
+        thread.stop_reactor()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(thread._closed)
+
+    def test_many_sockets_single_thread(self):
+        threads_before: int = threading.active_count()
+        sockets = [self.new_thread(uid) for uid in range(50)]
+        # the reactor doesn't spawn new threads per socket, only the echo server does.
+        self.assertLessEqual(threading.active_count() - threads_before, 50)
+        for uid, thread in enumerate(sockets):
+            thread.write(f"message {uid}\n".encode())
+        for uid, thread in enumerate(sockets):
+            self.assertEqual(thread.read(timeout=5), f"message {uid}\n".encode())
+        self.assertEqual(len(self.reactor), 50)
+        for thread in sockets:
+            thread.stop_reactor()
+        for thread in sockets:
+            thread.join(5)
+        self.assertEqual(len(self.reactor), 0)
+
+    def test_partial_messages(self):
+        thread = self.new_thread(1)
+        thread.write(b"first line\nsecond ")
+        thread.write(b"line\n")
+        self.assertEqual(thread.read(timeout=5), b"first line\n")
+        self.assertEqual(thread.read(timeout=5), b"second line\n")
+        thread.stop_reactor()
+        thread.join(5)
+
+    def test_shared_pool(self):
+        self.assertIs(get_reactor(), get_reactor())
+        self.assertTrue(get_reactor().is_alive())
+
+    def test_burst_is_batched(self):
+        thread = self.new_thread(1)
+        for index in range(1000):
+            thread.write(f"command {index}\n".encode())
+        for index in range(1000):
+            self.assertEqual(thread.read(timeout=5), f"command {index}\n".encode())
+        thread.stop_reactor()
+        thread.join(5)
+
+
+@pytest.mark.server_socket_reactor
+class TestOutboundBatch(unittest.TestCase):
+
+    def test_pop_outbound_batch(self):
+        thread = SocketThread(uid="batch", duid="batch", max_batch_size=3, max_batch_bytes=8)
+        for msg in (b"aa", b"", b"bb", b"cc", b"dd"):
+            thread.write(msg)
+        # empty messages are skipped and the batch is limited by size.
+        self.assertEqual(thread._pop_outbound_batch(), [b"aa", b"bb", b"cc"])
+        self.assertEqual(thread._pop_outbound_batch(), [b"dd"])
+        self.assertEqual(thread._pop_outbound_batch(), [])
+        thread.write(b"0123456789")
+        thread.write(b"x")
+        # byte limit reached by the first message.
+        self.assertEqual(thread._pop_outbound_batch(), [b"0123456789"])
+
+    def test_send_batch(self):
+        local, remote = socket.socketpair()
+        thread = SocketThread(uid="batch", duid="batch")
+        with local, remote:
+            thread._send_batch(local, [b"one\n", b"two\n", b"three\n"])
+            remote.settimeout(1)
+            data = b""
+            while len(data) < 14:
+                data += remote.recv(64)
+            self.assertEqual(data, b"one\ntwo\nthree\n")
+
+    def test_batch_size_limit(self):
+        # bigger iovecs make sendmsg fail with EMSGSIZE.
+        self.assertEqual(SocketThread(uid="batch", duid="batch", max_batch_size=IOV_MAX * 4).max_batch_size, IOV_MAX)
+        self.assertEqual(SocketThread(uid="batch", duid="batch", max_batch_size=0).max_batch_size, 1)
+
+    def test_burst_to_silent_peer(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        thread = SocketThread(host="127.0.0.1", port=server.getsockname()[1], uid="burst", duid="burst", timeout=1)
+        thread.daemon = True
+        with server:
+            thread.start()
+            conn, _ = server.accept()
+            with conn:
+                conn.settimeout(5)
+                expected = b"".join(f"command {index}\n".encode() for index in range(1000))
+                start = time.monotonic()
+                for index in range(1000):
+                    thread.write(f"command {index}\n".encode())
+                data = b""
+                while len(data) < len(expected):
+                    data += conn.recv(1 << 16)
+                # the peer never answers, the whole queue goes out before the first read times out.
+                self.assertLess(time.monotonic() - start, 3)
+                self.assertEqual(data, expected)
+                thread.stop_reactor()
+                thread.join(5)
+
+    def test_advance_buffers(self):
+        buffers = SocketThread._advance_buffers([b"abc", b"de", b"fgh"], 4)
+        self.assertEqual([bytes(n) for n in buffers], [b"e", b"fgh"])
+        self.assertEqual(SocketThread._advance_buffers([b"abc"], 3), [])
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# General Imports.
+import socket
+import threading
+import time
+import unittest
+import pytest
+
+# imports DTAF
+import DTAF
+from DTAF.server import SocketServer
+from DTAF.server.sockets import ReactorSocketThread, SocketThread
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class StateRecorder():
+    """
+    Keeps the states reported by a socket thread.
+    """
+
+    def __init__(self):
+        self.states: list[str] = []
+        self.condition = threading.Condition()
+
+    def __call__(self, state: str, error: Exception = None):
+        with self.condition:
+            self.states.append(state)
+            self.condition.notify_all()
+
+    def wait_for(self, state: str, count: int = 1, timeout: float = 5) -> bool:
+        with self.condition:
+            return self.condition.wait_for(lambda: self.states.count(state) >= count, timeout)
+
+
+@pytest.mark.server_socket_reconnect
+class TestReconnect(unittest.TestCase):
+
+    def setUp(self):
+        self.port = free_port()
+        self.server = self.new_server()
+
+    def tearDown(self):
+        self.server.stop()
+        self.server.join(5)
+
+    def new_server(self) -> SocketServer:
+        server = SocketServer(host="127.0.0.1", port=self.port, message_manager=lambda client, frame: frame)
+        server.start()
+        return server
+
+    def check_supervised(self, thread: SocketThread, recorder: StateRecorder):
+        self.assertTrue(recorder.wait_for("connected"))
+        thread.write(b"before\n")
+        self.assertEqual(thread.read(timeout=5), b"before\n")
+        # the link goes down.
+        self.server.stop()
+        self.server.join(5)
+        self.assertTrue(recorder.wait_for("reconnecting"))
+        thread.write(b"while down\n")
+        self.server = self.new_server()
+        self.assertTrue(recorder.wait_for("connected", 2))
+        # the message queued while disconnected is delivered.
+        self.assertEqual(thread.read(timeout=5), b"while down\n")
+        self.assertGreaterEqual(thread.reconnects, 1)
+        thread.stop_reactor()
+        thread.join(5)
+        self.assertTrue(recorder.wait_for("closed"))
+
+    def test_socket_thread(self):
+        recorder = StateRecorder()
+        thread = SocketThread(host="127.0.0.1",
+                              port=self.port,
+                              uid="reconnect",
+                              duid="reconnect",
+                              timeout=0.05,
+                              auto_reconnect=True,
+                              reconnect_delay=0.05,
+                              state_callbacks=[recorder])
+        thread.daemon = True
+        thread.start()
+        self.check_supervised(thread, recorder)
+
+    def test_reactor_socket_thread(self):
+        recorder = StateRecorder()
+        thread = ReactorSocketThread(host="127.0.0.1",
+                                     port=self.port,
+                                     uid="reconnect",
+                                     duid="reconnect",
+                                     auto_reconnect=True,
+                                     reconnect_delay=0.05,
+                                     state_callbacks=[recorder])
+        thread.start()
+        self.check_supervised(thread, recorder)
+
+    def test_give_up(self):
+        recorder = StateRecorder()
+        thread = SocketThread(host="127.0.0.1",
+                              port=free_port(),
+                              uid="reconnect",
+                              duid="reconnect",
+                              auto_reconnect=True,
+                              reconnect_delay=0.01,
+                              max_reconnect_attempts=2,
+                              state_callbacks=[recorder])
+        thread.daemon = True
+        thread.start()
+        thread.join(5)
+        self.assertTrue(recorder.wait_for("closed"))
+        self.assertEqual(recorder.states.count("reconnecting"), 2)
+        self.assertEqual(thread.reconnects, 2)
+
+
+@pytest.mark.server_socket_reconnect
+class TestBackoff(unittest.TestCase):
+
+    def test_backoff(self):
+        thread = SocketThread(uid="backoff", duid="backoff", reconnect_delay=0.5, reconnect_max_delay=4,
+                              reconnect_jitter=0)
+        self.assertEqual([thread.reconnect_delay_for(n) for n in range(6)], [0.5, 1, 2, 4, 4, 4])
+        thread = SocketThread(uid="backoff", duid="backoff", reconnect_delay=1, reconnect_jitter=0.5)
+        for attempt in range(100):
+            self.assertTrue(1 <= thread.reconnect_delay_for(1) <= 3)
+
+    def test_outbound_policy(self):
+        thread = SocketThread(uid="policy", duid="policy", max_outbound=2, outbound_policy="drop")
+        self.assertEqual(thread.write(b"one\n"), 4)
+        self.assertEqual(thread.write(b"two\n"), 4)
+        self.assertEqual(thread.write(b"three\n"), 0)
+        with self.assertRaises(TimeoutError):
+            thread.write(b"three\n", expect=b"ACK").result(0)
+        thread = SocketThread(uid="policy", duid="policy", max_outbound=1, write_timeout=0.01)
+        thread.write(b"one\n")
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            thread.write(b"two\n")
+        self.assertGreaterEqual(time.monotonic() - start, 0.01)
+        with self.assertRaises(ValueError):
+            SocketThread(uid="policy", duid="policy", outbound_policy="unknown")
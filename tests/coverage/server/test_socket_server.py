@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# General Imports.
+import socket
+import struct
+import threading
+import unittest
+import pytest
+
+# imports DTAF
+import DTAF
+from DTAF.server import SocketServer
+from DTAF.server.sockets import SocketThread
+
+
+def connect(port: int) -> socket.socket:
+    client = socket.create_connection(("127.0.0.1", port), timeout=5)
+    return client
+
+
+def read_line(client: socket.socket) -> bytes:
+    data: bytes = b""
+    while not data.endswith(b"\n"):
+        chunk = client.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+@pytest.mark.server_socket_server
+class TestSocketServer(unittest.TestCase):
+
+    def test_virtual_duts(self):
+        # each client is a virtual DUT answering with its own counter.
+        def manager(client, frame):
+            client.data["count"] = client.data.get("count", 0) + 1
+            return b"%d:%d:" % (client.uid, client.data["count"]) + frame
+
+        with SocketServer(host="127.0.0.1", port=0, message_manager=manager,
+                          on_connect=lambda client: b"READY\n") as server:
+            port = server.address[1]
+            clients = [connect(port) for _ in range(200)]
+            for client in clients:
+                self.assertEqual(read_line(client), b"READY\n")
+            for index, client in enumerate(clients):
+                client.sendall(b"first %d\nsecond %d\n" % (index, index))
+            for index, client in enumerate(clients):
+                data = b""
+                while data.count(b"\n") < 2:
+                    data += client.recv(4096)
+                first, second = data.splitlines()
+                self.assertTrue(first.endswith(b":1:first %d" % index))
+                self.assertTrue(second.endswith(b":2:second %d" % index))
+            self.assertEqual(len(server), 200)
+            for client in clients:
+                client.close()
+
+    def test_queue_send_and_broadcast(self):
+        disconnected = threading.Event()
+        with SocketServer(host="127.0.0.1", port=0,
+                          on_disconnect=lambda client, error: disconnected.set()) as server:
+            first, second = connect(server.address[1]), connect(server.address[1])
+            first.sendall(b"hello\npartial")
+            client, frame = server.read(timeout=5)
+            self.assertEqual(frame, b"hello\n")
+            self.assertIsNone(server.read(timeout=0.1))
+            server.send(client.uid, b"only you\n")
+            self.assertEqual(read_line(first), b"only you\n")
+            self.assertEqual(server.broadcast(b"everyone\n"), 2)
+            self.assertEqual(read_line(first), b"everyone\n")
+            self.assertEqual(read_line(second), b"everyone\n")
+            with self.assertRaises(KeyError):
+                server.send(-1, b"nobody\n")
+            second.close()
+            self.assertTrue(disconnected.wait(5))
+            first.close()
+        self.assertIsNone(server.listener)
+
+    def test_socket_thread_client(self):
+        with SocketServer(host="127.0.0.1", port=0, message_manager=lambda client, frame: b"ACK " + frame) as server:
+            thread = SocketThread(host="127.0.0.1", port=server.address[1], uid="server", duid="server", timeout=0.05)
+            thread.daemon = True
+            thread.start()
+            future = thread.write(b"command\n", expect=b"ACK", timeout=5)
+            self.assertEqual(future.result(5), b"ACK command\n")
+            thread.stop_reactor()
+            thread.join(5)
+
+    def test_length_framing(self):
+        with SocketServer(host="127.0.0.1", port=0, framing="length", length_format="!H",
+                          message_manager=lambda client, frame: struct.pack("!H", len(frame)) + frame[::-1]) as server:
+            client = connect(server.address[1])
+            client.sendall(struct.pack("!H", 3) + b"abc")
+            self.assertEqual(client.recv(16), struct.pack("!H", 3) + b"cba")
+            client.close()
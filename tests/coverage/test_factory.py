@@ -16,6 +16,7 @@ Logger.setLevel("DEBUG")
 from DTAF.interfaces.interfaces import InterfaceBase
 from DTAF.devices.device import DeviceBase
 import DTAF.factory
+import sys
 
 # Defines the test pattern for coverage.
 data: dict = {
@@ -25,6 +26,8 @@ data: dict = {
         "unregister",
         "update_definition",
         "verify_class",
+        "is_loaded",
+        "split_path",
     ],
 }
 
@@ -141,3 +144,56 @@ class TestFactory(unittest.TestCase):
         # Removes registry.
         Factory.unregister(DummyDevice_)
         Factory.unregister(DummyInterface_)
+
+
+class LazyInterface(InterfaceBase):
+    """
+    Interface registered by path.
+    """
+    pass
+
+
+@pytest.mark.factory_lazy
+class TestFactoryLazy(unittest.TestCase):
+
+    def tearDown(self):
+        for name in ("LazyDummy", "LazyMissing", "LazyWrong"):
+            if name in DTAF.factory.Factory.classnames:
+                DTAF.factory.Factory.unregister(name)
+
+    def test_lazy_registry(self):
+        Factory = DTAF.factory.Factory
+        # nothing is imported until the class is requested.
+        Factory.register("LazyDummy", "test_factory:LazyInterface")
+        self.assertIn("LazyDummy", Factory.classnames)
+        self.assertFalse(Factory.is_loaded("LazyDummy"))
+        self.assertEqual(Factory.get_name_by_class(sys.modules["test_factory"].LazyInterface), "LazyDummy")
+        self.assertIs(Factory.get_class_by_name("LazyDummy"), sys.modules["test_factory"].LazyInterface)
+        self.assertTrue(Factory.is_loaded("LazyDummy"))
+        with self.assertRaises(ValueError):
+            Factory.register("LazyDummy", "test_factory.LazyInterface")
+        # missing backends fail when requested, not when registered.
+        Factory.register("LazyMissing", "dtaf_missing_backend.Interface")
+        with self.assertRaises(ImportError):
+            Factory.get_class_by_name("LazyMissing")
+        self.assertFalse(Factory.is_loaded("LazyMissing"))
+        Factory.register("LazyWrong", "inspect.Signature")
+        with self.assertRaises(ImportError):
+            Factory.LazyWrong
+        with self.assertRaises(ValueError):
+            Factory.register("LazyInvalid", "NoModule")
+
+    def test_builtin_interfaces_are_lazy(self):
+        self.assertIn("SerialInterface", DTAF.factory.Factory.classnames)
+        self.assertEqual(DTAF.factory._Factory.split_path("DTAF.interfaces.base:SerialInterface"),
+                         ("DTAF.interfaces.base", "SerialInterface"))
+        self.assertEqual(DTAF.factory._Factory.split_path("a.b.C"), ("a.b", "C"))
+
+    def test_builtin_name_by_class(self):
+        from DTAF.interfaces.base import TelnetInterface
+        Factory = DTAF.factory.Factory
+        # importing the class doesn't load the registry, it's matched by path.
+        self.assertEqual(Factory.get_name_by_class(TelnetInterface), "TelnetInterface")
+        self.assertEqual(Factory.get_name_by_class(LazyInterface, None), None)
+        with self.assertRaises(ValueError):
+            Factory.get_name_by_class(LazyInterface)
@@ -11,6 +11,10 @@ import DTAF.config.logger_config
 from DTAF.config import Config
 from DTAF.logger import *
 import weakref
+import pathlib
+import queue
+import tempfile
+import gzip
 
 data: dict = {
     "logger": [
@@ -146,3 +150,207 @@ class TestLogger(unittest.TestCase):
 # log2=create_logger("log2","DEBUG")
 # add_handler(log,"Terminal", '%(levelname)s - %(name)s - %(asctime) -8s - %(message)s')
 # print(global_logger_list)
+
+
+@pytest.mark.logger_test
+class TestHotPathLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logging.getLogger("hot_path_test")
+        self.log.setLevel(logging.INFO)
+        self.hot = hot_path_logger("tests.hot_path", self.log)
+
+    def tearDown(self):
+        enable_hot_path_logging("*")
+
+    def test_level_changes(self):
+        self.assertTrue(self.hot.info)
+        self.assertFalse(self.hot.debug)
+        # the level changes done by DTAF refresh the cached flags.
+        set_level(self.log, logging.DEBUG)
+        self.assertTrue(self.hot.debug)
+        self.assertFalse(self.hot.trace)
+        set_level("hot_path_test", 9)
+        self.assertTrue(self.hot.trace)
+        # the ones done outside DTAF are applied on request.
+        logging.disable(logging.CRITICAL)
+        try:
+            self.assertTrue(self.hot.info)
+            refresh_hot_path_loggers()
+            self.assertFalse(self.hot.info)
+        finally:
+            logging.disable(logging.NOTSET)
+            refresh_hot_path_loggers()
+        self.assertTrue(self.hot.info)
+        # adapters are unwrapped.
+        adapter = logging.LoggerAdapter(self.log, {})
+        self.assertTrue(hot_path_logger("tests.adapter", adapter).trace)
+
+    def test_compiled_out(self):
+        set_level(self.log, logging.DEBUG)
+        disable_hot_path_logging("tests.hot_path")
+        self.assertFalse(self.hot.debug)
+        self.assertFalse(self.hot.info)
+        self.assertTrue(hot_path_logger("tests.other", self.log).debug)
+        enable_hot_path_logging("tests.hot_path")
+        self.assertTrue(self.hot.debug)
+        disable_hot_path_logging()
+        self.assertFalse(hot_path_logger("tests.other", self.log).debug)
+
+    def test_payload(self):
+        self.assertEqual(summarize_payload(b"OK\r\n"), "b'OK\\r\\n'")
+        self.assertEqual(summarize_payload(b"\x00\x01\xff"), "hex:00 01 ff")
+        self.assertEqual(summarize_payload(b"a" * 100, 4), "b'aaaa'... (100 bytes)")
+        self.assertEqual(summarize_payload(memoryview(b"\x02" * 10), 2), "hex:02 02... (10 bytes)")
+        self.assertEqual(summarize_payload({"command": "x" * 10}, 8), "{'comman... (25 chars)")
+        # only summarized when the record is emitted.
+        payload = Payload(b"data")
+        payload.data = b"changed"
+        self.assertEqual(str(payload), "b'changed'")
+        self.assertEqual("%s" % Payload(b"\x00" * 100, 1), "hex:00... (100 bytes)")
+
+
+@pytest.mark.logger_test
+class TestAsyncLogging(unittest.TestCase):
+
+    def test_writer(self):
+        with tempfile.TemporaryDirectory() as directory:
+            system = logging.getLogger("async_test_system")
+            device = logging.getLogger("async_test_device")
+            handlers = {}
+            for log in (system, device):
+                log.setLevel(logging.DEBUG)
+                log.propagate = False
+                handlers[log.name] = BatchFileHandler(pathlib.Path(directory) / f"{log.name}.log", mode="w")
+                handlers[log.name].setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+                log.addHandler(handlers[log.name])
+            writer = start_async_logging([system, device], queue_size=100, batch_size=8)
+            try:
+                self.assertIsInstance(system.handlers[0], LogQueueHandler)
+                self.assertEqual(writer.routes["async_test_device"], (handlers["async_test_device"],))
+                self.assertTrue(handlers["async_test_system"].batched)
+                for n in range(50):
+                    system.debug("system %d", n)
+                    device.info("device %s", n)
+            finally:
+                stop_async_logging()
+            # handlers are given back once the pending records are written.
+            self.assertEqual(system.handlers, [handlers["async_test_system"]])
+            self.assertFalse(handlers["async_test_system"].batched)
+            lines = (pathlib.Path(directory) / "async_test_system.log").read_text().splitlines()
+            self.assertEqual(lines, [f"DEBUG system {n}" for n in range(50)])
+            lines = (pathlib.Path(directory) / "async_test_device.log").read_text().splitlines()
+            self.assertEqual(lines, [f"INFO device {n}" for n in range(50)])
+            for handler in handlers.values():
+                handler.close()
+
+    def test_bounded_queue(self):
+        log_queue = queue.Queue(2)
+        handler = LogQueueHandler(log_queue, "bounded")
+        log = logging.getLogger("async_test_bounded")
+        log.propagate = False
+        log.addHandler(handler)
+        for n in range(5):
+            log.warning("record %d", n)
+        self.assertEqual(handler.dropped, 3)
+        record = log_queue.get_nowait()
+        self.assertEqual((record.getMessage(), record.log_route), ("record 0", "bounded"))
+        # the caller doesn't format the record, the writer does.
+        self.assertEqual((record.msg, record.args), ("record %d", (0, )))
+        log_queue.get_nowait()
+        buffer = bytearray(b"rx data")
+        log.warning("received %s", Payload(buffer))
+        buffer[:] = b"reused"
+        record = log_queue.get_nowait()
+        self.assertEqual(record.getMessage(), "received b'rx data'")
+        self.assertIs(record.payload, record.args[0])
+        log.removeHandler(handler)
+
+
+@pytest.mark.logger_test
+class TestLogRotation(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name)
+        self.log = logging.getLogger("rotation_test")
+        self.log.setLevel(logging.INFO)
+        self.log.propagate = False
+
+    def tearDown(self):
+        for handler in list(self.log.handlers):
+            self.log.removeHandler(handler)
+            handler.close()
+        self.directory.cleanup()
+
+    def wait_archives(self):
+        get_archive_executor().submit(lambda: None).result(5)
+
+    def test_file_id(self):
+        template = "{name} - {std_date} - {id}.log"
+        self.assertEqual(next_file_id(self.path, template, "rotation_test"), 0)
+        for name in ("rotation_test - 2024-01-01 00-00-00 - 3.log", "rotation_test - x - 7.log.gz",
+                     "other - x - 9.log"):
+            (self.path / name).touch()
+        self.assertEqual(next_file_id(self.path, template, "rotation_test"), 8)
+        filename = format_filename(filename="{name} - {id}.log", name="rotation_test", log_dir=self.path)
+        self.assertEqual(filename, "rotation_test - 0.log")
+        self.assertEqual(format_filename(filename="{name} - {id}.log", name="rotation_test", id=4),
+                         "rotation_test - 4.log")
+
+    def test_size_rotation(self):
+        handler = RotatingLogHandler(self.path,
+                                     "{name} - {id}.log",
+                                     "rotation_test",
+                                     max_bytes=200,
+                                     compression="gzip",
+                                     max_files=3)
+        self.log.addHandler(handler)
+        for n in range(100):
+            self.log.info("record %03d %s", n, "x" * 20)
+        self.wait_archives()
+        names = sorted(entry.name for entry in self.path.iterdir())
+        # the current segment plus the 2 newest archives.
+        self.assertEqual(len(names), 3)
+        self.assertIn(pathlib.Path(handler.baseFilename).name, names)
+        archives = [self.path / name for name in names if name.endswith(".gz")]
+        self.assertEqual(len(archives), 2)
+        with gzip.open(archives[-1], "rt") as archive:
+            self.assertTrue(archive.read().startswith("record "))
+        self.assertLess(pathlib.Path(handler.baseFilename).stat().st_size, 250)
+        handler.flush()
+        self.assertTrue(pathlib.Path(handler.baseFilename).read_text().strip().endswith("record 099 " + "x" * 20))
+
+    def test_time_rotation(self):
+        handler = RotatingLogHandler(self.path, "{name}.log", "rotation_test", interval=60, compression="")
+        self.log.addHandler(handler)
+        self.log.info("first")
+        handler.rollover_at = 0
+        self.log.info("second")
+        self.wait_archives()
+        self.assertEqual(sorted(entry.name for entry in self.path.iterdir()),
+                         ["rotation_test.0.log", "rotation_test.1.log"])
+        self.assertEqual((self.path / "rotation_test.0.log").read_text(), "first\n")
+        with self.assertRaises(ValueError):
+            RotatingLogHandler(self.path, "{name}.log", "rotation_test", compression="zip")
+
+    def test_template_without_name(self):
+        other = logging.getLogger("rotation_other")
+        other.propagate = False
+        handlers = []
+        for log in (self.log, other):
+            with self.assertLogs(Logger, "WARNING"):
+                handler = RotatingLogHandler(self.path, "run.log", log.name, max_bytes=1, max_files=2)
+            log.addHandler(handler)
+            handlers.append(handler)
+        try:
+            for n in range(5):
+                self.log.info("record %d", n)
+            other.info("other")
+            self.wait_archives()
+            # each logger numbers and retains its own segments only.
+            self.assertEqual(sorted(entry.name for entry in self.path.iterdir()),
+                             ["run.rotation_other.0.log", "run.rotation_test.3.log", "run.rotation_test.4.log"])
+        finally:
+            other.removeHandler(handlers[1])
+            handlers[1].close()
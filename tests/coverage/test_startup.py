@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# General Imports.
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import unittest
+import pytest
+
+# imports DTAF
+import DTAF
+from DTAF import startup
+
+source: pathlib.Path = pathlib.Path(DTAF.__file__).resolve().parents[1]
+
+
+def run_python(code: str, home: str, **environment) -> subprocess.CompletedProcess:
+    env: dict = dict(os.environ, HOME=home, USERPROFILE=home, **environment)
+    env["PYTHONPATH"] = os.pathsep.join([str(source)] + [path for path in sys.path if path])
+    return subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, timeout=120)
+
+
+@pytest.mark.startup
+class TestStartup(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.home = pathlib.Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_deferred_init(self):
+        code: str = "\n".join((
+            "import pathlib, DTAF",
+            "home = pathlib.Path.home()",
+            "print(DTAF.initialized, (home / 'TAF').exists(), DTAF.logger.SystemLogger.handlers)",
+            "DTAF.logger.SystemLogger.warning('first record')",
+            "print(DTAF.initialized, (home / 'TAF' / 'DTAF-Startup log.txt').exists())",
+        ))
+        result = run_python(code, str(self.home))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        before, after = result.stdout.splitlines()[-2:]
+        self.assertEqual(before, "False False [<DeferredInitHandler (NOTSET)>]")
+        self.assertEqual(after, "True True")
+        # the first record reaches the file opened by the initialization.
+        logs = list((self.home / "TAF").rglob("DTAF_System*.log"))
+        self.assertEqual(len(logs), 1)
+        self.assertIn("first record", logs[0].read_text())
+        self.assertIn("[Logger]", next(self.home.rglob("config.toml")).read_text())
+
+    def test_profile(self):
+        report: pathlib.Path = self.home / "startup.json"
+        result = run_python("import DTAF; DTAF.init(); DTAF.init()", str(self.home), DTAF_PROFILE_STARTUP=str(report))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        records: list[dict] = json.loads(report.read_text())
+        names: dict = {(record["kind"], record["name"]): record for record in records}
+        for key in (("import", "DTAF"), ("import", "DTAF.logger"), ("init", "DTAF.init"), ("init", "logger")):
+            self.assertIn(key, names)
+        self.assertEqual(names[("import", "DTAF")]["depth"], 0)
+        self.assertGreater(names[("import", "DTAF.logger")]["depth"], 0)
+        self.assertEqual(sum(1 for record in records if record["name"] == "DTAF.init"), 1)
+        self.assertLessEqual(names[("import", "DTAF")]["self_duration"], names[("import", "DTAF")]["duration"])
+
+    def test_timer(self):
+        enabled, records = startup.enabled, startup.records
+        startup.enabled, startup.records = True, []
+        try:
+            with startup.timer("outer"):
+                with startup.timer("inner"):
+                    pass
+            inner, outer = startup.records
+        finally:
+            startup.enabled, startup.records = enabled, records
+        self.assertEqual((inner.name, inner.depth, outer.depth), ("inner", 1, 0))
+        self.assertAlmostEqual(outer.self_duration, outer.duration - inner.duration)
+        with startup.timer("disabled") as record:
+            self.assertIsNone(record)
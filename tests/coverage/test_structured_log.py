@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# General Imports.
+import importlib.util
+import io
+import json
+import logging
+import pathlib
+import tempfile
+import unittest
+import pytest
+
+# imports DTAF
+import DTAF
+from DTAF.logger import Payload, start_async_logging, stop_async_logging
+from DTAF.structured_log import StructuredLogHandler, StructuredLogReader
+
+
+def load_cli():
+    path = pathlib.Path(__file__).resolve().parents[2] / "cli" / "dtaf_log.py"
+    spec = importlib.util.spec_from_file_location("dtaf_log", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeInterface():
+    pass
+
+
+@pytest.mark.structured_log
+class TestStructuredLog(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name) / "run.dlog"
+        self.log = logging.getLogger("structured_log_test")
+        self.log.setLevel(logging.DEBUG)
+        self.log.propagate = False
+        self.handler = StructuredLogHandler(self.path)
+        self.log.addHandler(self.handler)
+        self.adapters = {
+            uid: logging.LoggerAdapter(self.log, {
+                "uid": uid,
+                "duid": "DUT-1" if uid != "3" else "DUT-2",
+                "interface_class": FakeInterface
+            }) for uid in ("1", "2", "3")
+        }
+
+    def tearDown(self):
+        self.log.removeHandler(self.handler)
+        self.handler.close()
+        self.directory.cleanup()
+
+    def write_records(self):
+        for n in range(30):
+            adapter = self.adapters[str(n % 3 + 1)]
+            adapter.debug("write :: %s", Payload(b"cmd %d\n" % n, direction="tx"))
+            adapter.debug("read :: %s", Payload(b"\x00ack %d\n" % n, direction="rx"))
+        self.adapters["1"].warning("plain message")
+        self.handler.flush()
+
+    def test_query(self):
+        self.write_records()
+        with StructuredLogReader(self.path) as reader:
+            self.assertEqual(len(reader), 61)
+            entries = list(reader.query(uid="1", direction="tx"))
+            self.assertEqual([entry.payload for entry in entries], [b"cmd %d\n" % n for n in range(0, 30, 3)])
+            self.assertEqual(entries[0].interface_class, "FakeInterface")
+            self.assertEqual(entries[0].message, "write :: b'cmd 0\\n'")
+            self.assertEqual(len(list(reader.query(duid="DUT-2"))), 20)
+            self.assertEqual(len(list(reader.query(interface="FakeInterface", level=logging.WARNING))), 1)
+            self.assertEqual(reader.stream(uid="2", direction="rx"), b"".join(b"\x00ack %d\n" % n
+                                                                                for n in range(1, 30, 3)))
+            # time range over the index.
+            middle = reader.timestamps[30]
+            self.assertTrue(all(entry.timestamp >= middle for entry in reader.query(start=middle)))
+            self.assertEqual(len(list(reader.query(start=middle))), len(reader) - reader.timestamps.index(middle))
+            self.assertEqual(list(reader.query(end=reader.timestamps[0] - 1)), [])
+            with self.assertRaises(ValueError):
+                list(reader.query(direction="sideways"))
+
+    def test_rebuild_index(self):
+        self.write_records()
+        # a killed run: the index is lost and the last record is truncated.
+        pathlib.Path(str(self.path) + ".idx").write_bytes(b"")
+        with open(self.path, "ab") as file:
+            file.write(b"\x00\x00\x01")
+        with StructuredLogReader(self.path) as reader:
+            self.assertEqual(len(reader), 61)
+            self.assertEqual(len(list(reader.query(uid="3"))), 20)
+        bad = pathlib.Path(self.directory.name) / "text.log"
+        bad.write_text("INFO - not structured\n")
+        with self.assertRaises(ValueError):
+            StructuredLogReader(bad)
+
+    def test_async_writer(self):
+        start_async_logging([self.log], queue_size=100, batch_size=10)
+        try:
+            data = bytearray(b"first\n")
+            self.adapters["1"].debug("write :: %s", Payload(data, direction="tx"))
+            # the buffer is reused before the writer runs.
+            data[:] = b"other\n"
+        finally:
+            stop_async_logging()
+        with StructuredLogReader(self.path) as reader:
+            self.assertEqual(reader.stream(direction="tx"), b"first\n")
+
+    def test_cli(self):
+        self.write_records()
+        cli = load_cli()
+        output = io.StringIO()
+        cli.main([str(self.path), "--uid", "1", "--direction", "tx", "--json", "--limit", "2"], output)
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([line["payload"] for line in lines], [b"cmd 0\n".hex(), b"cmd 3\n".hex()])
+        output = io.StringIO()
+        cli.main([str(self.path), "--duid", "DUT-2", "--count"], output)
+        self.assertEqual(output.getvalue().strip(), "20")
+        stream = pathlib.Path(self.directory.name) / "rx.bin"
+        cli.main([str(self.path), "--uid", "3", "--direction", "rx", "--stream", str(stream)])
+        self.assertEqual(stream.read_bytes(), b"".join(b"\x00ack %d\n" % n for n in range(2, 30, 3)))
+        output = io.StringIO()
+        cli.main([str(self.path), "--level", "warning"], output)
+        self.assertIn("WARNING  DUT-1:1 FakeInterface -- | plain message", output.getvalue())